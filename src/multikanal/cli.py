@@ -30,7 +30,62 @@ def build_parser() -> argparse.ArgumentParser:
     sub.add_parser("health", help="Check daemon health")
 
     # stop subcommand
-    sub.add_parser("stop", help="Stop current audio playback")
+    sub.add_parser("stop", help="Stop current audio playback and clear the queue")
+
+    # playback control subcommands
+    sub.add_parser("skip", help="Skip the clip that is playing")
+    flush_p = sub.add_parser("flush", help="Drop queued audio (all, or by session/source)")
+    flush_p.add_argument("--session", default="", help="Only clips of this session id")
+    flush_p.add_argument("--source", default="", help="Only clips from this source")
+    sub.add_parser("pause", help="Pause playback (current clip restarts on resume)")
+    sub.add_parser("resume", help="Resume paused playback")
+    sub.add_parser("queue", help="Show the playback queue and tempo policy")
+
+    # warm subcommand
+    warm_p = sub.add_parser(
+        "warm", help="Pre-synthesize template and fixed phrases into the audio cache"
+    )
+    warm_p.add_argument(
+        "--phrases", type=str, default="", help="Extra phrases file (one per line)"
+    )
+    warm_p.add_argument(
+        "--cpu-budget",
+        type=float,
+        default=None,
+        help="Fraction of wall time spent synthesizing (default from config)",
+    )
+
+    # cache subcommand group
+    cache_p = sub.add_parser("cache", help="Inspect and maintain the audio cache")
+    cache_sub = cache_p.add_subparsers(dest="cache_command")
+    cache_sub.add_parser("stats", help="Entries, bytes, hit ratio, age histogram")
+    prune_p = cache_sub.add_parser("prune", help="Remove old or excess entries")
+    prune_p.add_argument(
+        "--max-bytes", type=str, default=None, help="Shrink cache to this size (e.g. 200M)"
+    )
+    prune_p.add_argument(
+        "--older-than", type=str, default=None, help="Drop entries unused for (e.g. 30d, 12h)"
+    )
+    cwarm_p = cache_sub.add_parser("warm", help="Pre-synthesize phrases from a file")
+    cwarm_p.add_argument("phrases_file", help="Phrases file (one per line)")
+    cwarm_p.add_argument(
+        "--cpu-budget",
+        type=float,
+        default=None,
+        help="Fraction of wall time spent synthesizing, shared by all workers (default from config)",
+    )
+    verify_p = cache_sub.add_parser("verify", help="Detect truncated or corrupt entries")
+    verify_p.add_argument(
+        "--delete", action="store_true", help="Remove broken entries"
+    )
+    export_p = cache_sub.add_parser("export", help="Write the cache to a tar.gz archive")
+    export_p.add_argument("archive", help="Output archive path")
+    import_p = cache_sub.add_parser("import", help="Load entries from an exported archive")
+    import_p.add_argument("archive", help="Archive created by 'cache export'")
+    for p in (cwarm_p, verify_p, import_p):
+        p.add_argument(
+            "--workers", type=int, default=4, help="Parallel worker threads (default 4)"
+        )
 
     # install-hooks subcommand
     sub.add_parser("install-hooks", help="Install Claude Code hooks for this project")
@@ -175,12 +230,275 @@ def cmd_stop(args):
 
     try:
         resp = httpx.post(f"http://127.0.0.1:{port}/stop", timeout=5)
-        print(resp.json().get("status", "unknown"))
+        data = resp.json()
+        print(f"{data.get('status', 'unknown')} ({data.get('flushed', 0)} queued clips dropped)")
     except httpx.ConnectError:
         print(f"Error: daemon not running on port {port}", file=sys.stderr)
         sys.exit(1)
 
 
+def cmd_playback(args):
+    """skip / flush / pause / resume / queue against the running daemon."""
+    if args.command == "queue":
+        data = _daemon_request("GET", "/playback")
+    elif args.command == "flush":
+        data = _daemon_request(
+            "POST", "/playback/flush", json={"session_id": args.session, "source": args.source}
+        )
+    else:
+        data = _daemon_request("POST", f"/playback/{args.command}")
+    if data is None:
+        print("Error: daemon not reachable", file=sys.stderr)
+        sys.exit(1)
+    if args.command == "queue":
+        state = "paused" if data.get("paused") else ("playing" if data.get("playing") else "idle")
+        print(f"State:    {state}")
+        print(
+            f"Queued:   {data.get('queued', 0)}/{data.get('maxsize', 0)}"
+            f" ({data.get('pending_seconds', 0)}s pending)"
+        )
+        print(f"Rate:     {data.get('current_rate', 1.0)}x (next {data.get('next_rate', 1.0)}x)")
+        print(
+            f"Totals:   played {data.get('played', 0)}, skipped {data.get('skipped', 0)},"
+            f" flushed {data.get('flushed', 0)}, dropped {data.get('dropped', 0)}"
+        )
+    elif args.command == "flush":
+        print(f"Flushed {data.get('flushed', 0)} clips")
+    else:
+        print(data.get("status", "unknown"))
+
+
+def cmd_warm(args):
+    """Warm the audio cache for every voice in use."""
+    from .config import load_config
+    from .tts.cache import AudioCache
+    from .tts.piper import PiperTTS
+    from .tts.segments import SegmentedSynthesizer
+    from .narration.template import TemplateNarrator
+    from .tts.warmup import CacheWarmer, warmup_phrases, warmup_voices
+
+    cfg = load_config()
+    warm_cfg = cfg.get("warmup", {})
+    seg_cfg = cfg.get("audio", {}).get("segments", {})
+
+    tts = PiperTTS.from_config(cfg.get("tts", {}))
+    cache = AudioCache.from_config(cfg.get("cache", {}))
+    segments = SegmentedSynthesizer(
+        tts, cache, sample_rate=seg_cfg.get("sample_rate", 24000)
+    )
+    warmer = CacheWarmer(
+        segments,
+        cpu_budget=args.cpu_budget or warm_cfg.get("cpu_budget", 0.25),
+        nice=warm_cfg.get("nice", 10),
+    )
+
+    # The templates the daemon's template provider speaks, including templates_file
+    templates: dict = {}
+    for p in cfg.get("narration", {}).get("providers") or []:
+        if isinstance(p, dict) and p.get("name") == "template" and p.get("enabled", True):
+            narrator = TemplateNarrator(templates_file=p.get("templates_file", ""))
+            templates = narrator.templates
+            narrator.close()
+    phrases = warmup_phrases(warm_cfg, args.phrases, templates=templates)
+    voices = warmup_voices(tts.registry, warm_cfg)
+    print(f"Warming {len(phrases)} phrases x {len(voices)} voices")
+
+    def progress(done, total):
+        print(f"\r  {done}/{total}", end="", flush=True)
+
+    try:
+        result = warmer.run(
+            phrases, voices, progress=progress, workers=getattr(args, "workers", 1)
+        )
+    except KeyboardInterrupt:
+        print("\nInterrupted")
+        sys.exit(130)
+    finally:
+        cache.close()
+    print(f"\nNew: {result['created']}  Skipped: {result['skipped']}  ({result['seconds']}s)")
+
+
+_SIZE_UNITS = {"k": 1024, "m": 1024**2, "g": 1024**3}
+_AGE_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 7 * 86400}
+
+
+def _parse_size(value: str) -> int:
+    value = value.strip().lower().rstrip("b")
+    if value and value[-1] in _SIZE_UNITS:
+        return int(float(value[:-1]) * _SIZE_UNITS[value[-1]])
+    return int(value)
+
+
+def _parse_age(value: str) -> float:
+    value = value.strip().lower()
+    if value and value[-1] in _AGE_UNITS:
+        return float(value[:-1]) * _AGE_UNITS[value[-1]]
+    return float(value)
+
+
+def _daemon_request(method: str, path: str, **kwargs):
+    """JSON from the running daemon, or None if it is not reachable.
+
+    An error response exits: the daemon is up, so callers must not fall
+    back to touching its state directly.
+    """
+    import httpx
+
+    from .config import load_config
+
+    port = load_config()["daemon"]["port"]
+    kwargs.setdefault("timeout", 30)
+    try:
+        resp = httpx.request(method, f"http://127.0.0.1:{port}{path}", **kwargs)
+        resp.raise_for_status()
+        return resp.json()
+    except httpx.HTTPStatusError as exc:
+        try:
+            detail = exc.response.json().get("detail", "")
+        except ValueError:
+            detail = exc.response.text
+        print(f"Error: daemon answered {exc.response.status_code}: {detail}", file=sys.stderr)
+        sys.exit(1)
+    except httpx.HTTPError:
+        return None
+
+
+def _local_cache():
+    from .config import load_config
+    from .tts.cache import AudioCache
+
+    return AudioCache.from_config(load_config().get("cache", {}))
+
+
+def _progress(label: str):
+    """Callback printing a ``label: done/total`` progress line."""
+
+    def report(done: int, total: int) -> None:
+        print(f"\r{label}: {done}/{total}", end="\n" if done == total else "", flush=True)
+
+    return report
+
+
+def _print_cache_stats(stats: dict, source: str):
+    mb = stats.get("bytes", 0) / 1024**2
+    print(f"Cache:    {stats.get('path', '?')} ({source})")
+    print(f"Entries:  {stats.get('entries', 0)}  ({mb:.1f} MB, codec {stats.get('codec')})")
+    by_codec = stats.get("by_codec") or {}
+    if by_codec:
+        print("Formats:  " + ", ".join(f"{k}={v}" for k, v in sorted(by_codec.items())))
+    if stats.get("hits", 0) + stats.get("misses", 0):
+        print(f"Hits:     {stats['hits']} / misses {stats['misses']} (ratio {stats['hit_ratio']})")
+    print(
+        f"Lifetime: {stats.get('lifetime_hits', 0)} hits"
+        f" (ratio {stats.get('lifetime_hit_ratio', 0.0)})"
+    )
+    ages = stats.get("age_histogram") or {}
+    if ages:
+        buckets = [f"<{k}: {v}" if k != "older" else f"older: {v}" for k, v in ages.items()]
+        print("Last use: " + "  ".join(buckets))
+
+
+def cmd_cache(args):
+    """Audio cache maintenance.
+
+    Everything but ``warm`` runs inside the daemon when it is up, so it
+    never races the daemon's own writes; otherwise on the local cache.
+    """
+    import os
+    import tarfile
+
+    from .tts.archive import export_archive, import_archive
+
+    action = args.cache_command
+    if action == "stats":
+        data = _daemon_request("GET", "/cache/stats")
+        if data is not None:
+            _print_cache_stats(data.get("audio", {}), "daemon")
+            narr = data.get("narration") or {}
+            if narr:
+                print(
+                    f"Narration tier: {narr.get('entries', 0)} entries,"
+                    f" hit ratio {narr.get('hit_ratio', 0.0)}"
+                )
+        else:
+            cache = _local_cache()
+            _print_cache_stats(cache.stats(), "local")
+            cache.close()
+
+    elif action == "prune":
+        if not args.max_bytes and not args.older_than:
+            print("Nothing to do: pass --max-bytes and/or --older-than", file=sys.stderr)
+            sys.exit(1)
+        body = {
+            "max_bytes": _parse_size(args.max_bytes) if args.max_bytes else None,
+            "older_than_seconds": _parse_age(args.older_than) if args.older_than else None,
+        }
+        result = _daemon_request("POST", "/cache/prune", json=body)
+        if result is None:
+            cache = _local_cache()
+            result = cache.prune(body["max_bytes"], body["older_than_seconds"])
+            cache.close()
+        freed_mb = result["bytes_freed"] / 1024**2
+        print(f"Removed {result['removed']} entries, freed {freed_mb:.1f} MB")
+        if result.get("deferred"):
+            print(f"{result['deferred']} entries queued for playback are removed once played")
+
+    elif action == "warm":
+        args.phrases = args.phrases_file
+        cmd_warm(args)
+
+    elif action == "verify":
+        body = {"delete": args.delete, "workers": args.workers}
+        result = _daemon_request("POST", "/cache/verify", json=body, timeout=None)
+        if result is None:
+            cache = _local_cache()
+            result = cache.verify_all(args.workers, args.delete, _progress("Verifying"))
+            cache.close()
+        for filename, problem in result["broken"]:
+            print(f"  {filename}: {problem}")
+        if result["deleted"]:
+            print(f"Deleted {result['deleted']} broken entries")
+        broken = len(result["broken"])
+        print(f"{result['checked'] - broken} ok, {broken} broken")
+        if broken and not args.delete:
+            sys.exit(1)
+
+    elif action == "export":
+        archive = os.path.abspath(args.archive)
+        result = _daemon_request(
+            "POST", "/cache/export", json={"archive": archive}, timeout=None
+        )
+        if result is None:
+            cache = _local_cache()
+            result = {"exported": export_archive(cache, archive)}
+            cache.close()
+        print(f"Exported {result['exported']} entries to {args.archive}")
+
+    elif action == "import":
+        archive = os.path.abspath(args.archive)
+        body = {"archive": archive, "workers": args.workers}
+        result = _daemon_request("POST", "/cache/import", json=body, timeout=None)
+        if result is None:
+            cache = _local_cache()
+            try:
+                result = import_archive(cache, archive, args.workers, _progress("Importing"))
+            except (OSError, ValueError, tarfile.TarError) as exc:
+                print(f"Error: {exc}", file=sys.stderr)
+                sys.exit(1)
+            finally:
+                cache.close()
+        for filename in result["skipped"]:
+            print(f"  skipping {filename}: malformed or not a regular file in the archive")
+        print(
+            f"Imported {result['imported']} new entries"
+            f" ({result['present']} already present)"
+        )
+
+    else:
+        print("usage: multikanal cache {stats,prune,warm,verify,export,import}", file=sys.stderr)
+        sys.exit(1)
+
+
 def cmd_install_hooks(args):
     """Install Claude Code hooks into the current project."""
     from .adapters.claude_hook import install_hooks
@@ -273,6 +591,13 @@ def main():
         "narrate": cmd_narrate,
         "health": cmd_health,
         "stop": cmd_stop,
+        "skip": cmd_playback,
+        "flush": cmd_playback,
+        "pause": cmd_playback,
+        "resume": cmd_playback,
+        "queue": cmd_playback,
+        "warm": cmd_warm,
+        "cache": cmd_cache,
         "install-hooks": cmd_install_hooks,
         "codex": cmd_codex,
         "opencode": cmd_opencode,
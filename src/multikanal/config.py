@@ -75,6 +75,21 @@ DEFAULT_CONFIG: dict[str, Any] = {
                 "ollama_url": "http://localhost:11434",
                 "models": ["llama3.1:8b", "phi4", "mistral-nemo"],
                 "timeout_seconds": 10,
+                # Keep the model loaded between narrations; preload on startup
+                "keep_alive": "30m",
+                "preload": True,
+                # "chat" (/api/chat) or "generate" (/api/generate)
+                "api": "chat",
+                "stream": True,
+                "discovery_ttl_seconds": 300,
+            },
+            {
+                # Local TF-IDF sentence ranking (needs numpy); first choice
+                # for the sources in primary_for, fallback for the rest
+                "name": "extractive",
+                "enabled": True,
+                "max_sentences": 3,
+                "primary_for": ["opencode_live"],
             },
         ],
         # Legacy fields (used if providers not set)
@@ -85,6 +100,70 @@ DEFAULT_CONFIG: dict[str, Any] = {
         "timeout_seconds": 10,
         "prompt_file": "config/audio_prompt.md",
         "language_hint": "auto",
+        # Pooled keep-alive clients shared by HTTP providers (HTTP/2 if h2 is installed)
+        "http": {
+            "max_connections": 8,
+            "max_keepalive": 4,
+            "keepalive_expiry_seconds": 60,
+        },
+        # Race the next provider when the current one exceeds its p90 latency
+        # (per-provider "hedge_after_ms" overrides the learned delay)
+        "hedge": {
+            "enabled": True,
+            "default_delay_ms": 2500,
+            "min_delay_ms": 300,
+            "min_samples": 5,
+            "max_inflight": 3,
+        },
+        # Pack waiting narrations into one LLM call once min_batch are queued
+        "batch": {
+            "enabled": True,
+            "min_batch": 3,
+            "max_items": 5,
+        },
+        # Conversation memory of chat providers: "window" keeps the last
+        # max_turns exchanges; "summary" keeps keep_turns and folds older
+        # ones into a rolling summary in the background
+        "memory": {
+            "mode": "summary",
+            "max_turns": 6,
+            "keep_turns": 2,
+            "summary_words": 60,
+            "session_ttl_seconds": 14400,
+            # Sessions kept in RAM; with persist, all of them also live in
+            # <path>/history-<provider>.sqlite and survive restarts
+            "max_resident_sessions": 64,
+            "persist": True,
+            "path": "~/.cache/multikanal",
+        },
+        # Demote slow/erroring providers, skip failing ones; pinned never move
+        "routing": {
+            "enabled": True,
+            "ewma_alpha": 0.3,
+            "slow_ms": 4000,
+            "demote_below_success": 0.6,
+            "skip_below_success": 0.2,
+            "skip_after_failures": 3,
+            "retry_seconds": 60,
+            "pin_first": [],
+            "pin_last": ["extractive", "template", "passthrough"],
+        },
+        # Score each input (length, error signals, novelty vs. the session,
+        # template match) and try the first tier whose max_score covers it;
+        # tiers name providers, the rest of the chain stays as fallback
+        "complexity": {
+            "enabled": True,
+            "long_words": 150,
+            "error_hits": 3,
+            "history_inputs": 20,
+            "weights": {"length": 0.35, "errors": 0.35, "novelty": 0.3, "template": 0.3},
+            "tiers": [
+                {"name": "template", "max_score": 0.2},
+                {"name": "extractive", "max_score": 0.35},
+                {"name": "ollama", "max_score": 0.65},
+                {"name": "minimax", "max_score": 1.0},
+            ],
+        },
     },
     "tts": {
         "engine": "piper",
@@ -97,10 +176,53 @@ DEFAULT_CONFIG: dict[str, Any] = {
     "playback": {
         "tool": "",
         "volume": 1.0,
+        "stream": True,
+        "stream_tool": "",
+        "stream_rate": 24000,
+        "stream_latency_ms": 100,
+        "stream_lead_ms": 150,
+    },
+    "queue": {
+        "maxsize": 5,
+        "latest_per_session": False,
+        "tempo": {
+            "enabled": True,
+            "max_rate": 1.4,
+            "start_seconds": 8,
+            "full_seconds": 30,
+        },
     },
     "cache": {
         "path": "~/.cache/multikanal",
         "max_entries": 500,
+        "codec": "wav",
+        "decode_on_hit": False,
+        "hit_budget_ms": 50,
+        "hot_budget_mb": 16,
+        "hot_promote_after": 2,
+    },
+    "narration_cache": {
+        "enabled": True,
+        "ttl_seconds": 86400,
+        "max_entries": 5000,
+    },
+    "semantic_cache": {
+        "enabled": False,
+        "embedder": "hashing",  # hashing | ollama
+        "model": "nomic-embed-text",
+        "dim": 256,
+        "threshold": 0.92,
+        "capacity": 10000,
+    },
+    "canonical": {
+        "enabled": True,
+        "rules": ["iso_ts", "clock", "uuid", "hex", "duration", "pid", "tmp_path", "port"],
+        "custom": [],
+        "sources": {},
+    },
+    "spool": {
+        "path": "",  # empty = /dev/shm/multikanal-<uid> (tmpfs) or system temp dir
+        "stale_seconds": 600,
     },
     "logging": {
         "path": "~/.local/share/multikanal/logs",
@@ -163,7 +285,7 @@ def load_config(config_path: str | None = None) -> dict[str, Any]:
         cfg = _deep_merge(cfg, file_cfg)
 
     # Expand paths
-    for section, key in [("cache", "path"), ("logging", "path")]:
+    for section, key in [("cache", "path"), ("logging", "path"), ("spool", "path")]:
         val = cfg.get(section, {}).get(key)
         if val:
             cfg[section][key] = _expand_path(val)
@@ -180,6 +302,8 @@ def load_config(config_path: str | None = None) -> dict[str, Any]:
         if isinstance(provider, dict) and provider.get("name") == "minimax":
             if api_key and not provider.get("api_key"):
                 provider["api_key"] = api_key
+        if isinstance(provider, dict) and provider.get("templates_file"):
+            provider["templates_file"] = _resolve_prompt_path(provider["templates_file"])
 
     # Env var overrides
     env_port = os.environ.get("MULTIKANAL_PORT")
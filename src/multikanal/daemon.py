@@ -2,22 +2,35 @@
 
 import asyncio
 import logging
+import os
 import time
 import re
+import tarfile
 from contextlib import asynccontextmanager
 from typing import Any
 
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel
 
 from .config import load_config
+from .narration.batch import BatchJob, NarrationBatcher
+from .narration.cache import NarrationCache
+from .narration.canonical import CanonicalKeyer
+from .narration.semantic import SemanticCache
 from .narration.filter import filter_output
 from .narration.generator import NarrationGenerator
 from .narration.eval_log import EvalLogger
 from .narration.prompt import PromptWatcher
+from .narration.template import TemplateNarrator
+from .tts.archive import export_archive, import_archive
 from .tts.cache import AudioCache
+from .tts import pcm
 from .tts.piper import PiperTTS
 from .tts.playback import AudioPlayer
+from .tts.queue import PlaybackQueue, QueuedClip, TempoPolicy
+from .tts.spool import AudioSpool
+from .tts.segments import SegmentedSynthesizer, Synthesized, split_utterance
+from .tts.warmup import CacheWarmer, warmup_phrases, warmup_voices
 
 logger = logging.getLogger("multikanal.daemon")
 
@@ -27,8 +40,17 @@ _generator: NarrationGenerator | None = None
 _tts: PiperTTS | None = None
 _cache: AudioCache | None = None
 _player: AudioPlayer | None = None
+_segments: SegmentedSynthesizer | None = None
+_spool: AudioSpool | None = None
+_warmer: CacheWarmer | None = None
 _prompt_watcher: PromptWatcher | None = None
 _eval_logger: EvalLogger | None = None
+_narration_cache: NarrationCache | None = None
+_canonical: CanonicalKeyer | None = None
+_semantic: SemanticCache | None = None
+_batcher: NarrationBatcher | None = None
+# Utterance-level (narration → audio) tier; segment lookups are counted by AudioCache
+_audio_tier = {"hits": 0, "misses": 0}
 
 
 class NarrateRequest(BaseModel):
@@ -44,6 +66,8 @@ class NarrateResponse(BaseModel):
     status: str
     narration: str = ""
     cached: bool = False
+    narration_cached: bool = False
+    playback: str = ""
     duration_ms: int = 0
 
 
@@ -55,10 +79,19 @@ class HealthResponse(BaseModel):
     piper_available: bool
     opencode_connected: bool = False
     session_count: int = 0
+    cache: dict = {}
+    spool: dict = {}
+    narration_cache: dict = {}
+    semantic_cache: dict = {}
+    playback: dict = {}
+    narration: dict = {}
+    history: dict = {}
+    batch: dict = {}
 
 
 _start_time: float = 0.0
-_audio_queue: asyncio.Queue | None = None
+_playback_queue: PlaybackQueue | None = None
+_tempo: TempoPolicy | None = None
 _queue_worker_task: asyncio.Task | None = None
 _narrate_lock: asyncio.Lock | None = None
 _opencode_listener_task: asyncio.Task | None = None
@@ -69,8 +102,9 @@ _opencode_connected: bool = False
 async def lifespan(app: FastAPI):
     """Initialize components on startup, clean up on shutdown."""
     global _config, _generator, _tts, _cache, _player, _prompt_watcher, _start_time
-    global _audio_queue, _queue_worker_task, _narrate_lock, _opencode_listener_task
-    global _eval_logger
+    global _playback_queue, _tempo, _queue_worker_task, _narrate_lock, _opencode_listener_task
+    global _eval_logger, _segments, _warmer, _spool, _narration_cache, _canonical
+    global _semantic, _batcher
 
     _start_time = time.monotonic()
     _config = load_config()
@@ -78,8 +112,15 @@ async def lifespan(app: FastAPI):
     # Mutex: only one narration pipeline runs at a time
     _narrate_lock = asyncio.Lock()
 
-    # Audio queue: narrations play one after another, never overlapping
-    _audio_queue = asyncio.Queue(maxsize=5)
+    # Audio queue: narrations play one after another, never overlapping.
+    # The tempo policy speeds playback up while a backlog is pending.
+    queue_cfg = _config.get("queue", {})
+    _playback_queue = PlaybackQueue(
+        maxsize=queue_cfg.get("maxsize", 5),
+        latest_per_session=queue_cfg.get("latest_per_session", False),
+        on_discard=lambda clip: _release_audio(clip.path),
+    )
+    _tempo = TempoPolicy.from_config(queue_cfg.get("tempo", {}))
     _queue_worker_task = asyncio.create_task(_audio_queue_worker())
 
     narr_cfg = _config.get("narration", {})
@@ -87,6 +128,26 @@ async def lifespan(app: FastAPI):
     cache_cfg = _config.get("cache", {})
 
     _generator = NarrationGenerator.from_config(narr_cfg)
+    asyncio.create_task(_generator.awarm())
+    _batcher = NarrationBatcher.from_config(
+        _generator, narr_cfg.get("batch") or {}, cached=_batch_cached
+    )
+
+    ncache_cfg = _config.get("narration_cache", {})
+    if ncache_cfg.get("enabled", True):
+        _narration_cache = NarrationCache(
+            os.path.join(cache_cfg.get("path", "~/.cache/multikanal"), "narrations.sqlite"),
+            ttl_seconds=ncache_cfg.get("ttl_seconds", 24 * 3600),
+            max_entries=ncache_cfg.get("max_entries", 5000),
+        )
+    sem_cfg = _config.get("semantic_cache", {})
+    if sem_cfg.get("enabled", False):
+        _semantic = SemanticCache.from_config(
+            sem_cfg, narr_cfg.get("ollama_url", ""), pool=_generator.http_pool
+        )
+    canon_cfg = _config.get("canonical", {})
+    if canon_cfg.get("enabled", True):
+        _canonical = CanonicalKeyer.from_config(canon_cfg)
 
     _prompt_watcher = PromptWatcher(narr_cfg.get("prompt_file", ""))
     _prompt_watcher.start()
@@ -98,22 +159,45 @@ async def lifespan(app: FastAPI):
         )
         _eval_logger = EvalLogger(eval_path)
 
-    _tts = PiperTTS(
-        command=tts_cfg.get("command", ""),
-        voices=tts_cfg.get("voices", {}),
-        default_voice=tts_cfg.get("default_voice", "de"),
-        speed=tts_cfg.get("speed", 1.0),
-        voice_settings=tts_cfg.get("voice_settings", {}),
+    spool_cfg = _config.get("spool", {})
+    _spool = AudioSpool(
+        spool_cfg.get("path", ""), stale_seconds=spool_cfg.get("stale_seconds", 600)
     )
+    asyncio.create_task(asyncio.to_thread(_spool.sweep))
 
-    _cache = AudioCache(
-        cache_dir=cache_cfg.get("path", "~/.cache/multikanal"),
-        max_entries=cache_cfg.get("max_entries", 500),
-    )
+    _tts = PiperTTS.from_config(tts_cfg, spool=_spool)
+    _cache = AudioCache.from_config(cache_cfg, spool=_spool)
 
-    _player = AudioPlayer(
-        tool=_config.get("playback", {}).get("tool", ""),
-    )
+    _player = AudioPlayer.from_config(_config.get("playback", {}))
+
+    seg_cfg = _config.get("audio", {}).get("segments", {})
+    if seg_cfg.get("enabled", True):
+        _segments = SegmentedSynthesizer(
+            _tts,
+            _cache,
+            gap_ms=seg_cfg.get("gap_ms", 120),
+            sample_rate=seg_cfg.get("sample_rate", 24000),
+        )
+        if seg_cfg.get("warm_on_start", True):
+            asyncio.create_task(
+                asyncio.to_thread(_segments.warm, _common_segments(_config.get("audio", {})))
+            )
+
+        warm_cfg = _config.get("warmup", {})
+        if warm_cfg.get("enabled", False) and warm_cfg.get("on_start", True):
+            _warmer = CacheWarmer(
+                _segments,
+                cpu_budget=warm_cfg.get("cpu_budget", 0.25),
+                nice=warm_cfg.get("nice", 10),
+            )
+            # Phrases of the live template provider (with its templates_file)
+            template = next(
+                (p for p in _generator.providers if isinstance(p, TemplateNarrator)), None
+            )
+            _warmer.start(
+                warmup_phrases(warm_cfg, templates=template.templates if template else {}),
+                warmup_voices(_tts.registry, warm_cfg),
+            )
 
     # Optional: OpenCode SSE listener as background task
     oc_cfg = _config.get("adapters", {}).get("opencode_sse", {})
@@ -143,8 +227,16 @@ async def lifespan(app: FastAPI):
         _queue_worker_task.cancel()
     if _prompt_watcher:
         _prompt_watcher.stop()
+    if _warmer:
+        _warmer.stop()
     if _player:
         _player.stop()
+    if _cache:
+        _cache.close()
+    if _narration_cache:
+        _narration_cache.close()
+    if _generator:
+        await _generator.aclose()
     logger.info("daemon stopped")
 
 
@@ -159,129 +251,298 @@ async def narrate(req: NarrateRequest):
     if not req.text.strip():
         return NarrateResponse(status="skipped", narration="", duration_ms=0)
 
-    # Mutex: only one narration at a time — no overlapping speakers
-    async with _narrate_lock:
-        audio_cfg = _config.get("audio", {})
-        agent_voices = _config.get("tts", {}).get("agent_voices", {})
-        voice_pools = _config.get("tts", {}).get("voice_pools", {})
-        pool = voice_pools.get(req.source)
-        if pool and req.session_id:
-            voice_key = pool[hash(req.session_id) % len(pool)]
-            logger.info("voice_pool: %s → %s (session=%s)", req.source, voice_key, req.session_id[:8])
-        else:
-            voice_key = agent_voices.get(req.source) or req.language or _tts.default_voice
-
-        # --- Direct TTS mode: skip LLM, speak text as-is ---
-        if req.direct_tts:
-            from .narration.providers import _clean_for_tts
-
-            narration = _clean_for_tts(req.text.strip())
-            if not narration:
-                return NarrateResponse(status="skipped", narration="", duration_ms=0)
-
-            # Truncate for TTS (edge-tts handles ~1500 chars well)
-            if len(narration) > 1500:
-                narration = narration[:1500]
-
-            # ai_explain: remove flags/backticks for more natural speech
-            if req.source == "ai_explain":
-                narration = re.sub(r"`+", "", narration)
-                narration = " ".join(
-                    tok for tok in narration.split() if not tok.startswith("-")
-                )
-                narration = re.sub(r"\s+", " ", narration).strip()
+    # Mutex: one narration pipeline at a time. Playback is serialised by the
+    # queue, so the lock is released before waiting for the clip to be spoken.
+    # Registered while waiting for the lock so a batch call can cover it
+    job = await _batch_job(req)
+    try:
+        async with _narrate_lock:
+            response, queued = await _narrate_locked(req, t0, job)
+    finally:
+        if job is not None:
+            _batcher.withdraw(job)
+    if queued is not None:
+        await queued.done.wait()
+        response.playback = queued.outcome
+        response.duration_ms = int((time.monotonic() - t0) * 1000)
+    return response
+
+
+def _semantic_context(system_prompt: str, language: str) -> str:
+    return f"{_generator.fingerprint}|{language}|{hash(system_prompt)}"
+
+
+def _batch_cached(job: BatchJob) -> bool:
+    """Whether the narration or semantic cache already answers ``job``."""
+    if _narration_cache and job.cache_key and _narration_cache.contains(job.cache_key):
+        return True
+    if _semantic and job.embedding is not None:
+        context = _semantic_context(job.system_prompt, job.language)
+        return _semantic.lookup(job.embedding, context, count=False) is not None
+    return False
+
+
+async def _batch_job(req: NarrateRequest) -> BatchJob | None:
+    """Filter the input up front and register it with the batcher.
+
+    Inputs a cache already answers are not registered, so no batch spends
+    tokens on them; the pipeline serves them under the lock as usual.
+    """
+    if not _batcher or req.direct_tts:
+        return None
+    filtered = filter_output(
+        req.text,
+        max_chars=_config.get("narration", {}).get("max_input_chars", 2000),
+    )
+    if not filtered.strip():
+        return None
+    system_prompt = _prompt_watcher.get_prompt() if _prompt_watcher else ""
+    job = BatchJob(filtered, system_prompt, req.language, req.session_id, req.source)
+    key_text = _canonical.canonical(filtered, req.source) if _canonical else filtered
+    job.cache_key = NarrationCache.make_key(
+        key_text, system_prompt, _generator.fingerprint, req.language
+    )
+    if _semantic and not (_narration_cache and _narration_cache.contains(job.cache_key)):
+        job.embedding = await asyncio.to_thread(_semantic.embed, key_text)
+    if _batch_cached(job):
+        return None
+    return _batcher.register(job)
+
+
+async def _narrate_locked(
+    req: NarrateRequest, t0: float, job: BatchJob | None = None
+) -> tuple[NarrateResponse, QueuedClip | None]:
+    """Narration pipeline up to enqueueing the audio (runs under the lock)."""
+    audio_cfg = _config.get("audio", {})
+    voice_key = _tts.registry.voice_key_for(req.source, req.session_id, req.language)
+    if req.session_id:
+        logger.debug("voice: %s → %s (session=%s)", req.source, voice_key, req.session_id[:8])
+
+    # --- Direct TTS mode: skip LLM, speak text as-is ---
+    if req.direct_tts:
+        from .narration.providers import _clean_for_tts
+
+        narration = _clean_for_tts(req.text.strip())
+        if not narration:
+            return NarrateResponse(status="skipped", narration="", duration_ms=0), None
 
-            prefixes_cfg = audio_cfg.get("prefixes", {})
-            prefix = prefixes_cfg.get(req.source, "")
-            audio_text = f"{prefix}{narration}" if prefix else narration
+        # Truncate for TTS (edge-tts handles ~1500 chars well)
+        if len(narration) > 1500:
+            narration = narration[:1500]
 
-            voice_name = _tts.resolve_voice(voice_key)
-            wav_path = await asyncio.to_thread(_tts.synthesize, audio_text, voice_name)
-            if wav_path:
-                await _play_audio(wav_path, audio_cfg)
-                await _audio_queue.join()
+        # ai_explain: remove flags/backticks for more natural speech
+        if req.source == "ai_explain":
+            narration = re.sub(r"`+", "", narration)
+            narration = " ".join(
+                tok for tok in narration.split() if not tok.startswith("-")
+            )
+            narration = re.sub(r"\s+", " ", narration).strip()
+
+        prefixes_cfg = audio_cfg.get("prefixes", {})
+        prefix = prefixes_cfg.get(req.source, "")
+        audio_text = f"{prefix}{narration}" if prefix else narration
 
-            duration = int((time.monotonic() - t0) * 1000)
-            return NarrateResponse(
-                status="ok", narration=audio_text, cached=False, duration_ms=duration
+        wav_path, audio_cached, clip = await _utterance_audio(
+            narration, prefix, "", voice_key
+        )
+        queued = None
+        if wav_path or clip:
+            queued = await _play_audio(
+                wav_path, audio_cfg, req.source, req.session_id, clip=clip
             )
+            _spool.release(wav_path)
+
+        duration = int((time.monotonic() - t0) * 1000)
+        return NarrateResponse(
+            status="ok", narration=audio_text, cached=audio_cached, duration_ms=duration
+        ), queued
 
-        # --- Normal mode: filter → LLM narration → TTS ---
-        # Step 1: Filter the agent output
+    # --- Normal mode: filter → LLM narration → TTS ---
+    # Step 1: Filter the agent output
+    if job is not None:
+        filtered = job.text
+    else:
         filtered = filter_output(
             req.text,
             max_chars=_config.get("narration", {}).get("max_input_chars", 2000),
         )
-        if not filtered.strip():
-            return NarrateResponse(status="skipped", narration="", duration_ms=0)
-
-        # Step 2: Check cache
-        cached_path = _cache.get(filtered, voice_key)
-        if cached_path:
-            await _play_audio(cached_path)
-            await _audio_queue.join()
-            duration = int((time.monotonic() - t0) * 1000)
-            return NarrateResponse(
-                status="ok",
-                narration="(cached)",
-                cached=True,
-                duration_ms=duration,
-            )
+    if not filtered.strip():
+        return NarrateResponse(status="skipped", narration="", duration_ms=0), None
 
-        # Step 3: Generate narration via LLM
+    # Step 2: Narration tier — same input, prompt, providers, language?
+    # Volatile tokens (timings, hashes, temp paths) are masked for the key only
+    if job is not None:
+        system_prompt = job.system_prompt
+    else:
         system_prompt = _prompt_watcher.get_prompt() if _prompt_watcher else ""
+    key_text = _canonical.canonical(filtered, req.source) if _canonical else filtered
+    narration_key = NarrationCache.make_key(
+        key_text, system_prompt, _generator.fingerprint, req.language
+    )
+    narration = _narration_cache.get(narration_key) if _narration_cache else None
+
+    # Step 2b: Semantic tier — a paraphrase of an earlier input?
+    # (a registered batch job was embedded before it queued for the lock)
+    semantic_vec = job.embedding if job is not None else None
+    semantic_context = _semantic_context(system_prompt, req.language)
+    if narration is None and _semantic:
+        if semantic_vec is None:
+            semantic_vec = await asyncio.to_thread(_semantic.embed, key_text)
+        match = _semantic.lookup(semantic_vec, semantic_context)
+        if match:
+            narration, score = match
+            logger.info("semantic cache hit (%.3f)", score)
+    narration_cached = narration is not None
+
+    # Step 3: Generate narration via LLM
+    if not narration_cached:
         try:
+            if job is not None:
+                pending = _batcher.narrate(job)
+            else:
+                pending = _generator.agenerate(
+                    filtered, system_prompt, req.language, req.session_id, source=req.source
+                )
             narration = await asyncio.wait_for(
-                asyncio.to_thread(
-                    _generator.generate, filtered, system_prompt, req.language, req.session_id
-                ),
+                pending,
                 timeout=_config.get("narration", {}).get("timeout_seconds", 15) + 10,
             )
         except asyncio.TimeoutError:
             narration = ""
-        if not narration:
-            duration = int((time.monotonic() - t0) * 1000)
-            return NarrateResponse(
-                status="no_narration", narration="", duration_ms=duration
-            )
+    if not narration:
+        duration = int((time.monotonic() - t0) * 1000)
+        return NarrateResponse(
+            status="no_narration", narration="", duration_ms=duration
+        ), None
+    if not narration_cached and _narration_cache:
+        _narration_cache.put(
+            narration_key, narration, _generator.last_result.get("provider", "")
+        )
+    if not narration_cached and _semantic:
+        _semantic.add(semantic_vec, semantic_context, narration)
+
+    # Eval logging (cache hits too, so key normalisation lift is measurable)
+    if _eval_logger and (narration_cached or _generator.last_result):
+        _eval_logger.log_sample(
+            source=req.source,
+            provider=(
+                "cache"
+                if narration_cached
+                else _generator.last_result.get("provider", "unknown")
+            ),
+            system_prompt=system_prompt,
+            input_text=filtered,
+            narration=narration,
+            llm_ms=0 if narration_cached else _generator.last_result.get("latency_ms", 0),
+            cache_hit=narration_cached,
+            canonical_text=key_text,
+        )
 
-        # Eval logging
-        if _eval_logger and _generator.last_result:
-            _eval_logger.log_sample(
-                source=req.source,
-                provider=_generator.last_result.get("provider", "unknown"),
-                system_prompt=system_prompt,
-                input_text=filtered,
-                narration=narration,
-                llm_ms=_generator.last_result.get("latency_ms", 0),
-            )
+    # Step 4: Prefix
+    prefixes_cfg = audio_cfg.get("prefixes", {})
 
-        # Step 4: Prefix & Synthesize TTS
-        prefixes_cfg = audio_cfg.get("prefixes", {})
+    if req.source in prefixes_cfg:
+        prefix = prefixes_cfg[req.source]
+    elif req.source == "claude_stop":
+        prefix = audio_cfg.get("stop_prefix", "BepBup: ")
+    else:
+        prefix = audio_cfg.get("prefix", "")
 
-        if req.source in prefixes_cfg:
-            prefix = prefixes_cfg[req.source]
-        elif req.source == "claude_stop":
-            prefix = audio_cfg.get("stop_prefix", "BepBup: ")
-        else:
-            prefix = audio_cfg.get("prefix", "")
+    audio_text = f"{prefix}{narration}" if prefix else narration
 
-        audio_text = f"{prefix}{narration}" if prefix else narration
+    if req.title and not req.direct_tts:
+        audio_text = f"{req.title}: {audio_text}"
 
-        if req.title and not req.direct_tts:
-            audio_text = f"{req.title}: {audio_text}"
+    # Step 5: Audio tier — same text, voice and prosody?
+    wav_path, audio_cached, clip = await _utterance_audio(
+        narration, prefix, req.title, voice_key
+    )
+    queued = None
+    if wav_path or clip:
+        queued = await _play_audio(
+            wav_path, audio_cfg, req.source, req.session_id, clip=clip
+        )
+        _spool.release(wav_path)
 
-        voice_name = _tts.resolve_voice(voice_key)
-        wav_path = await asyncio.to_thread(_tts.synthesize, audio_text, voice_name)
-        if wav_path:
-            _cache.put(audio_text, voice_key, wav_path)
-            await _play_audio(wav_path, audio_cfg)
-            await _audio_queue.join()
+    duration = int((time.monotonic() - t0) * 1000)
+    return NarrateResponse(
+        status="ok",
+        narration=audio_text,
+        cached=audio_cached,
+        narration_cached=narration_cached,
+        duration_ms=duration,
+    ), queued
 
-        duration = int((time.monotonic() - t0) * 1000)
-        return NarrateResponse(
-            status="ok", narration=audio_text, cached=False, duration_ms=duration
-        )
+
+async def _utterance_audio(
+    narration: str, prefix: str, title: str, voice_key: str
+) -> tuple[str | None, bool, pcm.PcmClip | None]:
+    """Audio for a full utterance from the audio tier, synthesizing on miss.
+
+    Returns (path, cached, clip). The path may be a spool file owned by the
+    caller. ``clip`` is decoded audio ready for streaming; with a hot-tier
+    hit it comes from RAM and there is no path.
+    """
+    audio_text = f"{prefix}{narration}" if prefix else narration
+    if title:
+        audio_text = f"{title}: {audio_text}"
+    cache_id = _tts.registry.lookup(voice_key).cache_id
+
+    fmt = _player.stream_format
+    if fmt and _cache.contains(audio_text, cache_id):
+        # Streamed as PCM anyway: decode here so hot utterances never touch disk
+        clip = await asyncio.to_thread(_cache.get_clip, audio_text, cache_id, fmt[0])
+        if clip is not None and clip.channels == fmt[1]:
+            _audio_tier["hits"] += 1
+            return None, True, clip
+
+    cached_path = await asyncio.to_thread(_cache.get, audio_text, cache_id)
+    if cached_path:
+        _audio_tier["hits"] += 1
+        return cached_path, True, None
+    _audio_tier["misses"] += 1
+
+    result = await _synthesize_utterance(narration, prefix, title, voice_key)
+    # Fallback-engine audio is not cached under the voice's key
+    if result.path and not result.degraded:
+        await asyncio.to_thread(_cache.put, audio_text, cache_id, result.path)
+    return result.path, False, result.clip
+
+
+async def _synthesize_utterance(
+    narration: str, prefix: str, title: str, voice_key: str
+) -> Synthesized:
+    """Synthesize title/prefix/narration, reusing cached segments where possible."""
+    if _segments:
+        segments = split_utterance(narration, prefix, title)
+        result = await asyncio.to_thread(_segments.synthesize, segments, voice_key)
+        if result.path:
+            return result
+        logger.debug("segment synthesis unavailable, synthesizing whole utterance")
+
+    audio_text = f"{prefix}{narration}" if prefix else narration
+    if title:
+        audio_text = f"{title}: {audio_text}"
+    wav_path, backend = await asyncio.to_thread(_tts.synthesize_backend, audio_text, voice_key)
+    return Synthesized(
+        wav_path,
+        bool(wav_path) and backend != _tts.primary_backend(_tts.registry.lookup(voice_key)),
+    )
+
+
+def _common_segments(audio_cfg: dict) -> list[tuple[str, str]]:
+    """(text, voice_key) pairs for the prefixes every narration starts with."""
+    registry = _tts.registry
+    pairs: list[tuple[str, str]] = []
+    for source, prefix in (audio_cfg.get("prefixes") or {}).items():
+        pairs.append((prefix, registry.voice_key_for(source)))
+    stop_prefix = audio_cfg.get("stop_prefix", "BepBup: ")
+    if stop_prefix:
+        pairs.append((stop_prefix, registry.voice_key_for("claude_stop")))
+    prefix = audio_cfg.get("prefix", "")
+    if prefix:
+        pairs.extend((prefix, spec.voice) for spec in registry.voices_in_use())
+    return pairs
 
 
 async def _opencode_sse_listener(
@@ -494,36 +755,233 @@ async def _audio_queue_worker():
     """Worker that plays audio files sequentially from the queue."""
     while True:
         try:
-            wav_path, audio_cfg = await _audio_queue.get()
+            clip = await _playback_queue.get()
+            # Rate is chosen per clip from the backlog behind (and including) it
+            rate = _tempo.rate_for(_playback_queue.pending_seconds() + clip.duration)
+            # Report what the player can deliver (1.0 when nothing can stretch)
+            rate = _player.effective_tempo(rate)
+            _playback_queue.start(clip, rate)
             try:
-                sink = audio_cfg.get("sink", "")
-                volume = audio_cfg.get("volume", 1.0)
-                await asyncio.to_thread(_player.play, wav_path, sink, volume)
+                sink = clip.audio_cfg.get("sink", "")
+                volume = clip.audio_cfg.get("volume", 1.0)
+                if rate != 1.0:
+                    logger.info(
+                        "backlog %.1fs, playing at %.2fx", _playback_queue.pending_seconds(), rate
+                    )
+                await _play_clip(clip, sink, volume, rate)
             except Exception as e:
+                clip.outcome = "failed"
                 logger.warning("audio playback failed: %s", e)
-            finally:
-                _audio_queue.task_done()
+            reason = _playback_queue.take_interrupt()
+            if reason == "pause":
+                # Keeps its spool reference; replayed from the start on resume
+                _playback_queue.requeue(clip)
+                continue
+            if reason == "skip":
+                clip.outcome = "skipped"
+            _release_audio(clip.path)
+            _playback_queue.finish(clip)
         except asyncio.CancelledError:
             break
         except Exception:
             pass
 
 
-async def _play_audio(wav_path: str, audio_cfg=None):
-    """Queue audio file for sequential playback."""
+def _release_audio(path: str | None) -> None:
+    """Drop the queue's hold on a spool file or cache entry."""
+    _spool.release(path)
+    _cache.release(path)
+
+
+async def _play_clip(clip: QueuedClip, sink: str, volume: float, rate: float) -> None:
+    """Stream in-memory PCM when the clip has it, else play its file."""
+    if clip.pcm is not None:
+        if await asyncio.to_thread(_player.play_clip, clip.pcm, sink, volume, rate):
+            return
+        if not clip.path:
+            # Hot-tier hit without a stream player: spill to a spool file
+            path = _spool.new_path()
+            try:
+                await asyncio.to_thread(pcm.write_wav, clip.pcm, path)
+                await asyncio.to_thread(_player.play, path, sink, volume, rate)
+            finally:
+                _spool.release(path)
+            return
+    await asyncio.to_thread(_player.play, clip.path, sink, volume, rate)
+    _cache.compress(clip.path)
+
+
+async def _play_audio(
+    wav_path: str | None,
+    audio_cfg=None,
+    source: str = "",
+    session_id: str = "",
+    clip: pcm.PcmClip | None = None,
+) -> QueuedClip | None:
+    """Queue audio for sequential playback.
+
+    ``clip`` is decoded audio streamed from memory; ``wav_path`` (if any)
+    backs it up. The queue holds its own spool reference; callers release
+    theirs. Returns the queued clip (its ``done`` event fires after
+    playback) or None if the queue was full.
+    """
     audio_cfg = audio_cfg or {}
-    try:
-        _audio_queue.put_nowait((wav_path, audio_cfg))
-    except asyncio.QueueFull:
+    if clip is not None:
+        duration = clip.duration
+    else:
+        duration = await asyncio.to_thread(pcm.probe_duration, wav_path)
+    queued = QueuedClip(
+        path=wav_path or "",
+        audio_cfg=audio_cfg,
+        duration=duration,
+        source=source,
+        session_id=session_id,
+        pcm=clip,
+    )
+    # Cache paths are not spool files: hold them so they are not
+    # compressed (and their WAV deleted) while still queued
+    if wav_path and not _spool.acquire(wav_path):
+        _cache.acquire(wav_path)
+    if not _playback_queue.put(queued):
+        _release_audio(wav_path)
         logger.debug("audio queue full, skipping narration")
+        return None
+    return queued
 
 
 @app.post("/stop")
 async def stop_audio():
-    """Stop currently playing audio."""
+    """Stop current audio and drop everything queued behind it."""
+    flushed = _playback_queue.flush() if _playback_queue else 0
+    _interrupt_current("skip")
+    return {"status": "stopped", "flushed": flushed}
+
+
+def _interrupt_current(reason: str) -> bool:
+    """Cut the playing clip short; the queue worker handles the aftermath."""
+    if not _playback_queue or not _playback_queue.interrupt(reason):
+        return False
     if _player:
         _player.stop()
-    return {"status": "stopped"}
+    return True
+
+
+class FlushRequest(BaseModel):
+    session_id: str = ""
+    source: str = ""
+
+
+@app.get("/playback")
+async def playback_status():
+    """Queue contents, backlog and tempo policy."""
+    return _playback_stats()
+
+
+@app.post("/playback/skip")
+async def playback_skip():
+    """Skip the clip that is playing; the queue continues with the next one."""
+    return {"status": "skipped" if _interrupt_current("skip") else "idle"}
+
+
+@app.post("/playback/flush")
+async def playback_flush(req: FlushRequest = None):
+    """Drop queued clips of a session and/or source (all if neither is given)."""
+    req = req or FlushRequest()
+    flushed = _playback_queue.flush(req.session_id, req.source) if _playback_queue else 0
+    return {"status": "ok", "flushed": flushed}
+
+
+@app.post("/playback/pause")
+async def playback_pause():
+    """Pause playback; the current clip is replayed from its start on resume."""
+    if not _playback_queue:
+        return {"status": "idle"}
+    _playback_queue.pause()
+    _interrupt_current("pause")
+    return {"status": "paused"}
+
+
+@app.post("/playback/resume")
+async def playback_resume():
+    if _playback_queue:
+        _playback_queue.resume()
+    return {"status": "playing"}
+
+
+@app.post("/reload-config")
+async def reload_config():
+    """Re-read the config file and rebuild the voice registry."""
+    global _config
+    new_config = await asyncio.to_thread(load_config)
+    if _tts:
+        await asyncio.to_thread(_tts.reload_voices, new_config.get("tts", {}))
+    _config = new_config
+    return {"status": "ok", "voices": len(_tts.registry) if _tts else 0}
+
+
+@app.get("/cache/stats")
+async def cache_stats():
+    """Audio and narration cache statistics."""
+    return {
+        "audio": await asyncio.to_thread(_cache_stats),
+        "narration": _narration_cache.stats() if _narration_cache else {},
+        "semantic": _semantic.stats() if _semantic else {},
+    }
+
+
+class CachePruneRequest(BaseModel):
+    max_bytes: int | None = None
+    older_than_seconds: float | None = None
+
+
+@app.post("/cache/prune")
+async def cache_prune(req: CachePruneRequest):
+    """Prune the audio cache from inside the daemon (no race on the directory)."""
+    if not _cache:
+        return {"removed": 0, "bytes_freed": 0}
+    return await asyncio.to_thread(_cache.prune, req.max_bytes, req.older_than_seconds)
+
+
+class CacheVerifyRequest(BaseModel):
+    delete: bool = False
+    workers: int = 4
+
+
+@app.post("/cache/verify")
+async def cache_verify(req: CacheVerifyRequest):
+    """Check every audio cache entry, optionally deleting broken ones."""
+    if not _cache:
+        return {"checked": 0, "broken": [], "deleted": 0}
+    return await asyncio.to_thread(_cache.verify_all, req.workers, req.delete)
+
+
+class CacheArchiveRequest(BaseModel):
+    # Absolute path on the daemon's host
+    archive: str
+    workers: int = 4
+
+
+@app.post("/cache/export")
+async def cache_export(req: CacheArchiveRequest):
+    """Write the audio cache to a tar.gz archive."""
+    if not _cache:
+        raise HTTPException(status_code=409, detail="audio cache disabled")
+    try:
+        exported = await asyncio.to_thread(export_archive, _cache, req.archive)
+    except OSError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    return {"exported": exported}
+
+
+@app.post("/cache/import")
+async def cache_import(req: CacheArchiveRequest):
+    """Load entries from an archive written by ``/cache/export``."""
+    if not _cache:
+        raise HTTPException(status_code=409, detail="audio cache disabled")
+    try:
+        return await asyncio.to_thread(import_archive, _cache, req.archive, req.workers)
+    except (OSError, ValueError, tarfile.TarError) as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
 
 
 class ResetHistoryRequest(BaseModel):
@@ -544,10 +1002,10 @@ async def reset_history(req: ResetHistoryRequest = None):
 async def health():
     """Health check endpoint."""
     uptime = time.monotonic() - _start_time
-    provider_status = _generator.health_map() if _generator else {}
+    provider_status = await _generator.ahealth_map() if _generator else {}
     piper_ok = _tts.check_available() if _tts else False
     session_count = sum(
-        len(p._histories) for p in (_generator.providers if _generator else []) if hasattr(p, "_histories")
+        len(p.memory) for p in (_generator.providers if _generator else []) if hasattr(p, "memory")
     )
     return HealthResponse(
         status="ok",
@@ -557,7 +1015,43 @@ async def health():
         piper_available=piper_ok,
         opencode_connected=_opencode_connected,
         session_count=session_count,
+        cache=await asyncio.to_thread(_cache_stats),
+        spool=_spool.stats() if _spool else {},
+        narration_cache=_narration_cache.stats() if _narration_cache else {},
+        semantic_cache=_semantic.stats() if _semantic else {},
+        playback=_playback_stats(),
+        narration=_generator.routing_stats() if _generator else {},
+        history=_generator.history_stats() if _generator else {},
+        batch=_batcher.stats() if _batcher else {},
+    )
+
+
+def _playback_stats() -> dict:
+    """Queue backlog, effective rate and the tempo policy."""
+    if not _playback_queue:
+        return {}
+    stats = _playback_queue.stats()
+    stats["next_rate"] = (
+        _player.effective_tempo(_tempo.rate_for(stats["pending_seconds"]))
+        if _tempo and _player
+        else 1.0
+    )
+    stats["tempo"] = _tempo.describe() if _tempo else {}
+    return stats
+
+
+def _cache_stats() -> dict:
+    """Audio cache stats plus the utterance-tier hit rate."""
+    if not _cache:
+        return {}
+    stats = _cache.stats()
+    lookups = _audio_tier["hits"] + _audio_tier["misses"]
+    stats["utterance_hits"] = _audio_tier["hits"]
+    stats["utterance_misses"] = _audio_tier["misses"]
+    stats["utterance_hit_ratio"] = (
+        round(_audio_tier["hits"] / lookups, 3) if lookups else 0.0
     )
+    return stats
 
 
 def run():
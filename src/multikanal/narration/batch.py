@@ -0,0 +1,290 @@
+"""Batch several pending narrations into one provider request.
+
+The daemon runs one narration pipeline at a time, so under load requests
+queue up on its lock, each waiting for its own LLM round-trip. Requests
+register their filtered input with ``NarrationBatcher`` before queueing;
+when the job holding the lock needs a narration and at least
+``min_batch`` compatible jobs (same system prompt and language) are
+waiting, up to ``max_items`` of them are packed into one request asking
+for a JSON array with one narration per item. Each waiting job finds its
+narration ready when it gets the lock. If the reply cannot be parsed,
+every job falls back to its own call.
+
+Batched items are generated without session history. Jobs are routed by
+complexity when registered; only jobs sent to the same tier are batched,
+and only if that tier's provider can narrate batches. Peers the owner's
+``cached`` check reports as narration-cache hits stay out of a batch, as
+do repeats of an input already in it: both are served from the cache
+once they get the lock.
+
+``python -m multikanal.narration.batch`` runs a benchmark of batched vs
+single calls against a stub provider with a fixed round-trip latency.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Callable
+
+from .complexity import Route
+
+logger = logging.getLogger("multikanal.narration.batch")
+
+_ARRAY_RE = re.compile(r"\[.*\]", re.DOTALL)
+
+
+def batch_prompt(texts: list[str], max_words: int) -> str:
+    """User prompt asking for one narration per numbered item, as JSON."""
+    items = "\n\n".join(f"### {i + 1}\n{text}" for i, text in enumerate(texts))
+    return (
+        f"Es folgen {len(texts)} unabhängige Agent-Ausgaben. Erstelle für jede "
+        f"eine eigene Audio-Erklärung (jeweils maximal {max_words} Wörter).\n"
+        f"Antworte NUR mit einem JSON-Array aus genau {len(texts)} Strings, "
+        f"in derselben Reihenfolge.\n\n{items}"
+    )
+
+
+def parse_batch(reply: str, count: int) -> list[str] | None:
+    """The reply's JSON array of ``count`` non-empty strings, else None."""
+    match = _ARRAY_RE.search(reply or "")
+    if not match:
+        return None
+    try:
+        items = json.loads(match.group(0))
+    except ValueError:
+        return None
+    if not isinstance(items, list) or len(items) != count:
+        return None
+    out = [item.strip() if isinstance(item, str) else "" for item in items]
+    return out if all(out) else None
+
+
+@dataclass
+class BatchJob:
+    text: str
+    system_prompt: str
+    language: str = ""
+    session_id: str = ""
+    source: str = ""
+    # (narration, provider) once produced by someone else's batch
+    result: tuple[str, str] | None = None
+    registered: float = field(default_factory=time.monotonic)
+    # Complexity tier, set on registration (None = routing off)
+    route: Route | None = None
+    # Narration-cache key and semantic embedding, computed by the owner
+    cache_key: str = ""
+    embedding: object = None
+
+    def compatible(self, other: "BatchJob") -> bool:
+        return (
+            self.system_prompt == other.system_prompt
+            and self.language == other.language
+            and _tier(self) == _tier(other)
+        )
+
+
+def _tier(job: BatchJob) -> str:
+    return job.route.tier if job.route else ""
+
+
+class NarrationBatcher:
+    """Packs waiting narration jobs into batch calls on a ``NarrationGenerator``."""
+
+    def __init__(
+        self,
+        generator,
+        enabled: bool = True,
+        min_batch: int = 3,
+        max_items: int = 5,
+        cached: Callable[[BatchJob], bool] | None = None,
+    ):
+        self.generator = generator
+        self.enabled = enabled
+        # Whether a waiting job would be answered from a narration cache
+        self.cached = cached
+        self.min_batch = max(2, min_batch)
+        self.max_items = max(self.min_batch, max_items)
+        self._waiting: list[BatchJob] = []
+        self.batches = 0
+        self.batched_items = 0
+        self.parse_failures = 0
+        self.served = 0
+
+    @classmethod
+    def from_config(cls, generator, batch_cfg: dict, cached=None) -> "NarrationBatcher":
+        return cls(
+            generator,
+            enabled=batch_cfg.get("enabled", True),
+            min_batch=batch_cfg.get("min_batch", 3),
+            max_items=batch_cfg.get("max_items", 5),
+            cached=cached,
+        )
+
+    def register(self, job: BatchJob) -> BatchJob:
+        # Routed in arrival order, so session novelty sees inputs in sequence
+        job.route = self.generator.route(job.text, job.session_id, job.source)
+        self._waiting.append(job)
+        return job
+
+    def withdraw(self, job: BatchJob) -> None:
+        if job in self._waiting:
+            self._waiting.remove(job)
+
+    async def narrate(self, job: BatchJob) -> str:
+        """Narration for ``job``: from an earlier batch, a new batch, or a single call."""
+        self.withdraw(job)
+        if job.result:
+            narration, provider = job.result
+            self.served += 1
+            self.generator.last_result = {"provider": provider, "latency_ms": 0, "batched": True}
+            return narration
+
+        if self.enabled:
+            peers = self._peers(job)
+            if len(peers) + 1 >= self.min_batch:
+                narration = await self._batch([job] + peers)
+                if narration:
+                    return narration
+        return await self.generator.agenerate(
+            job.text, job.system_prompt, job.language, job.session_id,
+            source=job.source, route=job.route,
+        )
+
+    def _peers(self, job: BatchJob) -> list[BatchJob]:
+        """Waiting jobs that can share ``job``'s batch and would not hit a cache."""
+        keys = {job.cache_key}
+        peers = []
+        for j in self._waiting:
+            if len(peers) + 1 >= self.max_items:
+                break
+            if j.result is not None or not j.compatible(job):
+                continue
+            if j.cache_key and j.cache_key in keys:
+                continue
+            if self.cached is not None and self.cached(j):
+                continue
+            keys.add(j.cache_key)
+            peers.append(j)
+        return peers
+
+    async def _batch(self, jobs: list[BatchJob]) -> str:
+        """Run one batch call; fills the peers' results, returns the first job's."""
+        provider = self.generator.batch_provider(jobs[0].source, jobs[0].route)
+        if provider is None:
+            return ""
+        texts = [j.text for j in jobs]
+        t0 = time.monotonic()
+        try:
+            narrations = await provider.agenerate_batch(texts, jobs[0].system_prompt)
+        except Exception as exc:  # noqa: BLE001
+            logger.debug("batch via %s raised: %s", provider.name, exc)
+            narrations = None
+        latency_ms = int((time.monotonic() - t0) * 1000)
+        self.generator.record(provider, latency_ms, bool(narrations))
+        if not narrations:
+            self.parse_failures += 1
+            logger.info("batch of %d via %s failed, falling back to single calls", len(jobs), provider.name)
+            return ""
+        for peer, narration in zip(jobs[1:], narrations[1:]):
+            peer.result = (narration, provider.name)
+        self.batches += 1
+        self.batched_items += len(jobs)
+        self.generator.last_result = {
+            "provider": provider.name,
+            "latency_ms": latency_ms,
+            "batched": True,
+        }
+        for j in jobs:
+            if j.route:
+                self.generator.complexity.record(j.route, latency_ms, provider.name)
+        logger.info("narrated %d jobs in one %s call (%d ms)", len(jobs), provider.name, latency_ms)
+        return narrations[0]
+
+    def stats(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "waiting": len(self._waiting),
+            "min_batch": self.min_batch,
+            "max_items": self.max_items,
+            "batches": self.batches,
+            "batched_items": self.batched_items,
+            "served_from_batch": self.served,
+            "parse_failures": self.parse_failures,
+        }
+
+
+# -- benchmark ---------------------------------------------------------------
+
+
+async def _bench(jobs: int, latency: float, per_item: float, concurrency_limit: int) -> dict:
+    from .generator import NarrationGenerator
+    from .providers import BaseNarrator
+
+    class StubProvider(BaseNarrator):
+        """Fixed round-trip latency plus a small per-item generation cost."""
+
+        def __init__(self):
+            super().__init__("stub")
+            self.calls = 0
+
+        def generate(self, text, system_prompt="", language="", session_id=""):
+            return f"Narration für {text[:20]}"
+
+        def check_health(self):
+            return True
+
+        async def agenerate(self, text, system_prompt="", language="", session_id=""):
+            self.calls += 1
+            await asyncio.sleep(latency + per_item)
+            return self.generate(text)
+
+        async def agenerate_batch(self, texts, system_prompt=""):
+            self.calls += 1
+            await asyncio.sleep(latency + per_item * len(texts))
+            return parse_batch(json.dumps([self.generate(t) for t in texts]), len(texts))
+
+    results = {}
+    for label, enabled in (("single", False), ("batched", True)):
+        stub = StubProvider()
+        batcher = NarrationBatcher(NarrationGenerator([stub]), enabled=enabled)
+        lock = asyncio.Lock()
+
+        async def request(i: int) -> None:
+            job = batcher.register(BatchJob(f"Ausgabe {i}: 3 tests passed", "prompt"))
+            async with lock:
+                await batcher.narrate(job)
+
+        t0 = time.perf_counter()
+        for start in range(0, jobs, concurrency_limit):
+            await asyncio.gather(*(request(i) for i in range(start, min(jobs, start + concurrency_limit))))
+        wall = time.perf_counter() - t0
+        results[label] = {
+            "wall_seconds": round(wall, 3),
+            "jobs_per_second": round(jobs / wall, 2),
+            "provider_calls": stub.calls,
+        }
+    results["speedup"] = round(
+        results["batched"]["jobs_per_second"] / results["single"]["jobs_per_second"], 2
+    )
+    return results
+
+
+def main() -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark batched vs single narration calls")
+    parser.add_argument("--jobs", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.4, help="stub round-trip seconds")
+    parser.add_argument("--per-item", type=float, default=0.05, help="stub seconds per item")
+    parser.add_argument("--burst", type=int, default=5, help="requests arriving together")
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(_bench(args.jobs, args.latency, args.per_item, args.burst)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
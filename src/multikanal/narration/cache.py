@@ -0,0 +1,137 @@
+"""Input → narration cache (first tier in front of the LLM providers).
+
+Keyed by filtered input, system prompt, provider chain and language, so a
+prompt edit or a provider change never serves stale narrations. Entries
+expire after a TTL. The second tier (narration → audio) is ``AudioCache``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import pathlib
+import sqlite3
+import threading
+import time
+
+logger = logging.getLogger("multikanal.narration.cache")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS narrations (
+    key TEXT PRIMARY KEY,
+    narration TEXT NOT NULL,
+    provider TEXT NOT NULL DEFAULT '',
+    created REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS narrations_created ON narrations (created);
+"""
+
+
+class NarrationCache:
+    """SQLite-backed narration cache with TTL and hit-rate counters."""
+
+    def __init__(
+        self,
+        db_path: str,
+        ttl_seconds: float = 24 * 3600,
+        max_entries: int = 5000,
+    ):
+        path = pathlib.Path(db_path).expanduser()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._ttl = ttl_seconds
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(path), check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self.hits = 0
+        self.misses = 0
+        self._puts = 0
+
+    @staticmethod
+    def make_key(text: str, system_prompt: str, fingerprint: str, language: str) -> str:
+        h = hashlib.sha256()
+        for part in (text, system_prompt, fingerprint, language):
+            h.update(part.encode("utf-8"))
+            h.update(b"\x00")
+        return h.hexdigest()
+
+    def get(self, key: str) -> str | None:
+        cutoff = time.time() - self._ttl
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT narration FROM narrations WHERE key = ? AND created >= ?",
+                (key, cutoff),
+            ).fetchone()
+            if row:
+                self._conn.execute(
+                    "UPDATE narrations SET hits = hits + 1 WHERE key = ?", (key,)
+                )
+        if row:
+            self.hits += 1
+            logger.debug("narration cache hit: %s", key[:12])
+            return row[0]
+        self.misses += 1
+        return None
+
+    def contains(self, key: str) -> bool:
+        """Whether a live entry exists (no hit/miss accounting)."""
+        cutoff = time.time() - self._ttl
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM narrations WHERE key = ? AND created >= ?", (key, cutoff)
+            ).fetchone()
+        return row is not None
+
+    def put(self, key: str, narration: str, provider: str = "") -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO narrations (key, narration, provider, created, hits)"
+                " VALUES (?, ?, ?, ?, 0)",
+                (key, narration, provider, time.time()),
+            )
+        self._puts += 1
+        # Amortised cleanup instead of a sweep on every put
+        if self._puts % 100 == 0:
+            self.purge()
+
+    def purge(self) -> int:
+        """Drop expired entries and trim to max_entries (oldest first)."""
+        cutoff = time.time() - self._ttl
+        with self._lock:
+            cur = self._conn.execute(
+                "DELETE FROM narrations WHERE created < ?", (cutoff,)
+            )
+            removed = cur.rowcount
+            cur = self._conn.execute(
+                "DELETE FROM narrations WHERE key IN ("
+                " SELECT key FROM narrations ORDER BY created DESC LIMIT -1 OFFSET ?)",
+                (self._max_entries,),
+            )
+            removed += cur.rowcount
+        if removed:
+            logger.debug("narration cache purged %d entries", removed)
+        return removed
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM narrations")
+
+    def stats(self) -> dict:
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM narrations").fetchone()[0]
+        lookups = self.hits + self.misses
+        return {
+            "entries": entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 3) if lookups else 0.0,
+            "ttl_seconds": self._ttl,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,140 @@
+"""Canonical cache keys: mask volatile tokens before hashing.
+
+Tool outputs that only differ in timings, hashes, PIDs or temp file names
+should share one narration cache entry. The narration itself is still
+generated from the real text; only the key is canonicalised.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from dataclasses import dataclass
+
+logger = logging.getLogger("multikanal.narration.canonical")
+
+
+@dataclass(frozen=True)
+class Rule:
+    name: str
+    pattern: re.Pattern
+    replace: str
+
+
+def _rule(name: str, pattern: str, replace: str, flags: int = 0) -> Rule:
+    return Rule(name, re.compile(pattern, flags), replace)
+
+
+# Order matters: specific shapes first, generic numbers last
+BUILTIN_RULES: dict[str, Rule] = {
+    r.name: r
+    for r in [
+        _rule(
+            "iso_ts",
+            r"\b\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}(?::\d{2}(?:[.,]\d+)?)?(?:Z|[+-]\d{2}:?\d{2})?",
+            "<ts>",
+        ),
+        _rule("clock", r"\b\d{1,2}:\d{2}:\d{2}(?:[.,]\d+)?\b", "<time>"),
+        _rule(
+            "uuid",
+            r"\b[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\b",
+            "<uuid>",
+            re.IGNORECASE,
+        ),
+        _rule("hex", r"\b(?=[0-9a-f]*[a-f])(?=[0-9a-f]*\d)[0-9a-f]{7,64}\b", "<hex>", re.IGNORECASE),
+        _rule(
+            "duration",
+            r"\b\d+(?:[.,]\d+)?\s?(?:ms|µs|us|ns|s|sec|secs|seconds|sekunden|min|m)\b",
+            "<dur>",
+            re.IGNORECASE,
+        ),
+        _rule("pid", r"\b(pid|process)[ =:#]*\d+\b", r"\1 <pid>", re.IGNORECASE),
+        _rule(
+            "tmp_path",
+            r"(?:/tmp|/var/tmp|/var/folders|/private/var|/dev/shm)/\S+|\btmp[\w-]{6,}(?:\.\w+)?\b",
+            "<tmp>",
+        ),
+        # Only after a host (localhost, IP, URL authority, user@host), so
+        # "file.py:1234" line numbers stay part of the key
+        _rule(
+            "port",
+            r"(?P<host>\blocalhost|\b\d{1,3}(?:\.\d{1,3}){3}|\[[0-9a-f:]+\]"
+            r"|(?<=://)[\w.-]+|(?<=@)[\w.-]+):\d{2,5}\b",
+            r"\g<host>:<port>",
+            re.IGNORECASE,
+        ),
+        # Off by default: "3 failed" and "5 failed" would share a narration.
+        # Keeps 0 and 1 exact, buckets the rest by digit count.
+        _rule("number", r"\b(?![01]\b)\d+(?:[.,]\d+)?\b", "<num>"),
+    ]
+}
+
+DEFAULT_RULES = ["iso_ts", "clock", "uuid", "hex", "duration", "pid", "tmp_path", "port"]
+
+
+def _bucket_number(match: re.Match) -> str:
+    digits = len(match.group(0).split(".")[0].split(",")[0])
+    return f"<num{digits}>"
+
+
+class Canonicalizer:
+    """Applies an ordered list of masking rules to produce a cache key text."""
+
+    def __init__(self, rules: list[Rule]):
+        self.rules = list(rules)
+
+    @classmethod
+    def from_spec(cls, names: list[str], custom: list[dict] | None = None) -> "Canonicalizer":
+        rules: list[Rule] = []
+        for name in names:
+            rule = BUILTIN_RULES.get(name)
+            if rule is None:
+                logger.warning("unknown canonicalisation rule: %s", name)
+                continue
+            rules.append(rule)
+        for entry in custom or []:
+            try:
+                rules.append(
+                    _rule(
+                        entry.get("name", "custom"),
+                        entry["pattern"],
+                        entry.get("replace", "<x>"),
+                    )
+                )
+            except (KeyError, re.error) as e:
+                logger.warning("invalid custom canonicalisation rule %r: %s", entry, e)
+        return cls(rules)
+
+    def canonical(self, text: str) -> str:
+        for rule in self.rules:
+            if rule.name == "number":
+                text = rule.pattern.sub(_bucket_number, text)
+            else:
+                text = rule.pattern.sub(rule.replace, text)
+        return text
+
+
+class CanonicalKeyer:
+    """Per-source canonicalisers built from the ``canonical`` config section."""
+
+    def __init__(self, default: Canonicalizer, per_source: dict[str, Canonicalizer]):
+        self._default = default
+        self._per_source = per_source
+
+    @classmethod
+    def from_config(cls, cfg: dict) -> "CanonicalKeyer":
+        default_names = cfg.get("rules") or DEFAULT_RULES
+        custom = cfg.get("custom") or []
+        default = Canonicalizer.from_spec(default_names, custom)
+        per_source = {}
+        for source, scfg in (cfg.get("sources") or {}).items():
+            if not isinstance(scfg, dict):
+                continue
+            per_source[source] = Canonicalizer.from_spec(
+                scfg.get("rules") or default_names,
+                custom + (scfg.get("custom") or []),
+            )
+        return cls(default, per_source)
+
+    def canonical(self, text: str, source: str = "") -> str:
+        return self._per_source.get(source, self._default).canonical(text)
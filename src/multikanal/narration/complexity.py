@@ -0,0 +1,195 @@
+"""Route each input to the cheapest provider tier that can narrate it.
+
+Without routing every input runs down the full provider chain, so a
+one-line ``git status`` costs an LLM round-trip. ``ComplexityRouter``
+scores the filtered input from a few cheap features:
+
+- length: word count relative to ``long_words``
+- errors: error/failure signals (tracebacks, "failed", "Fehler", ...)
+- novelty: share of the input's terms not seen in the session's recent
+  inputs (repeated output from the same loop is cheap to narrate)
+- template: a template key matches, which lowers the score
+
+and picks the first configured tier whose ``max_score`` covers it. Tiers
+name providers; a tier whose provider is not configured is skipped, and
+the template tier only takes inputs a template actually matches. The
+chosen provider goes first, the rest of the routed chain stays behind it
+as fallback. Scoring costs well under a millisecond.
+
+Per-tier request counts, latency and how often the tier's own provider
+answered are reported via ``snapshot``.
+"""
+
+from __future__ import annotations
+
+import collections
+import logging
+import re
+from dataclasses import dataclass, field
+
+from .stats import ProviderStats
+
+logger = logging.getLogger("multikanal.narration.complexity")
+
+_TOKEN_RE = re.compile(r"[^\W\d_]{3,}", re.UNICODE)
+_ERROR_RE = re.compile(
+    r"\b(error|errors|failed|failure|exception|traceback|fatal|panic|denied|"
+    r"refused|segfault|fehler|fehlgeschlagen|abgebrochen)\b",
+    re.IGNORECASE,
+)
+
+DEFAULT_TIERS = [
+    {"name": "template", "max_score": 0.2},
+    {"name": "extractive", "max_score": 0.35},
+    {"name": "ollama", "max_score": 0.65},
+    {"name": "minimax", "max_score": 1.0},
+]
+DEFAULT_WEIGHTS = {"length": 0.35, "errors": 0.35, "novelty": 0.3, "template": 0.3}
+
+
+@dataclass
+class Route:
+    tier: str
+    score: float
+    features: dict[str, float] = field(default_factory=dict)
+
+
+class ComplexityRouter:
+    """Scores inputs and maps them to provider tiers by ``max_score``."""
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        tiers: list[dict] | None = None,
+        weights: dict[str, float] | None = None,
+        long_words: int = 150,
+        error_hits: int = 3,
+        history_inputs: int = 20,
+        max_sessions: int = 64,
+        matcher=None,
+    ):
+        self.enabled = enabled
+        self.tiers = sorted(
+            (
+                (str(t["name"]), float(t.get("max_score", 1.0)))
+                for t in (tiers or DEFAULT_TIERS)
+                if isinstance(t, dict) and t.get("name")
+            ),
+            key=lambda t: t[1],
+        )
+        self.weights = {**DEFAULT_WEIGHTS, **(weights or {})}
+        self.long_words = max(1, long_words)
+        self.error_hits = max(1, error_hits)
+        self.history_inputs = history_inputs
+        self.max_sessions = max_sessions
+        # Template provider (or anything with ``match(text) -> key | None``)
+        self.matcher = matcher
+        # session -> (recent input term sets, term counts)
+        self._seen: collections.OrderedDict[
+            str, tuple[collections.deque, collections.Counter]
+        ] = collections.OrderedDict()
+        self.stats = {name: ProviderStats(name) for name, _ in self.tiers}
+        self.routed = collections.Counter()
+        self.served = collections.Counter()
+
+    @classmethod
+    def from_config(cls, complexity_cfg: dict, matcher=None) -> "ComplexityRouter":
+        return cls(
+            enabled=complexity_cfg.get("enabled", False),
+            tiers=complexity_cfg.get("tiers"),
+            weights=complexity_cfg.get("weights"),
+            long_words=complexity_cfg.get("long_words", 150),
+            error_hits=complexity_cfg.get("error_hits", 3),
+            history_inputs=complexity_cfg.get("history_inputs", 20),
+            matcher=matcher,
+        )
+
+    def _history(self, key: str) -> tuple[collections.deque, collections.Counter]:
+        seen = self._seen.get(key)
+        if seen is None:
+            seen = self._seen[key] = (collections.deque(), collections.Counter())
+            while len(self._seen) > self.max_sessions:
+                self._seen.popitem(last=False)
+        self._seen.move_to_end(key)
+        return seen
+
+    def _remember(self, key: str, terms: set[str]) -> None:
+        inputs, counts = self._history(key)
+        inputs.append(terms)
+        counts.update(terms)
+        if len(inputs) > self.history_inputs:
+            counts.subtract(inputs.popleft())
+            # Counter.subtract leaves zero entries behind
+            for term in [t for t, n in counts.items() if n <= 0]:
+                del counts[term]
+
+    def features(self, text: str, session_id: str = "") -> dict[str, float]:
+        """Feature values in [0, 1]; does not update the session history."""
+        terms = {t.lower() for t in _TOKEN_RE.findall(text)}
+        _, counts = self._history(session_id or "default")
+        novelty = sum(1 for t in terms if t not in counts) / len(terms) if terms else 0.0
+        matched = self.matcher.match(text) if self.matcher is not None else None
+        return {
+            "length": min(1.0, len(text.split()) / self.long_words),
+            "errors": min(1.0, len(_ERROR_RE.findall(text)) / self.error_hits),
+            "novelty": novelty,
+            "template": 1.0 if matched else 0.0,
+        }
+
+    def score(self, features: dict[str, float]) -> float:
+        w = self.weights
+        raw = (
+            w["length"] * features["length"]
+            + w["errors"] * features["errors"]
+            + w["novelty"] * features["novelty"]
+            - w["template"] * features["template"]
+        )
+        return round(min(1.0, max(0.0, raw)), 3)
+
+    def route(self, text: str, session_id: str = "", available=()) -> Route | None:
+        """Tier for ``text`` among the ``available`` provider names.
+
+        None when routing is disabled; tier "" when no tier is eligible.
+        """
+        if not self.enabled or not self.tiers:
+            return None
+        features = self.features(text, session_id)
+        score = self.score(features)
+        self._remember(session_id or "default", {t.lower() for t in _TOKEN_RE.findall(text)})
+
+        eligible = [
+            (name, limit)
+            for name, limit in self.tiers
+            if name in available and (name != "template" or features["template"])
+        ]
+        if not eligible:
+            return Route("", score, features)
+        # Above every threshold: the most capable tier
+        tier = next((name for name, limit in eligible if score <= limit), eligible[-1][0])
+        self.routed[tier] += 1
+        logger.debug("complexity %.3f %s -> tier %s", score, features, tier)
+        return Route(tier, score, features)
+
+    def record(self, route: Route, latency_ms: int, provider: str) -> None:
+        """Outcome of a routed request; ``provider`` is who answered ("" = nobody)."""
+        if route.tier not in self.stats:
+            return
+        self.stats[route.tier].record(latency_ms, bool(provider))
+        if provider == route.tier:
+            self.served[route.tier] += 1
+
+    def snapshot(self) -> dict:
+        total = sum(self.routed.values())
+        tiers = {}
+        for name, limit in self.tiers:
+            stats = self.stats[name].snapshot()
+            tiers[name] = {
+                "max_score": limit,
+                "routed": self.routed[name],
+                "share": round(self.routed[name] / total, 3) if total else 0.0,
+                "served_by_tier": self.served[name],
+                "ewma_ms": stats["ewma_ms"],
+                "p50_ms": stats["p50_ms"],
+                "p90_ms": stats["p90_ms"],
+            }
+        return {"enabled": self.enabled, "routed": total, "tiers": tiers}
@@ -85,8 +85,15 @@ class EvalLogger:
         input_text: str,
         narration: str,
         llm_ms: int,
+        cache_hit: bool = False,
+        canonical_text: str | None = None,
     ) -> None:
-        """Log a single narration sample with computed metrics."""
+        """Log a single narration sample with computed metrics.
+
+        ``input_key``/``canonical_key`` are short hashes of the raw and the
+        canonicalised input: counting repeats of each over a log shows how
+        many extra cache hits key normalisation buys.
+        """
         in_chars = len(input_text)
         out_chars = len(narration)
         out_words = _count_words(narration)
@@ -104,6 +111,11 @@ class EvalLogger:
             "starts_filler": _starts_with_filler(narration),
             "info_density": _info_density(narration),
             "compression": round(in_chars / out_chars, 2) if out_chars else 0.0,
+            "cache_hit": cache_hit,
+            "input_key": _prompt_hash(input_text),
+            "canonical_key": _prompt_hash(
+                input_text if canonical_text is None else canonical_text
+            ),
             "input_preview": input_text[:80],
             "narration": narration,
         }
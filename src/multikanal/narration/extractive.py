@@ -0,0 +1,205 @@
+"""Offline extractive narrator: pick the most informative sentences.
+
+When no LLM is reachable the template/passthrough fallbacks read the
+first few words, which is usually noise. ``ExtractiveNarrator`` splits
+the filtered text into sentences and ranks them by TF-IDF similarity to
+the whole input, with IDF taken from a rolling per-session corpus (lines
+every command prints, like progress or boilerplate, lose weight over a
+session). Sentences carrying results get boosts: errors, "passed" /
+"failed", counts such as "3 tests failed", and the opening and closing
+lines. The best sentences are read in their original order, within the
+word budget. A typical input is ranked in a few milliseconds.
+
+Requires numpy (``pip install multikanal[extractive]``); SciPy sparse
+matrices are used when available. Without numpy the provider is skipped.
+"""
+
+from __future__ import annotations
+
+import collections
+import logging
+import re
+
+from .providers import BaseNarrator, _clean_for_tts
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+try:
+    from scipy import sparse
+except ImportError:  # pragma: no cover - optional dependency
+    sparse = None
+
+logger = logging.getLogger("multikanal.narration.extractive")
+
+_SENTENCE_RE = re.compile(r"(?<=[.!?])\s+|\n+")
+_TOKEN_RE = re.compile(r"[^\W\d_]{2,}", re.UNICODE)
+_KEYWORD_RE = re.compile(
+    r"\b(error|errors|failed|failure|fail|exception|traceback|warning|passed|"
+    r"success|succeeded|fehler|fehlgeschlagen|erfolgreich|bestanden|warnung)\b",
+    re.IGNORECASE,
+)
+_COUNT_RE = re.compile(
+    r"\b\d+\s+(tests?|passed|failed|errors?|warnings?|files?|changed|insertions?|"
+    r"deletions?|skipped|dateien|fehler)\b",
+    re.IGNORECASE,
+)
+
+
+def split_sentences(text: str, min_words: int = 3) -> list[str]:
+    """Sentences/lines with at least ``min_words`` word tokens."""
+    out = []
+    for part in _SENTENCE_RE.split(text):
+        part = part.strip(" \t=-*#>|")
+        if len(_TOKEN_RE.findall(part)) >= min_words or _COUNT_RE.search(part):
+            out.append(part)
+    return out
+
+
+class ExtractiveNarrator(BaseNarrator):
+    """Local TF-IDF sentence ranking with positional and keyword boosts."""
+
+    def __init__(
+        self,
+        max_words: int = 80,
+        max_sentences: int = 3,
+        corpus_size: int = 400,
+        max_sessions: int = 64,
+        keyword_boost: float = 0.3,
+        count_boost: float = 0.4,
+        position_boost: float = 0.1,
+    ):
+        super().__init__("extractive")
+        self.max_words = max_words
+        self.max_sentences = max_sentences
+        self.corpus_size = corpus_size
+        self.max_sessions = max_sessions
+        self.keyword_boost = keyword_boost
+        self.count_boost = count_boost
+        self.position_boost = position_boost
+        # session -> (recent sentence term sets, document frequencies)
+        self._corpora: collections.OrderedDict[
+            str, tuple[collections.deque, collections.Counter]
+        ] = collections.OrderedDict()
+
+    @property
+    def available(self) -> bool:
+        return np is not None
+
+    def _corpus(self, key: str) -> tuple[collections.deque, collections.Counter]:
+        corpus = self._corpora.get(key)
+        if corpus is None:
+            corpus = self._corpora[key] = (collections.deque(), collections.Counter())
+            while len(self._corpora) > self.max_sessions:
+                self._corpora.popitem(last=False)
+        self._corpora.move_to_end(key)
+        return corpus
+
+    def _remember(self, key: str, term_sets: list[set[str]]) -> None:
+        docs, df = self._corpus(key)
+        for terms in term_sets:
+            docs.append(terms)
+            df.update(terms)
+            if len(docs) > self.corpus_size:
+                df.subtract(docs.popleft())
+        # Counter.subtract leaves zero entries behind
+        if len(df) > 4 * self.corpus_size:
+            for term in [t for t, n in df.items() if n <= 0]:
+                del df[term]
+
+    def _scores(self, sentences: list[str], tokens: list[list[str]], key: str):
+        """Centroid-similarity TF-IDF score of each sentence, plus boosts."""
+        vocab: dict[str, int] = {}
+        rows, cols = [], []
+        for i, toks in enumerate(tokens):
+            for tok in toks:
+                rows.append(i)
+                cols.append(vocab.setdefault(tok, len(vocab)))
+        n, v = len(sentences), len(vocab)
+        data = np.ones(len(rows), dtype=np.float32)
+        if sparse is not None:
+            counts = sparse.csr_matrix((data, (rows, cols)), shape=(n, v))
+        else:
+            counts = np.zeros((n, v), dtype=np.float32)
+            np.add.at(counts, (rows, cols), 1.0)
+
+        docs, df = self._corpus(key)
+        present = np.zeros(v, dtype=np.float32)
+        for term, idx in vocab.items():
+            present[idx] = df.get(term, 0)
+        # The current sentences count as documents too
+        doc_freq = present + (np.asarray((counts > 0).sum(axis=0)).ravel())
+        total = len(docs) + n
+        idf = np.log((1.0 + total) / (1.0 + doc_freq)) + 1.0
+
+        if sparse is not None:
+            weights = counts.multiply(idf).tocsr()
+            centroid = np.asarray(weights.sum(axis=0)).ravel()
+            norms = np.sqrt(np.asarray(weights.multiply(weights).sum(axis=1)).ravel())
+            sims = np.asarray(weights @ centroid).ravel()
+        else:
+            weights = counts * idf
+            centroid = weights.sum(axis=0)
+            norms = np.linalg.norm(weights, axis=1)
+            sims = weights @ centroid
+        cnorm = float(np.linalg.norm(centroid)) or 1.0
+        scores = sims / (np.maximum(norms, 1e-9) * cnorm)
+
+        for i, sentence in enumerate(sentences):
+            if _KEYWORD_RE.search(sentence):
+                scores[i] += self.keyword_boost
+            if _COUNT_RE.search(sentence):
+                scores[i] += self.count_boost
+        scores[0] += self.position_boost
+        # Results and summaries tend to come last
+        scores[-1] += self.position_boost * 1.5
+        return scores
+
+    def generate(self, text: str, system_prompt: str = "", language: str = "", session_id: str = "") -> str:
+        if np is None or not text.strip():
+            return ""
+        sentences = split_sentences(text)
+        if not sentences:
+            return ""
+        tokens = [[t.lower() for t in _TOKEN_RE.findall(s)] for s in sentences]
+        key = session_id or "default"
+        scores = self._scores(sentences, tokens, key)
+        self._remember(key, [set(t) for t in tokens])
+
+        chosen: list[int] = []
+        words = 0
+        for i in np.argsort(-scores, kind="stable"):
+            length = len(sentences[i].split())
+            if words + length > self.max_words:
+                continue
+            chosen.append(int(i))
+            words += length
+            if len(chosen) >= self.max_sentences:
+                break
+        if not chosen:
+            # Best sentence alone is over budget: cut it at the word limit
+            best = int(np.argmax(scores))
+            return _clean_for_tts(" ".join(sentences[best].split()[: self.max_words]))
+        narration = " ".join(
+            s if s.endswith((".", "!", "?")) else f"{s}."
+            for s in (sentences[i] for i in sorted(chosen))
+        )
+        return _clean_for_tts(narration)
+
+    async def agenerate(
+        self, text: str, system_prompt: str = "", language: str = "", session_id: str = ""
+    ) -> str:
+        # Milliseconds of CPU: cheaper inline than a thread hop
+        return self.generate(text, system_prompt, language, session_id=session_id)
+
+    def check_health(self) -> bool:
+        return np is not None
+
+    def stats(self) -> dict:
+        return {
+            "sessions": len(self._corpora),
+            "sparse": sparse is not None,
+            "corpus_sentences": sum(len(d) for d, _ in self._corpora.values()),
+        }
@@ -1,7 +1,16 @@
-"""Narration generator that orchestrates multiple providers in order."""
+"""Narration generator that orchestrates multiple providers in order.
+
+The chain order adapts per request (see ``routing.ProviderRouter``), a
+complexity score picks the provider tried first (see
+``complexity.ComplexityRouter``), and the async path hedges: when the running provider is slower than its
+hedge delay (its recent p90), the next provider is raced against it and
+the first narration wins.
+"""
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
 import time
 from typing import Iterable
@@ -13,6 +22,12 @@ from .providers import (
     PassthroughNarrator,
 )
 from .claude_code import ClaudeCodeNarrator
+from .complexity import ComplexityRouter, Route
+from .extractive import ExtractiveNarrator
+from .http import ClientPool
+from .memory import ConversationMemory
+from .routing import ProviderRouter
+from .stats import HedgePolicy, ProviderStats
 from .template import TemplateNarrator
 
 logger = logging.getLogger("multikanal.narration.generator")
@@ -21,14 +36,43 @@ logger = logging.getLogger("multikanal.narration.generator")
 class NarrationGenerator:
     """Tries providers in order until one returns narration."""
 
-    def __init__(self, providers: Iterable[BaseNarrator]):
+    def __init__(
+        self,
+        providers: Iterable[BaseNarrator],
+        http_pool: ClientPool | None = None,
+        hedge: HedgePolicy | None = None,
+        router: ProviderRouter | None = None,
+        ewma_alpha: float = 0.3,
+        primary_for: dict[str, str] | None = None,
+        complexity: ComplexityRouter | None = None,
+    ):
         self.providers = list(providers)
+        self.http_pool = http_pool
+        self.hedge = hedge or HedgePolicy(enabled=False)
+        self.router = router or ProviderRouter(enabled=False)
+        # source -> provider tried first for it (e.g. low-priority sources)
+        self.primary_for = primary_for or {}
+        self.complexity = complexity or ComplexityRouter(enabled=False)
+        self.stats = {p.name: ProviderStats(p.name, alpha=ewma_alpha) for p in self.providers}
         self.last_result: dict = {}
+        self.fingerprint = self._fingerprint(self.providers)
+
+    @staticmethod
+    def _fingerprint(providers: list[BaseNarrator]) -> str:
+        """Short hash of provider names and models, used in narration cache keys."""
+        parts = []
+        for p in providers:
+            models = getattr(p, "models", None) or [getattr(p, "model", "")]
+            parts.append(f"{p.name}:{','.join(str(m) for m in models)}")
+        return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()[:12]
 
     @classmethod
     def from_config(cls, narr_cfg: dict) -> "NarrationGenerator":
         providers_cfg = narr_cfg.get("providers") or []
         providers: list[BaseNarrator] = []
+        pool = ClientPool.from_config(narr_cfg.get("http") or {})
+        memory_cfg = narr_cfg.get("memory") or {}
+        primary_for: dict[str, str] = {}
 
         if providers_cfg:
             for p in providers_cfg:
@@ -36,7 +80,12 @@ class NarrationGenerator:
                     continue
                 name = p.get("name")
                 if name == "template":
-                    providers.append(TemplateNarrator())
+                    providers.append(
+                        TemplateNarrator(
+                            templates_file=p.get("templates_file", ""),
+                            fallback=p.get("fallback", True),
+                        )
+                    )
                 elif name == "claude_code":
                     providers.append(
                         ClaudeCodeNarrator(
@@ -60,6 +109,8 @@ class NarrationGenerator:
                             timeout=p.get(
                                 "timeout_seconds", narr_cfg.get("timeout_seconds", 10)
                             ),
+                            pool=pool,
+                            memory=ConversationMemory.from_config(memory_cfg, name="minimax"),
                         )
                     )
                 elif name == "ollama":
@@ -74,8 +125,26 @@ class NarrationGenerator:
                             timeout=p.get(
                                 "timeout_seconds", narr_cfg.get("timeout_seconds", 10)
                             ),
+                            pool=pool,
+                            keep_alive=p.get("keep_alive", "30m"),
+                            api=p.get("api", "chat"),
+                            stream=p.get("stream", True),
+                            preload=p.get("preload", True),
+                            discovery_ttl=p.get("discovery_ttl_seconds", 300),
                         )
                     )
+                elif name == "extractive":
+                    narrator = ExtractiveNarrator(
+                        max_words=narr_cfg.get("max_output_words", 80),
+                        max_sentences=p.get("max_sentences", 3),
+                        corpus_size=p.get("corpus_size", 400),
+                    )
+                    if not narrator.available:
+                        logger.info("numpy not installed, extractive narrator disabled")
+                        continue
+                    providers.append(narrator)
+                    for source in p.get("primary_for") or []:
+                        primary_for[source] = name
                 elif name == "passthrough":
                     providers.append(
                         PassthroughNarrator(
@@ -90,37 +159,270 @@ class NarrationGenerator:
                     models=narr_cfg.get("models", []),
                     max_words=narr_cfg.get("max_output_words", 80),
                     timeout=narr_cfg.get("timeout_seconds", 10),
+                    pool=pool,
                 )
             )
             providers.append(
                 PassthroughNarrator(max_words=narr_cfg.get("max_output_words", 80))
             )
 
-        return cls(providers)
+        routing_cfg = narr_cfg.get("routing") or {}
+        return cls(
+            providers,
+            http_pool=pool,
+            hedge=HedgePolicy.from_config(narr_cfg),
+            router=ProviderRouter.from_config(routing_cfg),
+            ewma_alpha=routing_cfg.get("ewma_alpha", 0.3),
+            primary_for=primary_for,
+            complexity=ComplexityRouter.from_config(
+                narr_cfg.get("complexity") or {},
+                matcher=next((p for p in providers if isinstance(p, TemplateNarrator)), None),
+            ),
+        )
+
+    def route(self, text: str, session_id: str = "", source: str = "") -> Route | None:
+        """Complexity tier for an input; None if off or the source has a primary."""
+        if source in self.primary_for:
+            return None
+        return self.complexity.route(
+            text, session_id, available={p.name for p in self.providers}
+        )
+
+    def _chain(self, source: str, route: Route | None = None) -> list[BaseNarrator]:
+        """Routed provider order, with the source's primary or the tier's provider first."""
+        chain = self.router.order(self.providers, self.stats)
+        primary = self.primary_for.get(source) or (route.tier if route else "")
+        if primary:
+            chain.sort(key=lambda p: p.name != primary)
+        return chain
+
+    def _record_route(self, route: Route | None, t0: float, narration: str) -> None:
+        if route is None:
+            return
+        provider = self.last_result.get("provider", "") if narration else ""
+        self.complexity.record(route, int((time.monotonic() - t0) * 1000), provider)
+        if narration:
+            self.last_result["tier"] = route.tier
+
+    def batch_provider(self, source: str = "", route: Route | None = None) -> BaseNarrator | None:
+        """The first provider for the source/tier if it can narrate batches, else None."""
+        chain = self._chain(source, route)
+        if chain and type(chain[0]).agenerate_batch is not BaseNarrator.agenerate_batch:
+            return chain[0]
+        return None
 
-    def generate(self, text: str, system_prompt: str = "", language: str = "", session_id: str = "") -> str:
+    def record(self, provider: BaseNarrator, latency_ms: int, ok: bool) -> None:
+        # Providers swallow their errors; a failure that took about as long
+        # as the provider's timeout is counted as a timeout
+        timeout = getattr(provider, "timeout", 0) or 0
+        timed_out = not ok and bool(timeout) and latency_ms >= timeout * 900
+        self.stats[provider.name].record(latency_ms, ok, timed_out)
+
+    def generate(
+        self,
+        text: str,
+        system_prompt: str = "",
+        language: str = "",
+        session_id: str = "",
+        source: str = "",
+    ) -> str:
         if not text.strip():
             return ""
 
-        for provider in self.providers:
+        route = self.route(text, session_id, source)
+        started = time.monotonic()
+        for provider in self._chain(source, route):
             narration = ""
             t0 = time.monotonic()
             try:
                 narration = provider.generate(text, system_prompt, language, session_id=session_id)
             except Exception as exc:  # noqa: BLE001
                 logger.debug("provider %s raised: %s", provider.name, exc)
+            latency_ms = int((time.monotonic() - t0) * 1000)
+            self.record(provider, latency_ms, bool(narration))
             if narration:
-                latency_ms = int((time.monotonic() - t0) * 1000)
+                self.stats[provider.name].wins += 1
                 self.last_result = {
                     "provider": provider.name,
                     "latency_ms": latency_ms,
                 }
                 logger.info("narration generated via provider=%s", provider.name)
+                self._record_route(route, started, narration)
                 return narration
 
         logger.warning("all providers failed to generate narration")
+        self._record_route(route, started, "")
+        return ""
+
+    async def agenerate(
+        self,
+        text: str,
+        system_prompt: str = "",
+        language: str = "",
+        session_id: str = "",
+        source: str = "",
+        route: Route | None = None,
+    ) -> str:
+        """Async ``generate`` with hedging; losers are cancelled.
+
+        ``route`` is the input's complexity tier if already computed.
+        """
+        if not text.strip():
+            return ""
+
+        if route is None:
+            route = self.route(text, session_id, source)
+        hedge = self.hedge
+        hedge.requests += 1
+        waiting = self._chain(source, route)
+        # task -> (provider, started, launched as hedge)
+        running: dict[asyncio.Task, tuple[BaseNarrator, float, bool]] = {}
+        hedged = False
+        may_hedge = hedge.enabled
+        t0 = time.monotonic()
+
+        def launch(as_hedge: bool) -> float:
+            provider = waiting.pop(0)
+            task = asyncio.create_task(
+                provider.agenerate(text, system_prompt, language, session_id=session_id)
+            )
+            running[task] = (provider, time.monotonic(), as_hedge)
+            hedge.inflight += 1
+            # Deadline for racing the next provider against this one
+            return time.monotonic() + hedge.delay_for(self.stats[provider.name])
+
+        try:
+            hedge_at = launch(False)
+            while running:
+                timeout = None
+                if may_hedge and waiting:
+                    timeout = max(0.0, hedge_at - time.monotonic())
+                done, _ = await asyncio.wait(
+                    running, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    if hedge.can_hedge():
+                        hedge.hedges += not hedged
+                        hedged = True
+                        logger.info("hedging: racing %s", waiting[0].name)
+                        hedge_at = launch(True)
+                    else:
+                        may_hedge = False
+                    continue
+                for task in done:
+                    provider, started, as_hedge = running.pop(task)
+                    hedge.inflight -= 1
+                    try:
+                        narration = task.result()
+                    except Exception as exc:  # noqa: BLE001
+                        logger.debug("provider %s raised: %s", provider.name, exc)
+                        narration = ""
+                    self.record(
+                        provider, int((time.monotonic() - started) * 1000), bool(narration)
+                    )
+                    if not narration:
+                        # A failed hedge is replaced right away, not after another delay
+                        if as_hedge and waiting and running:
+                            hedge_at = launch(True)
+                        continue
+                    self.stats[provider.name].wins += 1
+                    if hedged:
+                        if as_hedge:
+                            hedge.hedge_wins += 1
+                        else:
+                            hedge.hedge_losses += 1
+                    self.last_result = {
+                        "provider": provider.name,
+                        "latency_ms": int((time.monotonic() - t0) * 1000),
+                        "hedged": hedged,
+                    }
+                    logger.info(
+                        "narration generated via provider=%s%s",
+                        provider.name,
+                        " (hedged)" if hedged else "",
+                    )
+                    self._schedule_folds()
+                    self._record_route(route, t0, narration)
+                    return narration
+                # Everything in flight failed fast: fall through to the next provider
+                if not running and waiting:
+                    hedge_at = launch(False)
+        finally:
+            for task, (provider, _, _) in running.items():
+                task.cancel()
+                hedge.inflight -= 1
+                self.stats[provider.name].record_cancel()
+
+        logger.warning("all providers failed to generate narration")
+        self._record_route(route, t0, "")
+        return ""
+
+    def _schedule_folds(self) -> None:
+        """Fold old turns into rolling summaries in the background."""
+        for provider in self.providers:
+            memory = getattr(provider, "memory", None)
+            for key in memory.due() if memory else []:
+                asyncio.create_task(memory.fold(key, self.summarize))
+
+    async def summarize(self, text: str, max_words: int) -> str:
+        """Summary from the cheapest healthy provider that can summarize.
+
+        Cheapest means lowest EWMA latency; demoted or skipped providers
+        (see the router) are only tried after the healthy ones.
+        """
+        capable = [
+            p for p in self.providers
+            if type(p).asummarize is not BaseNarrator.asummarize
+        ]
+
+        def cost(p: BaseNarrator) -> tuple:
+            stats = self.stats[p.name]
+            verdict, _ = self.router.verdict(stats)
+            return (verdict != "ok", stats.ewma_ms or 0.0)
+
+        for provider in sorted(capable, key=cost):
+            summary = await provider.asummarize(text, max_words)
+            if summary:
+                logger.debug("rolling summary via provider=%s", provider.name)
+                return summary
         return ""
 
+    def routing_stats(self) -> dict:
+        """Per-provider latency/success counters, hedge totals, the last route and per-tier counts."""
+        return {
+            "providers": {name: s.snapshot() for name, s in self.stats.items()},
+            "hedge": self.hedge.snapshot(),
+            "routing": self.router.snapshot(),
+            "complexity": self.complexity.snapshot(),
+            "memory": {
+                p.name: p.memory.stats() for p in self.providers if hasattr(p, "memory")
+            },
+        }
+
+    async def awarm(self) -> None:
+        """Run provider startup hooks (model discovery, preloading) concurrently."""
+        results = await asyncio.gather(
+            *(p.awarm() for p in self.providers), return_exceptions=True
+        )
+        for provider, result in zip(self.providers, results):
+            if isinstance(result, Exception):
+                logger.debug("warm-up of %s failed: %s", provider.name, result)
+
+    async def aclose(self) -> None:
+        if self.http_pool:
+            await self.http_pool.aclose()
+        for provider in self.providers:
+            if hasattr(provider, "memory"):
+                provider.memory.close()
+            if hasattr(provider, "close"):
+                provider.close()
+
+    def history_stats(self) -> dict:
+        """Resident/stored session counts and bytes of each provider's history store."""
+        return {
+            p.name: p.memory.stats()["store"] for p in self.providers if hasattr(p, "memory")
+        }
+
     def reset_history(self, session_id: str = "") -> None:
         for provider in self.providers:
             if hasattr(provider, "clear_history"):
@@ -136,3 +438,10 @@ class NarrationGenerator:
                 ok = False
             status[provider.name] = ok
         return status
+
+    async def ahealth_map(self) -> dict[str, bool]:
+        """Check all providers concurrently."""
+        results = await asyncio.gather(
+            *(p.acheck_health() for p in self.providers), return_exceptions=True
+        )
+        return {p.name: r is True for p, r in zip(self.providers, results)}
@@ -0,0 +1,215 @@
+"""Bounded, optionally persistent store for per-session narration history.
+
+Resident sessions live in an LRU-ordered dict capped at ``max_resident``;
+with a ``db_path`` every write goes through to SQLite as JSON, evicted or
+pre-restart sessions are restored lazily on their next use, and a restart
+keeps context. Expiry is driven by a min-heap of deadlines, so purging
+costs O(expired · log n) instead of a scan over all sessions per call.
+"""
+
+from __future__ import annotations
+
+import collections
+import heapq
+import json
+import logging
+import pathlib
+import sqlite3
+import threading
+import time
+from typing import Callable, Generic, Iterator, Protocol, TypeVar
+
+logger = logging.getLogger("multikanal.narration.history")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    key TEXT PRIMARY KEY,
+    data TEXT NOT NULL,
+    last_active REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS sessions_last_active ON sessions (last_active);
+"""
+
+
+class Record(Protocol):
+    def to_dict(self) -> dict: ...
+
+
+T = TypeVar("T", bound=Record)
+
+
+class HistoryStore(Generic[T]):
+    """LRU front of live session objects with an optional SQLite back.
+
+    ``decode`` rebuilds a session object from the dict its ``to_dict``
+    produced. ``put`` persists a session; ``touch`` only extends its
+    deadline in memory.
+    """
+
+    def __init__(
+        self,
+        decode: Callable[[dict], T],
+        db_path: str = "",
+        max_resident: int = 64,
+        ttl_seconds: float = 4 * 3600,
+    ):
+        self._decode = decode
+        self.max_resident = max(1, max_resident)
+        self.ttl = ttl_seconds
+        self._lock = threading.RLock()
+        self._front: collections.OrderedDict[str, T] = collections.OrderedDict()
+        self._sizes: dict[str, int] = {}
+        self._deadline: dict[str, float] = {}
+        # (deadline, key); stale entries are skipped when popped
+        self._heap: list[tuple[float, str]] = []
+        self._conn: sqlite3.Connection | None = None
+        if db_path:
+            path = pathlib.Path(db_path).expanduser()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(
+                str(path), check_same_thread=False, isolation_level=None, timeout=10
+            )
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+        self._puts = 0
+        self.restores = 0
+        self.evictions = 0
+        self.expired = 0
+
+    def __len__(self) -> int:
+        return len(self._front)
+
+    def _schedule(self, key: str) -> None:
+        deadline = time.time() + self.ttl
+        self._deadline[key] = deadline
+        heapq.heappush(self._heap, (deadline, key))
+        # Every touch leaves a stale entry behind; rebuild when they dominate
+        if len(self._heap) > 4 * len(self._deadline) + 64:
+            self._heap = [(d, k) for k, d in self._deadline.items()]
+            heapq.heapify(self._heap)
+
+    def _drop(self, key: str) -> None:
+        self._front.pop(key, None)
+        self._sizes.pop(key, None)
+        self._deadline.pop(key, None)
+
+    def _admit(self, key: str, value: T, size: int) -> None:
+        self._front[key] = value
+        self._front.move_to_end(key)
+        self._sizes[key] = size
+        self._schedule(key)
+        while len(self._front) > self.max_resident:
+            old, _ = self._front.popitem(last=False)
+            self._sizes.pop(old, None)
+            self._deadline.pop(old, None)
+            self.evictions += 1
+
+    def purge(self) -> int:
+        """Expire resident sessions whose deadline has passed."""
+        now = time.time()
+        removed = 0
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                deadline, key = heapq.heappop(self._heap)
+                if self._deadline.get(key) != deadline:
+                    continue
+                self._drop(key)
+                removed += 1
+            if removed and self._conn:
+                self._conn.execute(
+                    "DELETE FROM sessions WHERE last_active < ?", (now - self.ttl,)
+                )
+        self.expired += removed
+        return removed
+
+    def get(self, key: str) -> T | None:
+        """Resident session, else restored from SQLite, else None."""
+        with self._lock:
+            value = self._front.get(key)
+            if value is not None:
+                self._front.move_to_end(key)
+                return value
+            if not self._conn:
+                return None
+            row = self._conn.execute(
+                "SELECT data FROM sessions WHERE key = ? AND last_active >= ?",
+                (key, time.time() - self.ttl),
+            ).fetchone()
+            if not row:
+                return None
+            try:
+                value = self._decode(json.loads(row[0]))
+            except (ValueError, TypeError) as exc:
+                logger.debug("dropping unreadable history for %s: %s", key, exc)
+                self._conn.execute("DELETE FROM sessions WHERE key = ?", (key,))
+                return None
+            self._admit(key, value, len(row[0]))
+            self.restores += 1
+        logger.debug("restored history for session %s", key)
+        return value
+
+    def put(self, key: str, value: T) -> None:
+        """Store (and persist) a session, making it most recently used."""
+        data = json.dumps(value.to_dict(), ensure_ascii=False)
+        with self._lock:
+            self._admit(key, value, len(data))
+            if self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO sessions (key, data, last_active) VALUES (?, ?, ?)",
+                    (key, data, time.time()),
+                )
+                self._puts += 1
+                # Amortised cleanup of sessions that expired while not resident
+                if self._puts % 100 == 0:
+                    self._conn.execute(
+                        "DELETE FROM sessions WHERE last_active < ?", (time.time() - self.ttl,)
+                    )
+
+    def touch(self, key: str) -> None:
+        with self._lock:
+            if key in self._front:
+                self._front.move_to_end(key)
+                self._schedule(key)
+
+    def items(self) -> Iterator[tuple[str, T]]:
+        with self._lock:
+            return iter(list(self._front.items()))
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._drop(key)
+            if self._conn:
+                self._conn.execute("DELETE FROM sessions WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._front.clear()
+            self._sizes.clear()
+            self._deadline.clear()
+            self._heap.clear()
+            if self._conn:
+                self._conn.execute("DELETE FROM sessions")
+
+    def stats(self) -> dict:
+        with self._lock:
+            stored = (
+                self._conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
+                if self._conn
+                else len(self._front)
+            )
+            return {
+                "persistent": self._conn is not None,
+                "resident_sessions": len(self._front),
+                "resident_bytes": sum(self._sizes.values()),
+                "max_resident": self.max_resident,
+                "stored_sessions": stored,
+                "restores": self.restores,
+                "evictions": self.evictions,
+                "expired": self.expired,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,90 @@
+"""Long-lived HTTP clients shared by the narration providers.
+
+One ``httpx.AsyncClient`` (and one sync ``httpx.Client`` for the CLI and
+other thread-based callers) per endpoint origin, so narrations reuse
+warm keep-alive connections instead of redoing DNS and TLS every call.
+HTTP/2 is enabled when the ``h2`` package is installed
+(``pip install multikanal[http2]``).
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import logging
+import threading
+from urllib.parse import urlsplit
+
+import httpx
+
+logger = logging.getLogger("multikanal.narration.http")
+
+HTTP2 = importlib.util.find_spec("h2") is not None
+
+
+def _origin(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+class ClientPool:
+    """Per-origin sync and async httpx clients with bounded connections."""
+
+    def __init__(
+        self,
+        max_connections: int = 8,
+        max_keepalive: int = 4,
+        keepalive_expiry: float = 60.0,
+    ):
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._lock = threading.Lock()
+        self._async: dict[str, httpx.AsyncClient] = {}
+        self._sync: dict[str, httpx.Client] = {}
+
+    @classmethod
+    def from_config(cls, http_cfg: dict) -> "ClientPool":
+        return cls(
+            max_connections=http_cfg.get("max_connections", 8),
+            max_keepalive=http_cfg.get("max_keepalive", 4),
+            keepalive_expiry=http_cfg.get("keepalive_expiry_seconds", 60),
+        )
+
+    def aclient(self, url: str) -> httpx.AsyncClient:
+        """Async client for the URL's origin (created in the running loop)."""
+        origin = _origin(url)
+        client = self._async.get(origin)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(limits=self._limits, http2=HTTP2)
+            self._async[origin] = client
+            logger.debug("async client for %s (http2=%s)", origin, HTTP2)
+        return client
+
+    def client(self, url: str) -> httpx.Client:
+        """Thread-safe sync client for the URL's origin."""
+        origin = _origin(url)
+        with self._lock:
+            client = self._sync.get(origin)
+            if client is None or client.is_closed:
+                client = httpx.Client(limits=self._limits, http2=HTTP2)
+                self._sync[origin] = client
+        return client
+
+    async def aclose(self) -> None:
+        """Close every client (call from the daemon lifespan on shutdown)."""
+        clients, self._async = list(self._async.values()), {}
+        for client in clients:
+            await client.aclose()
+        self.close()
+
+    def close(self) -> None:
+        with self._lock:
+            clients, self._sync = list(self._sync.values()), {}
+        for client in clients:
+            client.close()
+
+
+# Shared by all providers unless one is injected
+default_pool = ClientPool()
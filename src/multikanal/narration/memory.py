@@ -0,0 +1,217 @@
+"""Per-session conversation memory for chat-style narration providers.
+
+``window`` mode keeps the last ``max_turns`` exchanges verbatim, like the
+original history deque. ``summary`` mode keeps only ``keep_turns``
+exchanges verbatim and folds older ones into a rolling summary, so the
+prompt stays roughly constant in size however long a session runs.
+Folding happens off the critical path (``fold`` is awaited in a
+background task); until a fold succeeds the older turns are sent
+verbatim, so no context is lost.
+
+Sessions are kept in a ``HistoryStore`` (LRU-bounded, optionally backed
+by SQLite so context survives a restart).
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable
+
+from .history import HistoryStore
+
+logger = logging.getLogger("multikanal.narration.memory")
+
+SUMMARY_PREFIX = "Bisheriger Verlauf (Zusammenfassung):"
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token)."""
+    return (len(text) + 3) // 4
+
+
+def _message_tokens(messages: list[dict]) -> int:
+    return sum(estimate_tokens(m.get("content", "")) for m in messages)
+
+
+@dataclass
+class Session:
+    summary: str = ""
+    # Recent exchanges, sent verbatim
+    turns: list[dict] = field(default_factory=list)
+    # Older exchanges waiting to be folded into the summary
+    pending: list[dict] = field(default_factory=list)
+    # Token sizes of the last max_turns exchanges, i.e. what window mode would send
+    window_tokens: list[int] = field(default_factory=list)
+    tokens_saved: int = 0
+    last_active: float = field(default_factory=time.time)
+
+    def to_dict(self) -> dict:
+        return dataclasses.asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Session":
+        names = {f.name for f in dataclasses.fields(cls)}
+        return cls(**{k: v for k, v in data.items() if k in names})
+
+
+class ConversationMemory:
+    """Session histories in ``window`` or ``summary`` mode."""
+
+    def __init__(
+        self,
+        mode: str = "window",
+        max_turns: int = 6,
+        keep_turns: int = 2,
+        summary_words: int = 60,
+        session_ttl: float = 4 * 3600,
+        store: HistoryStore[Session] | None = None,
+    ):
+        self.mode = mode if mode in ("window", "summary") else "window"
+        self.max_turns = max_turns
+        self.keep_turns = min(keep_turns, max_turns) if self.mode == "summary" else max_turns
+        self.summary_words = summary_words
+        self._store = store if store is not None else HistoryStore(
+            Session.from_dict, ttl_seconds=session_ttl
+        )
+        self._folding: set[str] = set()
+        self.folds = 0
+        self.fold_failures = 0
+
+    @classmethod
+    def from_config(cls, memory_cfg: dict, name: str = "") -> "ConversationMemory":
+        """Build from the ``narration.memory`` section; ``name`` keys the DB file."""
+        ttl = memory_cfg.get("session_ttl_seconds", 4 * 3600)
+        db_path = ""
+        if memory_cfg.get("persist", True) and memory_cfg.get("path"):
+            db_path = f"{memory_cfg['path'].rstrip('/')}/history-{name or 'default'}.sqlite"
+        return cls(
+            mode=memory_cfg.get("mode", "window"),
+            max_turns=memory_cfg.get("max_turns", 6),
+            keep_turns=memory_cfg.get("keep_turns", 2),
+            summary_words=memory_cfg.get("summary_words", 60),
+            session_ttl=ttl,
+            store=HistoryStore(
+                Session.from_dict,
+                db_path=db_path,
+                max_resident=memory_cfg.get("max_resident_sessions", 64),
+                ttl_seconds=ttl,
+            ),
+        )
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def _session(self, key: str) -> Session:
+        self._store.purge()
+        session = self._store.get(key)
+        if session is None:
+            session = Session()
+            self._store.put(key, session)
+        else:
+            self._store.touch(key)
+        session.last_active = time.time()
+        return session
+
+    def clear(self, key: str = "") -> None:
+        if key:
+            self._store.delete(key)
+        else:
+            self._store.clear()
+
+    def messages(self, key: str, system_prompt: str) -> list[dict]:
+        """Prompt prefix for a session: system prompt (+ summary) and history."""
+        session = self._session(key)
+        system = system_prompt or ""
+        if session.summary:
+            system = f"{system}\n\n{SUMMARY_PREFIX} {session.summary}".strip()
+        messages = [{"role": "system", "content": system}]
+        messages.extend(session.pending)
+        messages.extend(session.turns)
+        if self.mode == "summary" and session.summary:
+            sent = _message_tokens(messages) - estimate_tokens(system_prompt or "")
+            saved = sum(session.window_tokens) - sent
+            if saved > 0:
+                session.tokens_saved += saved
+                logger.debug(
+                    "session %s: prompt history ~%d tokens (~%d saved, %d total)",
+                    key, sent, saved, session.tokens_saved,
+                )
+        return messages
+
+    def append(self, key: str, user: str, assistant: str) -> None:
+        session = self._session(key)
+        exchange = [
+            {"role": "user", "content": user},
+            {"role": "assistant", "content": assistant},
+        ]
+        session.turns.extend(exchange)
+        session.window_tokens.append(_message_tokens(exchange))
+        del session.window_tokens[: -self.max_turns]
+        overflow = len(session.turns) - self.keep_turns * 2
+        if overflow > 0:
+            old, session.turns = session.turns[:overflow], session.turns[overflow:]
+            if self.mode == "summary":
+                session.pending.extend(old)
+                # Folding keeps failing: fall back to a plain window
+                del session.pending[: -self.max_turns * 2]
+        self._store.put(key, session)
+
+    def due(self) -> list[str]:
+        """Sessions with turns waiting to be folded."""
+        if self.mode != "summary":
+            return []
+        return [k for k, s in self._store.items() if s.pending and k not in self._folding]
+
+    async def fold(self, key: str, summarize: Callable[[str, int], Awaitable[str]]) -> bool:
+        """Fold a session's pending turns into its summary via ``summarize``."""
+        session = self._store.get(key)
+        if session is None or not session.pending or key in self._folding:
+            return False
+        self._folding.add(key)
+        batch = list(session.pending)
+        lines = [f"{m['role']}: {m['content']}" for m in batch]
+        if session.summary:
+            lines.insert(0, f"{SUMMARY_PREFIX} {session.summary}")
+        try:
+            summary = await summarize("\n".join(lines), self.summary_words)
+        except Exception as exc:  # noqa: BLE001
+            logger.debug("summary for session %s failed: %s", key, exc)
+            summary = ""
+        finally:
+            self._folding.discard(key)
+        if not summary:
+            self.fold_failures += 1
+            return False
+        if self._store.get(key) is not session:
+            # Cleared, expired or evicted and restored meanwhile: writing the
+            # stale object back would lose the newer turns
+            logger.debug("session %s changed during its fold, dropping the summary", key)
+            return False
+        before = _message_tokens(batch) + estimate_tokens(session.summary)
+        session.summary = summary.strip()
+        # Turns appended meanwhile stay pending for the next fold
+        del session.pending[: len(batch)]
+        self._store.put(key, session)
+        self.folds += 1
+        logger.info(
+            "session %s: folded %d messages (~%d tokens) into ~%d-token summary, ~%d tokens saved so far",
+            key, len(batch), before, estimate_tokens(session.summary), session.tokens_saved,
+        )
+        return True
+
+    def stats(self) -> dict:
+        sessions = [s for _, s in self._store.items()]
+        return {
+            "mode": self.mode,
+            "summarized_sessions": sum(1 for s in sessions if s.summary),
+            "folds": self.folds,
+            "fold_failures": self.fold_failures,
+            "tokens_saved": sum(s.tokens_saved for s in sessions),
+            "store": self._store.stats(),
+        }
+
+    def close(self) -> None:
+        self._store.close()
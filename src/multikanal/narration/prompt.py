@@ -3,6 +3,7 @@
 import logging
 import pathlib
 import threading
+from typing import Callable
 
 logger = logging.getLogger("multikanal.narration.prompt")
 
@@ -11,11 +12,13 @@ class PromptWatcher:
     """Watches a prompt file and reloads it on change.
 
     Uses watchdog for file system monitoring. Falls back to
-    manual reload if watchdog is unavailable.
+    manual reload if watchdog is unavailable. ``on_change`` is called
+    with the new content after every (re)load.
     """
 
-    def __init__(self, prompt_path: str):
+    def __init__(self, prompt_path: str, on_change: Callable[[str], None] | None = None):
         self._path = pathlib.Path(prompt_path) if prompt_path else None
+        self._on_change = on_change
         self._prompt: str = ""
         self._lock = threading.Lock()
         self._observer = None
@@ -31,6 +34,8 @@ class PromptWatcher:
             with self._lock:
                 self._prompt = content
             logger.info("loaded prompt from %s (%d chars)", self._path, len(content))
+            if self._on_change:
+                self._on_change(content)
         except Exception as e:
             logger.warning("failed to load prompt: %s", e)
 
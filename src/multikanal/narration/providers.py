@@ -1,17 +1,23 @@
-"""Narration provider interfaces and implementations (Minimax, Ollama)."""
+"""Narration provider interfaces and implementations (Minimax, Ollama).
+
+HTTP providers implement ``agenerate`` on pooled async clients (see
+``http.ClientPool``); ``generate`` is the same request on the pooled sync
+client for thread-based callers.
+"""
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import re
 import time
 from abc import ABC, abstractmethod
-from collections import deque
 from typing import Iterable
 
-import re
-
-import httpx
+from .batch import batch_prompt, parse_batch
+from .http import ClientPool, default_pool
+from .memory import ConversationMemory
 
 logger = logging.getLogger("multikanal.narration.providers")
 
@@ -30,6 +36,15 @@ def _clean_for_tts(text: str) -> str:
     return text.strip()
 
 
+def summary_prompt(max_words: int) -> str:
+    """System prompt for folding conversation turns into a rolling summary."""
+    return (
+        f"Fasse den folgenden Gesprächsverlauf in höchstens {max_words} Wörtern "
+        "zusammen. Behalte Dateinamen, Befehle, Fehler und Entscheidungen. "
+        "Nur die Zusammenfassung, ohne Einleitung."
+    )
+
+
 class BaseNarrator(ABC):
     """Abstract narration provider."""
 
@@ -46,6 +61,28 @@ class BaseNarrator(ABC):
     @abstractmethod
     def check_health(self) -> bool: ...
 
+    async def agenerate(
+        self, text: str, system_prompt: str = "", language: str = "", session_id: str = ""
+    ) -> str:
+        """Async generate; providers without native async run in a thread."""
+        return await asyncio.to_thread(
+            self.generate, text, system_prompt, language, session_id=session_id
+        )
+
+    async def acheck_health(self) -> bool:
+        return await asyncio.to_thread(self.check_health)
+
+    async def awarm(self) -> None:
+        """Startup hook (model discovery, preloading); no-op by default."""
+
+    async def asummarize(self, text: str, max_words: int) -> str:
+        """Stateless summary of ``text``; "" if the provider cannot summarize."""
+        return ""
+
+    async def agenerate_batch(self, texts: list[str], system_prompt: str = "") -> list[str] | None:
+        """One narration per text from a single request; None if unsupported or unparsable."""
+        return None
+
 
 class MinimaxNarrator(BaseNarrator):
     def __init__(
@@ -56,99 +93,150 @@ class MinimaxNarrator(BaseNarrator):
         temperature: float = 0.6,
         max_tokens: int = 240,
         timeout: int = 6,
+        pool: ClientPool | None = None,
+        memory: ConversationMemory | None = None,
     ):
         super().__init__("minimax")
+        self._pool = pool or default_pool
         self.api_key = api_key or ""
         self.endpoint = endpoint
         self.model = model
         self.temperature = temperature
         self.max_tokens = max_tokens
         self.timeout = timeout
-        self._histories: dict[str, deque] = {}
-        self._history_maxlen: int = 6  # max message pairs per session
-        self._last_active: dict[str, float] = {}
-        self._session_ttl: float = 4 * 3600  # purge after 4h inactivity
-
-    def _purge_old_sessions(self) -> None:
-        now = time.time()
-        expired = [k for k, t in self._last_active.items() if now - t > self._session_ttl]
-        for k in expired:
-            self._histories.pop(k, None)
-            self._last_active.pop(k, None)
+        # Last 6 exchanges per session, purged after 4h inactivity, by default
+        self.memory = memory if memory is not None else ConversationMemory()
 
     def clear_history(self, session_id: str = "") -> None:
-        if session_id:
-            self._histories.pop(session_id, None)
-            self._last_active.pop(session_id, None)
-        else:
-            self._histories.clear()
-            self._last_active.clear()
-
-    def generate(self, text: str, system_prompt: str = "", language: str = "", session_id: str = "") -> str:
-        if not self.api_key or not self.endpoint or not self.model or not text.strip():
-            return ""
+        self.memory.clear(session_id)
 
-        key = session_id or "default"
-        self._purge_old_sessions()
-        self._last_active[key] = time.time()
-        history = self._histories.setdefault(key, deque(maxlen=self._history_maxlen * 2))
-
-        messages = [{"role": "system", "content": system_prompt or ""}]
-        messages.extend(list(history))
-        messages.append({"role": "user", "content": text})
-
-        payload = {
+    def _payload(self, messages: list[dict]) -> dict:
+        return {
             "model": self.model,
             "max_tokens": self.max_tokens,
             "temperature": self.temperature,
             "messages": messages,
         }
 
-        headers = {"Authorization": f"Bearer {self.api_key}"}
+    def _prepare(self, text: str, system_prompt: str, session_id: str) -> tuple[dict, str]:
+        key = session_id or "default"
+        messages = self.memory.messages(key, system_prompt)
+        messages.append({"role": "user", "content": text})
+        return self._payload(messages), key
+
+    @property
+    def _headers(self) -> dict:
+        return {"Authorization": f"Bearer {self.api_key}"}
+
+    def _configured(self, text: str) -> bool:
+        return bool(self.api_key and self.endpoint and self.model and text.strip())
 
+    def generate(self, text: str, system_prompt: str = "", language: str = "", session_id: str = "") -> str:
+        if not self._configured(text):
+            return ""
+        payload, key = self._prepare(text, system_prompt, session_id)
         try:
-            resp = httpx.post(
-                self.endpoint,
-                headers=headers,
-                json=payload,
-                timeout=self.timeout,
+            resp = self._pool.client(self.endpoint).post(
+                self.endpoint, headers=self._headers, json=payload, timeout=self.timeout
             )
             resp.raise_for_status()
-            data = resp.json()
-            # Minimax responses can vary; try common shapes
-            if "choices" in data and data["choices"]:
-                choice = data["choices"][0]
-                # Various possible fields
-                msg = choice.get("message") or choice.get("delta") or {}
-                content = msg.get("content") or msg.get("text") or ""
-                if not content and "messages" in choice:
-                    msgs = choice.get("messages") or []
-                    if isinstance(msgs, list) and msgs:
-                        content = msgs[0].get("content") or msgs[0].get("text") or ""
-                if not content and "output_text" in choice:
-                    content = choice["output_text"]
-                if isinstance(content, list):
-                    content = "".join(
-                        c.get("text", "") if isinstance(c, dict) else str(c)
-                        for c in content
-                    )
-                if isinstance(content, str) and content.strip():
-                    content = _clean_for_tts(content)
-                    if content:
-                        history.append({"role": "user", "content": text})
-                        history.append({"role": "assistant", "content": content})
-                        return content
-
-            # Fallback: try top-level text/content
-            for key in ("text", "content", "output", "output_text"):
-                if key in data and isinstance(data[key], str) and data[key].strip():
-                    cleaned = _clean_for_tts(data[key])
-                    if cleaned:
-                        return cleaned
+            return self._parse(resp.json(), text, key)
         except Exception as exc:  # noqa: BLE001
             logger.warning("minimax failed: %s", exc)
             return ""
 
+    async def agenerate(
+        self, text: str, system_prompt: str = "", language: str = "", session_id: str = ""
+    ) -> str:
+        if not self._configured(text):
+            return ""
+        payload, key = self._prepare(text, system_prompt, session_id)
+        try:
+            resp = await self._pool.aclient(self.endpoint).post(
+                self.endpoint, headers=self._headers, json=payload, timeout=self.timeout
+            )
+            resp.raise_for_status()
+            return self._parse(resp.json(), text, key)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("minimax failed: %s", exc)
+            return ""
+
+    async def asummarize(self, text: str, max_words: int) -> str:
+        if not self._configured(text):
+            return ""
+        payload = self._payload(
+            [
+                {"role": "system", "content": summary_prompt(max_words)},
+                {"role": "user", "content": text},
+            ]
+        )
+        try:
+            resp = await self._pool.aclient(self.endpoint).post(
+                self.endpoint, headers=self._headers, json=payload, timeout=self.timeout
+            )
+            resp.raise_for_status()
+            return self._parse(resp.json(), text, None)
+        except Exception as exc:  # noqa: BLE001
+            logger.debug("minimax summary failed: %s", exc)
+            return ""
+
+    async def agenerate_batch(self, texts: list[str], system_prompt: str = "") -> list[str] | None:
+        if not self._configured("\n".join(texts)):
+            return None
+        payload = self._payload(
+            [
+                {"role": "system", "content": system_prompt or ""},
+                {"role": "user", "content": batch_prompt(texts, max(20, self.max_tokens // 3))},
+            ]
+        )
+        payload["max_tokens"] = self.max_tokens * len(texts)
+        try:
+            resp = await self._pool.aclient(self.endpoint).post(
+                self.endpoint,
+                headers=self._headers,
+                json=payload,
+                timeout=self.timeout * 2,
+            )
+            resp.raise_for_status()
+            reply = self._parse(resp.json(), "\n".join(texts), None)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("minimax batch failed: %s", exc)
+            return None
+        items = parse_batch(reply, len(texts))
+        return [_clean_for_tts(item) for item in items] if items else None
+
+    def _parse(self, data: dict, text: str, key: str | None) -> str:
+        # Minimax responses can vary; try common shapes
+        if "choices" in data and data["choices"]:
+            choice = data["choices"][0]
+            # Various possible fields
+            msg = choice.get("message") or choice.get("delta") or {}
+            content = msg.get("content") or msg.get("text") or ""
+            if not content and "messages" in choice:
+                msgs = choice.get("messages") or []
+                if isinstance(msgs, list) and msgs:
+                    content = msgs[0].get("content") or msgs[0].get("text") or ""
+            if not content and "output_text" in choice:
+                content = choice["output_text"]
+            if isinstance(content, list):
+                content = "".join(
+                    c.get("text", "") if isinstance(c, dict) else str(c)
+                    for c in content
+                )
+            if isinstance(content, str) and content.strip():
+                content = _clean_for_tts(content)
+                if content:
+                    if key is not None:
+                        self.memory.append(key, text, content)
+                    return content
+
+        # Fallback: try top-level text/content
+        for key in ("text", "content", "output", "output_text"):
+            if key in data and isinstance(data[key], str) and data[key].strip():
+                cleaned = _clean_for_tts(data[key])
+                if cleaned:
+                    return cleaned
+
         logger.warning("minimax returned empty response for %d chars input", len(text))
         return ""
 
@@ -156,42 +244,216 @@ class MinimaxNarrator(BaseNarrator):
         if not self.api_key or not self.endpoint:
             return False
         try:
-            # Use /v1/models endpoint for health check instead of chat endpoint
-            base = self.endpoint.rsplit("/v1/", 1)[0] + "/v1/models"
-            resp = httpx.get(
-                base,
-                headers={"Authorization": f"Bearer {self.api_key}"},
-                timeout=3,
+            resp = self._pool.client(self._models_url).get(
+                self._models_url, headers=self._headers, timeout=3
+            )
+            return resp.status_code < 500
+        except Exception:  # noqa: BLE001
+            return False
+
+    async def acheck_health(self) -> bool:
+        if not self.api_key or not self.endpoint:
+            return False
+        try:
+            resp = await self._pool.aclient(self._models_url).get(
+                self._models_url, headers=self._headers, timeout=3
             )
             return resp.status_code < 500
         except Exception:  # noqa: BLE001
             return False
 
+    @property
+    def _models_url(self) -> str:
+        # Use /v1/models endpoint for health check instead of chat endpoint
+        return self.endpoint.rsplit("/v1/", 1)[0] + "/v1/models"
+
 
 class OllamaNarrator(BaseNarrator):
+    """Local Ollama models, tried in order.
+
+    Installed models are discovered via ``/api/tags`` and the list is
+    refreshed in the background every ``discovery_ttl`` seconds, so models
+    that are not pulled are skipped instantly instead of each burning a
+    full timeout. ``keep_alive`` is sent with every request (and with the
+    startup preload from ``awarm``) to keep the model resident. ``api``
+    selects ``/api/chat`` or ``/api/generate``; with ``stream`` the answer
+    is read incrementally, the timeout applies between chunks, and reading
+    stops at the first sentence end past ``max_words``.
+    """
+
     def __init__(
         self,
         ollama_url: str = "http://localhost:11434",
         models: Iterable[str] | None = None,
         max_words: int = 80,
         timeout: int = 10,
+        pool: ClientPool | None = None,
+        keep_alive: str = "30m",
+        api: str = "chat",
+        stream: bool = True,
+        preload: bool = True,
+        discovery_ttl: float = 300,
     ):
         super().__init__("ollama")
+        self._pool = pool or default_pool
         self.ollama_url = ollama_url.rstrip("/")
         self.models = list(models or ["llama3.1:8b", "phi4", "mistral-nemo"])
         self.max_words = max_words
         self.timeout = timeout
+        self.keep_alive = keep_alive
+        self.api = api if api in ("chat", "generate") else "chat"
+        self.stream = stream
+        self.preload = preload
+        self.discovery_ttl = discovery_ttl
+        # Normalized names from /api/tags; None until discovery has succeeded
+        self._installed: set[str] | None = None
+        self._checked_at = 0.0
+        self._refresh_task: asyncio.Task | None = None
+
+    # -- model discovery ---------------------------------------------------
+
+    @staticmethod
+    def _norm(model: str) -> str:
+        return model if ":" in model else f"{model}:latest"
+
+    def _set_installed(self, data: dict) -> None:
+        names = {
+            self._norm(m.get("name") or m.get("model") or "")
+            for m in data.get("models") or []
+        }
+        missing = [m for m in self.models if self._norm(m) not in names]
+        if missing and (self._installed is None or self._installed != names):
+            logger.info("ollama models not installed, skipping: %s", ", ".join(missing))
+        self._installed = names
+
+    def _discovery_stale(self) -> bool:
+        return time.monotonic() - self._checked_at > self.discovery_ttl
+
+    def candidates(self) -> list[str]:
+        """Configured models that are installed (all of them if unknown)."""
+        if self._installed is None:
+            return list(self.models)
+        return [m for m in self.models if self._norm(m) in self._installed]
+
+    def refresh_models(self) -> bool:
+        self._checked_at = time.monotonic()
+        try:
+            resp = self._pool.client(self.ollama_url).get(
+                f"{self.ollama_url}/api/tags", timeout=3
+            )
+            resp.raise_for_status()
+            self._set_installed(resp.json())
+            return True
+        except Exception as exc:  # noqa: BLE001
+            logger.debug("ollama model discovery failed: %s", exc)
+            return False
 
-    def generate(self, text: str, system_prompt: str = "", language: str = "", session_id: str = "") -> str:
-        if not text.strip():
-            return ""
+    async def arefresh_models(self) -> bool:
+        self._checked_at = time.monotonic()
+        try:
+            resp = await self._pool.aclient(self.ollama_url).get(
+                f"{self.ollama_url}/api/tags", timeout=3
+            )
+            resp.raise_for_status()
+            self._set_installed(resp.json())
+            return True
+        except Exception as exc:  # noqa: BLE001
+            logger.debug("ollama model discovery failed: %s", exc)
+            return False
+
+    def _refresh_in_background(self) -> None:
+        if not self._discovery_stale():
+            return
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self.arefresh_models())
+
+    async def awarm(self) -> None:
+        """Discover installed models and preload the first one."""
+        await self.arefresh_models()
+        if not self.preload:
+            return
+        for model in self.candidates()[:1]:
+            body: dict = {"model": model}
+            if self.keep_alive:
+                body["keep_alive"] = self.keep_alive
+            t0 = time.monotonic()
+            try:
+                # A request without a prompt only loads the model
+                resp = await self._pool.aclient(self.ollama_url).post(
+                    f"{self.ollama_url}/api/generate", json=body, timeout=max(self.timeout, 120)
+                )
+                resp.raise_for_status()
+                logger.info(
+                    "ollama model %s preloaded in %.1fs (keep_alive=%s)",
+                    model,
+                    time.monotonic() - t0,
+                    self.keep_alive or "default",
+                )
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("ollama preload of %s failed: %s", model, exc)
 
-        user_prompt = (
+    # -- generation ----------------------------------------------------------
+
+    def _user_prompt(self, text: str) -> str:
+        return (
             f"Agent-Ausgabe:\n\n{text}\n\n"
             f"Erstelle eine Audio-Erklärung (maximal {self.max_words} Wörter)."
         )
 
-        for model in self.models:
+    def _request(
+        self, model: str, system_prompt: str, user_prompt: str, items: int = 1
+    ) -> tuple[str, dict]:
+        """URL and JSON body for the configured API."""
+        body: dict = {
+            "model": model,
+            "stream": self.stream,
+            "options": {
+                "num_predict": self.max_words * 4 * items,
+                "temperature": 0.7,
+            },
+        }
+        if self.keep_alive:
+            body["keep_alive"] = self.keep_alive
+        if self.api == "chat":
+            messages = []
+            if system_prompt:
+                messages.append({"role": "system", "content": system_prompt})
+            messages.append({"role": "user", "content": user_prompt})
+            body["messages"] = messages
+            return f"{self.ollama_url}/api/chat", body
+        full_prompt = user_prompt
+        if system_prompt:
+            full_prompt = f"{system_prompt}\n\n{user_prompt}"
+        body["prompt"] = full_prompt
+        return f"{self.ollama_url}/api/generate", body
+
+    @staticmethod
+    def _content(data: dict) -> str:
+        message = data.get("message") or {}
+        return message.get("content") or data.get("response") or ""
+
+    def _feed(self, parts: list[str], line: str, early_stop: bool = True) -> bool:
+        """Add one streamed JSON line; True once the answer is complete."""
+        if not line.strip():
+            return False
+        data = json.loads(line)
+        parts.append(self._content(data))
+        if data.get("done"):
+            return True
+        if not early_stop:
+            return False
+        # Past the word budget: stop at the next sentence end
+        text = "".join(parts).rstrip()
+        return text.endswith((".", "!", "?")) and len(text.split()) >= self.max_words
+
+    def generate(self, text: str, system_prompt: str = "", language: str = "", session_id: str = "") -> str:
+        if not text.strip():
+            return ""
+        if self._discovery_stale():
+            self.refresh_models()
+
+        user_prompt = self._user_prompt(text)
+        for model in self.candidates():
             try:
                 result = self._call_ollama(model, system_prompt, user_prompt)
                 if result:
@@ -207,36 +469,87 @@ class OllamaNarrator(BaseNarrator):
         logger.warning("all ollama models failed")
         return ""
 
+    async def agenerate(
+        self, text: str, system_prompt: str = "", language: str = "", session_id: str = ""
+    ) -> str:
+        if not text.strip():
+            return ""
+        self._refresh_in_background()
+
+        user_prompt = self._user_prompt(text)
+        for model in self.candidates():
+            try:
+                result = await self._acall_ollama(model, system_prompt, user_prompt)
+                if result:
+                    logger.info(
+                        "narration generated with model=%s (%d chars)", model, len(result)
+                    )
+                    return result
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("ollama model %s failed: %s", model, exc)
+                continue
+        logger.warning("all ollama models failed")
+        return ""
+
     def _call_ollama(self, model: str, system_prompt: str, user_prompt: str) -> str:
-        # Use /api/generate instead of /api/chat (more reliable)
-        full_prompt = user_prompt
-        if system_prompt:
-            full_prompt = f"{system_prompt}\n\n{user_prompt}"
+        url, body = self._request(model, system_prompt, user_prompt)
+        client = self._pool.client(url)
+        if not self.stream:
+            resp = client.post(url, json=body, timeout=self.timeout)
+            resp.raise_for_status()
+            return self._content(resp.json()).strip()
+        parts: list[str] = []
+        with client.stream("POST", url, json=body, timeout=self.timeout) as resp:
+            resp.raise_for_status()
+            for line in resp.iter_lines():
+                if self._feed(parts, line):
+                    break
+        return "".join(parts).strip()
+
+    async def _acall_ollama(
+        self, model: str, system_prompt: str, user_prompt: str, items: int = 1
+    ) -> str:
+        url, body = self._request(model, system_prompt, user_prompt, items)
+        client = self._pool.aclient(url)
+        if not self.stream:
+            resp = await client.post(url, json=body, timeout=self.timeout)
+            resp.raise_for_status()
+            return self._content(resp.json()).strip()
+        parts: list[str] = []
+        async with client.stream("POST", url, json=body, timeout=self.timeout) as resp:
+            resp.raise_for_status()
+            async for line in resp.aiter_lines():
+                if self._feed(parts, line, early_stop=items == 1):
+                    break
+        return "".join(parts).strip()
 
-        resp = httpx.post(
-            f"{self.ollama_url}/api/generate",
-            json={
-                "model": model,
-                "prompt": full_prompt,
-                "stream": False,
-                "options": {
-                    "num_predict": self.max_words * 4,
-                    "temperature": 0.7,
-                },
-            },
-            timeout=self.timeout,
-        )
-        resp.raise_for_status()
-        data = resp.json()
-        content = data.get("response", "").strip()
-        return content
+    async def agenerate_batch(self, texts: list[str], system_prompt: str = "") -> list[str] | None:
+        for model in self.candidates()[:1]:
+            try:
+                reply = await self._acall_ollama(
+                    model, system_prompt, batch_prompt(texts, self.max_words), items=len(texts)
+                )
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("ollama batch with %s failed: %s", model, exc)
+                return None
+            items = parse_batch(reply, len(texts))
+            return [_clean_for_tts(item) for item in items] if items else None
+        return None
+
+    async def asummarize(self, text: str, max_words: int) -> str:
+        for model in self.candidates()[:1]:
+            try:
+                return await self._acall_ollama(model, summary_prompt(max_words), text)
+            except Exception as exc:  # noqa: BLE001
+                logger.debug("ollama summary failed: %s", exc)
+        return ""
 
     def check_health(self) -> bool:
-        try:
-            resp = httpx.get(f"{self.ollama_url}/api/tags", timeout=3)
-            return resp.status_code == 200
-        except Exception:  # noqa: BLE001
-            return False
+        # Doubles as a discovery refresh
+        return self.refresh_models()
+
+    async def acheck_health(self) -> bool:
+        return await self.arefresh_models()
 
 
 class TemplateNarrator(BaseNarrator):
@@ -0,0 +1,139 @@
+"""Latency- and success-aware ordering of the narration provider chain.
+
+The configured chain order is the baseline. Providers that are currently
+misbehaving are demoted behind the healthy ones (a cold Ollama model with
+a high EWMA latency, a Minimax endpoint that keeps erroring) or skipped
+entirely after repeated failures. A provider that has not been called for
+``retry_seconds`` gets its configured position back, so the next request
+probes it again. Pinned providers never move.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+
+from .stats import ProviderStats
+
+logger = logging.getLogger("multikanal.narration.routing")
+
+
+class ProviderRouter:
+    """Computes the per-request provider order from ``ProviderStats``.
+
+    - ``pin_first`` / ``pin_last``: names always tried first / last, in
+      that order, and never demoted or skipped.
+    - demoted: EWMA latency above ``slow_ms``, a timeout on the last call,
+      or EWMA success below ``demote_below``.
+    - skipped: ``skip_after`` consecutive failures and EWMA success below
+      ``skip_below``.
+    - Both expire ``retry_seconds`` after the provider's last call.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        slow_ms: float = 4000,
+        demote_below: float = 0.6,
+        skip_below: float = 0.2,
+        skip_after: int = 3,
+        retry_seconds: float = 60,
+        min_calls: int = 2,
+        pin_first: list[str] | None = None,
+        pin_last: list[str] | None = None,
+    ):
+        self.enabled = enabled
+        self.slow_ms = slow_ms
+        self.demote_below = demote_below
+        self.skip_below = skip_below
+        self.skip_after = skip_after
+        self.retry_seconds = retry_seconds
+        self.min_calls = min_calls
+        self.pin_first = list(pin_first or [])
+        self.pin_last = list(pin_last or [])
+        self.reordered = 0
+        self.skips = 0
+        self.last_decision: dict = {}
+
+    @classmethod
+    def from_config(cls, routing_cfg: dict) -> "ProviderRouter":
+        return cls(
+            enabled=routing_cfg.get("enabled", True),
+            slow_ms=routing_cfg.get("slow_ms", 4000),
+            demote_below=routing_cfg.get("demote_below_success", 0.6),
+            skip_below=routing_cfg.get("skip_below_success", 0.2),
+            skip_after=routing_cfg.get("skip_after_failures", 3),
+            retry_seconds=routing_cfg.get("retry_seconds", 60),
+            min_calls=routing_cfg.get("min_calls", 2),
+            pin_first=routing_cfg.get("pin_first", []),
+            pin_last=routing_cfg.get("pin_last", []),
+        )
+
+    def verdict(self, stats: ProviderStats, now: float | None = None) -> tuple[str, str]:
+        """("ok" | "demote" | "skip", reason) for one unpinned provider."""
+        now = time.monotonic() if now is None else now
+        if stats.calls < self.min_calls and not stats.consecutive_failures:
+            return "ok", ""
+        if now - stats.last_call > self.retry_seconds:
+            return "ok", ""
+        if stats.consecutive_failures >= self.skip_after and stats.ewma_success < self.skip_below:
+            return "skip", f"{stats.consecutive_failures} consecutive failures"
+        if stats.last_timed_out:
+            return "demote", "timed out"
+        if stats.ewma_success < self.demote_below:
+            return "demote", f"success {stats.ewma_success:.2f}"
+        if stats.ewma_ms is not None and stats.ewma_ms > self.slow_ms:
+            return "demote", f"slow ({stats.ewma_ms:.0f} ms)"
+        return "ok", ""
+
+    def order(self, providers: list, stats: dict[str, ProviderStats]) -> list:
+        """Providers in the order to try them for the next request."""
+        if not self.enabled:
+            return list(providers)
+        now = time.monotonic()
+        by_name = {p.name: p for p in providers}
+        first = [by_name[n] for n in self.pin_first if n in by_name]
+        last = [by_name[n] for n in self.pin_last if n in by_name and n not in self.pin_first]
+        pinned = {p.name for p in first + last}
+
+        healthy, demoted, skipped = [], [], []
+        reasons: dict[str, str] = {}
+        for p in providers:
+            if p.name in pinned:
+                continue
+            verdict, reason = self.verdict(stats[p.name], now)
+            if reason:
+                reasons[p.name] = reason
+            {"ok": healthy, "demote": demoted, "skip": skipped}[verdict].append(p)
+
+        chain = first + healthy + demoted + last
+        if not chain:
+            # Never skip everything: fall back to trying the skipped ones
+            chain, skipped = skipped, []
+        self.skips += len(skipped)
+        if [p.name for p in chain] != [p.name for p in providers]:
+            self.reordered += 1
+        decision = {
+            "order": [p.name for p in chain],
+            "demoted": {p.name: reasons[p.name] for p in demoted},
+            "skipped": {p.name: reasons[p.name] for p in skipped},
+        }
+        if decision != {k: v for k, v in self.last_decision.items() if k != "at"}:
+            logger.info(
+                "provider route: %s%s%s",
+                " > ".join(decision["order"]),
+                f" demoted={decision['demoted']}" if demoted else "",
+                f" skipped={decision['skipped']}" if skipped else "",
+            )
+        self.last_decision = {**decision, "at": time.time()}
+        return chain
+
+    def snapshot(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "pin_first": self.pin_first,
+            "pin_last": self.pin_last,
+            "reordered": self.reordered,
+            "skips": self.skips,
+            "last_decision": self.last_decision,
+        }
@@ -0,0 +1,169 @@
+"""Per-provider call statistics used for hedging and routing decisions.
+
+Each provider keeps a window of recent successful latencies; its p90 is
+the hedge delay: if the provider has not answered by then, the next one
+in the chain is raced against it. EWMA latency and success rate plus
+timeout counts feed the router (see ``routing.ProviderRouter``).
+"""
+
+from __future__ import annotations
+
+import collections
+import threading
+import time
+
+
+class ProviderStats:
+    """Rolling latency window, EWMAs and call counters for one provider.
+
+    ``ewma_ms`` tracks the latency of every finished call (a timeout is a
+    slow call too); ``ewma_success`` is the smoothed success rate.
+    """
+
+    def __init__(self, name: str, window: int = 50, alpha: float = 0.3):
+        self.name = name
+        self.alpha = alpha
+        self._lock = threading.Lock()
+        self._latencies: collections.deque[float] = collections.deque(maxlen=window)
+        self.calls = 0
+        self.successes = 0
+        self.failures = 0
+        self.timeouts = 0
+        self.cancelled = 0
+        self.wins = 0
+        self.consecutive_failures = 0
+        self.last_timed_out = False
+        self.ewma_ms: float | None = None
+        self.ewma_success = 1.0
+        self.last_call = 0.0
+
+    def record(self, latency_ms: float, ok: bool, timed_out: bool = False) -> None:
+        with self._lock:
+            self.calls += 1
+            self.last_call = time.monotonic()
+            if self.ewma_ms is None:
+                self.ewma_ms = float(latency_ms)
+            else:
+                self.ewma_ms += self.alpha * (latency_ms - self.ewma_ms)
+            self.ewma_success += self.alpha * ((1.0 if ok else 0.0) - self.ewma_success)
+            self.last_timed_out = timed_out and not ok
+            if ok:
+                self.successes += 1
+                self.consecutive_failures = 0
+                self._latencies.append(latency_ms)
+            else:
+                self.failures += 1
+                self.consecutive_failures += 1
+                self.timeouts += timed_out
+
+    def record_cancel(self) -> None:
+        with self._lock:
+            self.cancelled += 1
+
+    def percentile(self, q: float) -> float | None:
+        """Latency percentile in ms over the window, None without samples."""
+        with self._lock:
+            samples = sorted(self._latencies)
+        if not samples:
+            return None
+        idx = min(len(samples) - 1, int(q * len(samples)))
+        return samples[idx]
+
+    @property
+    def samples(self) -> int:
+        return len(self._latencies)
+
+    def snapshot(self) -> dict:
+        p50 = self.percentile(0.5)
+        p90 = self.percentile(0.9)
+        return {
+            "calls": self.calls,
+            "successes": self.successes,
+            "failures": self.failures,
+            "timeouts": self.timeouts,
+            "cancelled": self.cancelled,
+            "wins": self.wins,
+            "ewma_ms": round(self.ewma_ms) if self.ewma_ms is not None else None,
+            "ewma_success": round(self.ewma_success, 3),
+            "p50_ms": round(p50) if p50 is not None else None,
+            "p90_ms": round(p90) if p90 is not None else None,
+        }
+
+
+class HedgePolicy:
+    """When to race the next provider, and how many calls may be in flight.
+
+    The delay for a provider is its configured ``hedge_after_ms`` if set,
+    else the p90 of its recent latencies once ``min_samples`` are known,
+    else ``default_delay_ms``; always at least ``min_delay_ms``.
+    ``max_inflight`` caps concurrent provider calls across all narrations;
+    a hedge that would exceed it is not fired.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        default_delay_ms: float = 2500,
+        min_delay_ms: float = 300,
+        min_samples: int = 5,
+        max_inflight: int = 3,
+        overrides: dict[str, float] | None = None,
+    ):
+        self.enabled = enabled
+        self.default_delay_ms = default_delay_ms
+        self.min_delay_ms = min_delay_ms
+        self.min_samples = min_samples
+        self.max_inflight = max(1, max_inflight)
+        self.overrides = overrides or {}
+        self.inflight = 0
+        # Requests that raced at least one extra provider
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.hedge_losses = 0
+        self.suppressed = 0
+        self.requests = 0
+
+    @classmethod
+    def from_config(cls, narr_cfg: dict) -> "HedgePolicy":
+        hedge_cfg = narr_cfg.get("hedge") or {}
+        overrides = {
+            p["name"]: p["hedge_after_ms"]
+            for p in narr_cfg.get("providers") or []
+            if isinstance(p, dict) and p.get("name") and p.get("hedge_after_ms")
+        }
+        return cls(
+            enabled=hedge_cfg.get("enabled", True),
+            default_delay_ms=hedge_cfg.get("default_delay_ms", 2500),
+            min_delay_ms=hedge_cfg.get("min_delay_ms", 300),
+            min_samples=hedge_cfg.get("min_samples", 5),
+            max_inflight=hedge_cfg.get("max_inflight", 3),
+            overrides=overrides,
+        )
+
+    def delay_for(self, stats: ProviderStats) -> float:
+        """Seconds to wait on ``stats``' provider before hedging."""
+        delay = self.overrides.get(stats.name)
+        if delay is None and stats.samples >= self.min_samples:
+            delay = stats.percentile(0.9)
+        if delay is None:
+            delay = self.default_delay_ms
+        return max(delay, self.min_delay_ms) / 1000
+
+    def can_hedge(self) -> bool:
+        if self.inflight < self.max_inflight:
+            return True
+        self.suppressed += 1
+        return False
+
+    def snapshot(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "requests": self.requests,
+            "hedges": self.hedges,
+            "hedge_rate": round(self.hedges / self.requests, 3) if self.requests else 0.0,
+            "hedge_wins": self.hedge_wins,
+            "hedge_losses": self.hedge_losses,
+            "suppressed": self.suppressed,
+            "inflight": self.inflight,
+            "max_inflight": self.max_inflight,
+        }
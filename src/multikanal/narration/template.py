@@ -1,4 +1,16 @@
-"""Template-based narration for common Git/terminal commands."""
+"""Template-based narration for common Git/terminal commands.
+
+All template keys are compiled into one case-insensitive alternation
+(longest keys first, bounded at word edges), so a single scan of the
+input finds every key; the most specific match wins ("git commit" over
+"git", "docker-compose" over "docker"), ties going to the earliest. A
+lookup takes microseconds, which makes the narrator usable as a first
+tier in front of the LLM providers.
+
+Extra templates can be kept in a YAML file (``templates_file``), which
+is merged over (or, with ``replace_builtin: true``, replaces) the
+built-in set and hot-reloaded on change.
+"""
 
 from __future__ import annotations
 
@@ -6,16 +18,31 @@ import re
 import logging
 from typing import Optional
 
+import yaml
+
+from .prompt import PromptWatcher
 from .providers import BaseNarrator
 
 logger = logging.getLogger("multikanal.narration.providers")
 
 
+def compile_keys(keys) -> re.Pattern:
+    """One pattern matching any key as a whole word (plus plural -s/-es)."""
+    ordered = sorted({k.lower() for k in keys}, key=len, reverse=True)
+    alternation = "|".join(re.escape(k).replace(r"\ ", r"\s+") for k in ordered)
+    return re.compile(rf"(?<!\w)({alternation})(?:e?s)?(?!\w)", re.IGNORECASE)
+
+
 class TemplateNarrator(BaseNarrator):
-    """Generate narration using templates for common commands."""
+    """Generate narration using templates for common commands.
+
+    With ``fallback=False`` unmatched input yields "" instead of the
+    generic first-words narration, so the next provider is tried.
+    """
 
-    def __init__(self):
+    def __init__(self, templates_file: str = "", fallback: bool = True):
         super().__init__("template")
+        self.fallback = fallback
 
         self.templates = {
             "git commit": [
@@ -220,17 +247,60 @@ class TemplateNarrator(BaseNarrator):
             ],
         }
 
+        self._builtin = dict(self.templates)
+        self._pattern = compile_keys(self.templates)
+        self._watcher: Optional[PromptWatcher] = None
+        if templates_file:
+            self._watcher = PromptWatcher(templates_file, on_change=self._load_templates)
+            self._watcher.start()
+
+    def _load_templates(self, content: str) -> None:
+        """Merge templates from YAML content; keeps the old set on errors."""
+        try:
+            data = yaml.safe_load(content) or {}
+        except yaml.YAMLError as exc:
+            logger.warning("invalid templates file, keeping previous templates: %s", exc)
+            return
+        if not isinstance(data, dict):
+            logger.warning("templates file must be a mapping, ignoring it")
+            return
+        templates = {} if data.get("replace_builtin") else dict(self._builtin)
+        for key, narrations in (data.get("templates") or {}).items():
+            if isinstance(narrations, str):
+                narrations = [narrations]
+            narrations = [str(n).strip() for n in narrations or [] if str(n).strip()]
+            if narrations:
+                templates[" ".join(str(key).lower().split())] = narrations
+        if not templates:
+            logger.warning("templates file defines no templates, ignoring it")
+            return
+        # generate() copes with a key from the new pattern missing in the old set
+        self.templates, self._pattern = templates, compile_keys(templates)
+        logger.info("loaded %d narration templates", len(templates))
+
+    def match(self, text: str) -> str | None:
+        """Most specific template key found in ``text``, or None."""
+        best = None
+        best_rank = (0, 0)
+        for m in self._pattern.finditer(text):
+            key = " ".join(m.group(1).lower().split())
+            rank = (key.count(" ") + 1, len(key))
+            if rank > best_rank:
+                best, best_rank = key, rank
+        return best
+
     def generate(self, text: str, system_prompt: str = "", language: str = "", session_id: str = "") -> str:
         if not text.strip():
             return ""
 
-        text_lower = text.lower()
+        templates = self.templates
+        key = self.match(text)
+        if key in templates:
+            logger.info(f"Template narration for: {key}")
+            return templates[key][0]
 
-        for key, narrations in self.templates.items():
-            if key in text_lower:
-                narration = narrations[0]
-                logger.info(f"Template narration for: {key}")
-                return narration
+        if not self.fallback:
+            return ""
 
         fallback = "Das ist eine technische Ausgabe. Ich erkläre es kurz: "
         words = text.split()[:20]
@@ -244,3 +314,8 @@ class TemplateNarrator(BaseNarrator):
 
     def check_health(self) -> bool:
         return True
+
+    def close(self) -> None:
+        if self._watcher:
+            self._watcher.stop()
+            self._watcher = None
@@ -0,0 +1,117 @@
+"""Export and import the audio cache as a tar.gz archive.
+
+An archive holds ``manifest.json`` (key, file name, size and hits per
+entry) and the cached files under ``audio/``. Members are streamed to
+and from disk one at a time, so neither direction holds the cache in
+memory. On import only well-formed keys with plain file names that are
+regular files in the archive are accepted.
+
+Both run against a live ``AudioCache``; while the daemon is up the CLI
+asks it to run them (``/cache/export``, ``/cache/import``) so they never
+race its writes, compression or eviction.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import logging
+import pathlib
+import shutil
+import tarfile
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+from .cache import AudioCache, valid_key
+
+logger = logging.getLogger("multikanal.tts.archive")
+
+MANIFEST = "manifest.json"
+
+
+def export_archive(cache: AudioCache, archive: str) -> int:
+    """Write every entry present on disk to ``archive``; returns the count."""
+    entries = [e for e in cache.entries() if cache.path_of(e).exists()]
+    manifest = [
+        {"key": e.key, "filename": e.filename, "size": e.size, "hits": e.hits}
+        for e in entries
+    ]
+    exported = 0
+    with tarfile.open(archive, "w:gz") as tar:
+        # Manifest first, so an import can read the archive front to back
+        data = json.dumps({"version": 1, "entries": manifest}).encode("utf-8")
+        info = tarfile.TarInfo(MANIFEST)
+        info.size = len(data)
+        tar.addfile(info, io.BytesIO(data))
+        for entry in entries:
+            try:
+                tar.add(str(cache.path_of(entry)), arcname=f"audio/{entry.filename}")
+            except FileNotFoundError:
+                # Evicted or recompressed since the index was read; the
+                # import skips manifest entries without a member
+                continue
+            exported += 1
+    logger.info("exported %d cache entries to %s", exported, archive)
+    return exported
+
+
+def import_archive(
+    cache: AudioCache,
+    archive: str,
+    workers: int = 4,
+    progress: Callable[[int, int], None] | None = None,
+) -> dict:
+    """Add the archive's entries that are not cached yet.
+
+    Returns counts of ``imported`` and already ``present`` entries plus the
+    file names ``skipped`` as malformed or missing from the archive.
+    """
+    imported = present = 0
+    skipped = []
+    # Read strictly in order: seeking backwards in a gzip stream re-decompresses it
+    with tarfile.open(archive, "r|gz") as tar, tempfile.TemporaryDirectory() as tmp:
+        member = tar.next()
+        if member is None or member.name != MANIFEST or not member.isfile():
+            raise ValueError(f"{archive}: does not start with {MANIFEST}")
+        items = json.load(tar.extractfile(member)).get("entries", [])
+
+        wanted = {}
+        for item in items:
+            name = item.get("filename")
+            # Only plain file names and well-formed keys, never archive paths
+            if valid_key(item.get("key")) and isinstance(name, str) and pathlib.Path(name).name == name:
+                wanted[f"audio/{name}"] = item
+            else:
+                skipped.append(str(name))
+
+        with ThreadPoolExecutor(max(1, workers)) as pool:
+            futures = []
+            for member in tar:
+                item = wanted.pop(member.name, None)
+                if item is None:
+                    continue
+                if not member.isfile():
+                    skipped.append(item["filename"])
+                    continue
+                dest = pathlib.Path(tmp) / item["filename"]
+                with tar.extractfile(member) as src, dest.open("wb") as f:
+                    shutil.copyfileobj(src, f)
+                futures.append(pool.submit(_import_one, cache, item["key"], dest))
+            for done, fut in enumerate(futures, 1):
+                if fut.result():
+                    imported += 1
+                else:
+                    present += 1
+                if progress:
+                    progress(done, len(futures))
+        skipped += [item["filename"] for item in wanted.values()]
+    logger.info("imported %d cache entries from %s", imported, archive)
+    return {"imported": imported, "present": present, "skipped": skipped}
+
+
+def _import_one(cache: AudioCache, key: str, src: pathlib.Path) -> bool:
+    try:
+        return cache.import_file(key, str(src))
+    finally:
+        src.unlink(missing_ok=True)
@@ -1,25 +1,175 @@
-"""SHA-256 hash-based WAV cache with LRU eviction."""
+"""SHA-256 hash-based audio cache with indexed LRU eviction and optional compression."""
 
+import collections
+import contextlib
 import hashlib
 import logging
 import os
 import pathlib
+import re
 import shutil
+import subprocess
+import tempfile
+import threading
+import time
+import wave
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX
+    fcntl = None
+
+from . import pcm
+from .cache_index import CacheIndex, IndexEntry
+from .hot import HotTier
+from .spool import AudioSpool
 
 logger = logging.getLogger("multikanal.tts.cache")
 
+# Storage codec → (file suffix, ffmpeg encoder args)
+CODECS = {
+    "wav": (".wav", []),
+    "flac": (".flac", ["-c:a", "flac", "-compression_level", "5"]),
+    "opus": (".opus", ["-c:a", "libopus", "-b:a", "32k", "-application", "voip"]),
+}
+# Edge TTS MP3 is stored as it arrives (already compressed)
+_SUFFIXES = tuple(suffix for suffix, _ in CODECS.values()) + (".mp3",)
+
+# Leading bytes of the formats the cache can hold (Edge TTS writes MP3 data)
+_MAGIC = {
+    b"RIFF": "wav",
+    b"fLaC": "flac",
+    b"OggS": "ogg",
+    b"ID3": "mp3",
+    b"\xff\xf3": "mp3",
+    b"\xff\xfb": "mp3",
+    b"\xff\xf2": "mp3",
+}
+# File suffix for content written by ``put``; anything else is stored as .wav
+_CONTENT_SUFFIX = {"mp3": ".mp3", "flac": ".flac", "ogg": ".opus"}
+
+# Cache keys are SHA-256 hex digests; anything else is rejected on import
+_KEY_RE = re.compile(r"[0-9a-f]{64}")
+
+
+def sniff(path) -> str:
+    """Container format from the file's leading bytes ("" if unknown or unreadable)."""
+    try:
+        with open(path, "rb") as f:
+            head = f.read(4)
+    except OSError:
+        return ""
+    return next((name for magic, name in _MAGIC.items() if head.startswith(magic)), "")
+
+
+def valid_key(key) -> bool:
+    """Whether ``key`` is a well-formed cache key (safe to use as a file name)."""
+    return isinstance(key, str) and _KEY_RE.fullmatch(key) is not None
+
+
+# In-progress writes; renamed into place when complete, ignored by rescan
+_PART_SUFFIX = ".part"
+LOCK_FILE = ".lock"
+
+# Age histogram buckets (seconds since last access)
+_AGE_BUCKETS = [("1h", 3600), ("1d", 86400), ("7d", 7 * 86400), ("30d", 30 * 86400)]
+
 
 class AudioCache:
-    """Caches synthesized WAV files keyed by content hash.
+    """Caches synthesized audio files keyed by content hash.
+
+    Uses SHA-256(text + voice) as the cache key. A persistent SQLite index
+    (see ``CacheIndex``) tracks size, last access and hits per entry, so
+    get/put are single index lookups and LRU eviction does not depend on
+    atime. Eviction runs in batches down to ``low_watermark`` of
+    ``max_entries`` so its cost is amortised over many puts.
+
+    Entries are written as-is under a suffix matching their content (Edge
+    MP3 as .mp3); with a non-wav ``codec``, PCM WAV entries are re-encoded
+    in a background thread once played (see ``compress``). Cache paths
+    handed to the playback queue are held with ``acquire``/``release``;
+    eviction skips held entries, ``remove``/``prune`` delete them and
+    compression re-encodes them only after their last holder lets go; the
+    replaced WAV stays on disk for ``retire_grace`` seconds so readers that
+    looked it up before the index swap can still open it. Hits on
+    compressed entries return the compressed file (ffplay/paplay read it
+    directly) or, with ``decode_on_hit``, a decoded temporary WAV.
 
-    Uses SHA-256(text + voice) as the cache key.
-    LRU eviction based on file access time when max_entries exceeded.
+    Several processes (daemons, ``bin/ai-speak``, the edge-tts server) may
+    share one directory: files are written to a temporary name and renamed
+    into place, so readers never see partial audio, and eviction, prune and
+    rescan hold an advisory ``flock`` on ``.lock``.
+
+    With a ``HotTier``, ``get_clip`` serves decoded PCM of frequently hit
+    entries from memory; their index updates are batched.
     """
 
-    def __init__(self, cache_dir: str = "~/.cache/multikanal", max_entries: int = 500):
+    def __init__(
+        self,
+        cache_dir: str = "~/.cache/multikanal",
+        max_entries: int = 500,
+        codec: str = "wav",
+        decode_on_hit: bool = False,
+        hit_budget_ms: float = 50.0,
+        spool: AudioSpool | None = None,
+        rescan: bool = True,
+        hot: HotTier | None = None,
+        retire_grace: float = 60.0,
+    ):
+        self._spool = spool
+        self._hot = hot
+        # Hot-tier hits not yet written to the index (key -> hits)
+        self._pending_touch: collections.Counter[str] = collections.Counter()
         self._dir = pathlib.Path(os.path.expanduser(cache_dir)).resolve()
         self._dir.mkdir(parents=True, exist_ok=True)
         self._max_entries = max_entries
+        if codec not in CODECS:
+            logger.warning("unknown cache codec %r, storing wav", codec)
+            codec = "wav"
+        if codec != "wav" and not pcm.ffmpeg_path():
+            logger.warning("ffmpeg not installed, cache codec %s disabled", codec)
+            codec = "wav"
+        self._codec = codec
+        self._decode_on_hit = decode_on_hit
+        self._hit_budget_ms = hit_budget_ms
+        self._hit_ms: collections.deque[float] = collections.deque(maxlen=200)
+        self._encoder: ThreadPoolExecutor | None = None
+        # Cache paths held by the playback queue, compressions waiting for
+        # their release, and replaced WAVs waiting to be deleted (path -> due)
+        self._holders: collections.Counter[str] = collections.Counter()
+        self._compress_pending: set[str] = set()
+        # Keys whose removal (prune/remove) waits for their holders
+        self._remove_pending: set[str] = set()
+        self._retired: dict[str, float] = {}
+        self._retire_grace = retire_grace
+        self._hold_lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._low_watermark = 0.9
+
+        self._index = CacheIndex(self._dir)
+        if rescan:
+            # Startup only: reconcile with whatever is on disk (crash, manual deletes)
+            with self._locked():
+                self._sweep_partial()
+                self._index.rescan(_SUFFIXES)
+        self._count = self._index.count()
+
+    @classmethod
+    def from_config(
+        cls, cache_cfg: dict, spool: AudioSpool | None = None, rescan: bool = True
+    ) -> "AudioCache":
+        return cls(
+            cache_dir=cache_cfg.get("path", "~/.cache/multikanal"),
+            max_entries=cache_cfg.get("max_entries", 500),
+            codec=cache_cfg.get("codec", "wav"),
+            decode_on_hit=cache_cfg.get("decode_on_hit", False),
+            hit_budget_ms=cache_cfg.get("hit_budget_ms", 50),
+            spool=spool,
+            rescan=rescan,
+            hot=HotTier.from_config(cache_cfg),
+        )
 
     @staticmethod
     def _hash_key(text: str, voice: str) -> str:
@@ -30,61 +180,490 @@ class AudioCache:
         h.update(voice.encode("utf-8"))
         return h.hexdigest()
 
-    def _path_for(self, key: str) -> pathlib.Path:
-        return self._dir / f"{key}.wav"
+    def _path_for(self, key: str, suffix: str = ".wav") -> pathlib.Path:
+        return self._dir / f"{key}{suffix}"
+
+    @contextlib.contextmanager
+    def _locked(self):
+        """Exclusive advisory lock on the cache directory (all processes)."""
+        if fcntl is None:
+            yield
+            return
+        with open(self._dir / LOCK_FILE, "a") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _write_atomic(self, src: str, dest: pathlib.Path) -> None:
+        """Copy src to dest via a unique temp file and rename."""
+        fd, tmp = tempfile.mkstemp(
+            dir=self._dir, prefix=f".{dest.stem[:12]}-", suffix=_PART_SUFFIX
+        )
+        os.close(fd)
+        try:
+            shutil.copyfile(src, tmp)
+            os.replace(tmp, dest)
+        except BaseException:
+            pathlib.Path(tmp).unlink(missing_ok=True)
+            raise
+
+    def _sweep_partial(self, max_age: float = 600) -> None:
+        """Remove temp files left behind by a writer that crashed."""
+        cutoff = time.time() - max_age
+        for path in self._dir.glob(f"*{_PART_SUFFIX}"):
+            with contextlib.suppress(OSError):
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
 
     def get(self, text: str, voice: str) -> str | None:
-        """Look up a cached WAV file. Returns path string or None."""
+        """Look up a cached audio file. Returns path string or None."""
+        t0 = time.perf_counter()
+        found = self._lookup(self._hash_key(text, voice))
+        if found is None:
+            return None
+        path, _ = found
+        result = str(path)
+        if path.suffix != ".wav" and self._decode_on_hit:
+            result = self._decode(path) or result
+        self._record_hit((time.perf_counter() - t0) * 1000)
+        logger.debug("cache hit: %s", path.stem[:12])
+        return result
+
+    def _lookup(self, key: str) -> tuple[pathlib.Path, IndexEntry] | None:
+        """Resolve a key to its file, counting the hit or miss."""
+        entry = self._index.lookup(key)
+        if entry is None:
+            self._misses += 1
+            return None
+        path = self._dir / entry.filename
+        if not path.exists():
+            # Deleted behind our back
+            self._index.remove([key])
+            self._count -= 1
+            self._misses += 1
+            return None
+
+        self._index.touch(key)
+        self._hits += 1
+        return path, entry
+
+    def get_clip(
+        self, text: str, voice: str, rate: int = pcm.DEFAULT_RATE
+    ) -> pcm.PcmClip | None:
+        """Decoded PCM for a cached entry; from RAM when it is in the hot tier.
+
+        A decoded entry whose hit count reaches the promotion threshold is
+        offered to the hot tier.
+        """
         key = self._hash_key(text, voice)
-        path = self._path_for(key)
+        if self._hot:
+            clip = self._hot.get(key)
+            if clip is not None and clip.rate == rate:
+                self._hits += 1
+                self._pending_touch[key] += 1
+                return clip
+        found = self._lookup(key)
+        if found is None:
+            return None
+        path, entry = found
+        clip = pcm.load(str(path), rate=rate)
+        if clip is not None:
+            if self._hot:
+                self._hot.offer(key, clip, entry.hits + 1)
+            # This reader is done with the file: it may be compressed now
+            self.compress(str(path))
+        return clip
+
+    def contains(self, text: str, voice: str) -> bool:
+        """Whether an entry exists (no hit/miss accounting)."""
+        return self._index.lookup(self._hash_key(text, voice)) is not None
 
-        if path.exists():
-            # Touch access time for LRU
-            path.touch()
-            logger.debug("cache hit: %s", key[:12])
-            return str(path)
+    def _flush_touches(self) -> None:
+        """Write batched hot-tier hits to the index (keeps LRU order honest)."""
+        if not self._pending_touch:
+            return
+        pending, self._pending_touch = self._pending_touch, collections.Counter()
+        self._index.touch_many(pending)
+
+    def _decode(self, path: pathlib.Path) -> str | None:
+        clip = pcm.load(str(path))
+        if clip is None:
+            return None
+        if self._spool:
+            out = self._spool.new_path()
+        else:
+            tmp = tempfile.NamedTemporaryFile(suffix=".wav", delete=False, prefix="mk_")
+            tmp.close()
+            out = tmp.name
+        pcm.write_wav(clip, out)
+        return out
 
-        return None
+    def _record_hit(self, ms: float) -> None:
+        self._hit_ms.append(ms)
+        if ms <= self._hit_budget_ms:
+            return
+        logger.warning(
+            "cache hit took %.1fms (budget %.0fms)", ms, self._hit_budget_ms
+        )
+        # Decoding is the only expensive part of a hit: if it keeps blowing
+        # the budget, hand compressed files straight to the player instead.
+        if self._decode_on_hit and len(self._hit_ms) >= 10:
+            recent = sorted(self._hit_ms)[int(len(self._hit_ms) * 0.95) - 1]
+            if recent > self._hit_budget_ms:
+                logger.warning("disabling decode-on-hit, p95 %.1fms over budget", recent)
+                self._decode_on_hit = False
 
     def put(self, text: str, voice: str, wav_path: str) -> str:
-        """Store a WAV file in the cache. Returns the cached path."""
+        """Store an audio file in the cache. Returns the cached path."""
+        self._flush_touches()
         key = self._hash_key(text, voice)
-        dest = self._path_for(key)
+        entry = self._index.lookup(key)
+        if entry and (self._dir / entry.filename).exists():
+            return str(self._dir / entry.filename)
 
-        if not dest.exists():
-            shutil.copy2(wav_path, dest)
-            logger.debug("cached: %s", key[:12])
+        # Named after the content: MP3 from Edge TTS must not pass for WAV
+        dest = self._path_for(key, _CONTENT_SUFFIX.get(sniff(wav_path), ".wav"))
+        self._write_atomic(wav_path, dest)
+        self._index.insert(key, dest.name, dest.stat().st_size)
+        if entry is None:
+            self._count += 1
+        logger.debug("cached: %s", key[:12])
 
         self._evict_if_needed()
         return str(dest)
 
+    def acquire(self, path: str) -> bool:
+        """Hold a cache path while it is queued for playback.
+
+        Returns False for paths outside the cache.
+        """
+        if pathlib.Path(path).parent != self._dir:
+            return False
+        with self._hold_lock:
+            self._holders[path] += 1
+        return True
+
+    def release(self, path: str | None) -> None:
+        """Drop a hold; runs a removal or compression deferred until the last release."""
+        if not path:
+            return
+        key = pathlib.Path(path).stem
+        with self._hold_lock:
+            if not self._holders.get(path):
+                return
+            self._holders[path] -= 1
+            if self._holders[path]:
+                return
+            del self._holders[path]
+            pending = path in self._compress_pending
+            self._compress_pending.discard(path)
+            remove = key in self._remove_pending and key not in self._held_keys()
+            if remove:
+                self._remove_pending.discard(key)
+        if remove:
+            self.remove([key])
+        elif pending:
+            self.compress(path)
+        self._reap()
+
+    def _held_keys(self) -> set[str]:
+        """Keys of entries queued for playback (caller holds ``_hold_lock``)."""
+        return {pathlib.Path(p).stem for p in self._holders}
+
+    def compress(self, path: str) -> None:
+        """Re-encode a cached WAV with the storage codec in the background.
+
+        Call after the file has been played; no-op for paths outside the
+        cache, entries that are not PCM WAV (compressed, or Edge MP3 stored
+        under .wav by older versions), or codec ``wav``. While the path is
+        held the compression waits for its last ``release``.
+        """
+        if self._codec == "wav":
+            return
+        src = pathlib.Path(path)
+        if src.parent != self._dir or src.suffix != ".wav" or sniff(src) != "wav":
+            return
+        with self._hold_lock:
+            if path in self._retired:
+                return  # already replaced by its compressed version
+            if self._holders.get(path):
+                self._compress_pending.add(path)
+                return
+        self._reap()
+        if self._encoder is None:
+            self._encoder = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="cache-encode"
+            )
+        self._encoder.submit(self._encode, src)
+
+    def _encode(self, src: pathlib.Path) -> None:
+        suffix, codec_args = CODECS[self._codec]
+        dest = src.with_suffix(suffix)
+        # Unique name: another process may be encoding the same entry
+        tag = f"{os.getpid()}-{threading.get_native_id()}"
+        tmp = self._dir / f".{src.stem[:12]}-{tag}{_PART_SUFFIX}"
+        cmd = [
+            pcm.ffmpeg_path(), "-v", "quiet", "-nostdin", "-y", "-i", str(src),
+            *codec_args, "-f", "ogg" if suffix == ".opus" else suffix[1:], str(tmp),
+        ]
+        try:
+            subprocess.run(cmd, check=True, capture_output=True, timeout=60)
+            os.replace(tmp, dest)
+            before = src.stat().st_size
+            self._index.update_file(src.stem, dest.name, dest.stat().st_size)
+            # Readers may have looked up the WAV just before the swap
+            with self._hold_lock:
+                self._retired[str(src)] = time.monotonic() + self._retire_grace
+            logger.debug(
+                "compressed %s: %d → %d bytes", src.name, before, dest.stat().st_size
+            )
+        except Exception as e:
+            tmp.unlink(missing_ok=True)
+            logger.debug("cache encode failed for %s: %s", src.name, e)
+
+    def _reap(self, force: bool = False) -> None:
+        """Delete replaced WAVs whose grace period is over and that nobody holds."""
+        now = time.monotonic()
+        with self._hold_lock:
+            due = [
+                p for p, t in self._retired.items()
+                if (force or t <= now) and not self._holders.get(p)
+            ]
+            for path in due:
+                del self._retired[path]
+        for path in due:
+            pathlib.Path(path).unlink(missing_ok=True)
+
     def _evict_if_needed(self):
-        """Remove oldest entries if cache exceeds max size."""
-        entries = list(self._dir.glob("*.wav"))
-        if len(entries) <= self._max_entries:
+        """Evict least recently used entries once max_entries is exceeded."""
+        if self._count <= self._max_entries:
             return
 
-        # Sort by access time (oldest first)
-        entries.sort(key=lambda p: p.stat().st_atime)
+        with self._locked():
+            # Other processes share the index: recount under the lock
+            self._count = self._index.count()
+            if self._count <= self._max_entries:
+                return
+            target = int(self._max_entries * self._low_watermark)
+            # Entries queued for playback are skipped, not deleted under the player
+            with self._hold_lock:
+                held = self._held_keys()
+            need = self._count - target
+            victims = [
+                e for e in self._index.oldest(need + len(held)) if e.key not in held
+            ][:need]
+            for entry in victims:
+                try:
+                    (self._dir / entry.filename).unlink(missing_ok=True)
+                    logger.debug("evicted: %s", entry.filename)
+                except OSError:
+                    pass
+            self._index.remove(e.key for e in victims)
+            self._count = self._index.count()
+        if self._hot:
+            self._hot.discard(e.key for e in victims)
 
-        to_remove = len(entries) - self._max_entries
-        for path in entries[:to_remove]:
+    def entries(self) -> list[IndexEntry]:
+        return self._index.all()
+
+    def path_of(self, entry: IndexEntry) -> pathlib.Path:
+        return self._dir / entry.filename
+
+    def remove(self, keys: list[str]) -> int:
+        """Delete entries by key. Returns bytes freed.
+
+        Entries queued for playback are removed after their last ``release``.
+        """
+        freed = 0
+        wanted = set(keys)
+        with self._hold_lock:
+            held = wanted & self._held_keys()
+            self._remove_pending |= held
+        if held:
+            logger.debug("removal of %d held entries deferred", len(held))
+            wanted -= held
+        with self._locked():
+            for entry in self._index.all():
+                if entry.key in wanted:
+                    (self._dir / entry.filename).unlink(missing_ok=True)
+                    freed += entry.size
+            self._index.remove(wanted)
+            self._count = self._index.count()
+        if self._hot:
+            self._hot.discard(wanted)
+        return freed
+
+    def prune(self, max_bytes: int | None = None, older_than: float | None = None) -> dict:
+        """Drop entries not accessed for ``older_than`` seconds, then LRU
+        entries until the cache fits in ``max_bytes``."""
+        self._flush_touches()
+        entries = sorted(self._index.all(), key=lambda e: e.last_access)
+        victims: list[IndexEntry] = []
+        if older_than is not None:
+            cutoff = time.time() - older_than
+            victims = [e for e in entries if e.last_access < cutoff]
+        if max_bytes is not None:
+            remaining = [e for e in entries if e not in victims]
+            total = sum(e.size for e in remaining)
+            for e in remaining:
+                if total <= max_bytes:
+                    break
+                victims.append(e)
+                total -= e.size
+        with self._hold_lock:
+            held = self._held_keys()
+        deferred = sum(1 for e in victims if e.key in held)
+        freed = self.remove([e.key for e in victims])
+        logger.info("cache prune: %d entries, %d bytes", len(victims) - deferred, freed)
+        return {"removed": len(victims) - deferred, "bytes_freed": freed, "deferred": deferred}
+
+    def verify(self, entry: IndexEntry) -> str:
+        """Return a problem description for a broken entry, "" if it is fine."""
+        path = self._dir / entry.filename
+        try:
+            size = path.stat().st_size
+        except OSError:
+            return "missing"
+        if size == 0:
+            return "empty"
+        fmt = sniff(path)
+        if not fmt:
+            return "unknown format"
+        if fmt == "wav":
             try:
-                path.unlink()
-                logger.debug("evicted: %s", path.name)
-            except OSError:
-                pass
+                with wave.open(str(path), "rb") as w:
+                    expected = w.getnframes() * w.getsampwidth() * w.getnchannels()
+                    if len(w.readframes(w.getnframes())) < expected:
+                        return "truncated wav"
+            except (wave.Error, EOFError) as e:
+                return f"corrupt wav: {e}"
+            return ""
+        ffmpeg = pcm.ffmpeg_path()
+        if ffmpeg:
+            proc = subprocess.run(
+                [ffmpeg, "-v", "error", "-nostdin", "-i", str(path), "-f", "null", "-"],
+                capture_output=True,
+                timeout=60,
+            )
+            if proc.returncode != 0 or proc.stderr.strip():
+                return f"decode error ({fmt})"
+        return ""
+
+    def verify_all(self, workers: int = 4, delete: bool = False, progress=None) -> dict:
+        """Verify every entry in worker threads, optionally deleting broken ones.
+
+        Returns the number ``checked``, ``broken`` as (file name, problem)
+        pairs and how many were ``deleted``. ``progress(done, total)`` is
+        called as entries finish.
+        """
+        entries = self.entries()
+        broken = []
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            for done, (entry, problem) in enumerate(
+                zip(entries, pool.map(self.verify, entries)), 1
+            ):
+                if problem:
+                    # Evicted or recompressed while it was being checked?
+                    current = self._index.lookup(entry.key)
+                    if current is not None and current.filename != entry.filename:
+                        entry, problem = current, self.verify(current)
+                    if current is not None and problem:
+                        broken.append((entry, problem))
+                if progress:
+                    progress(done, len(entries))
+        if delete and broken:
+            self.remove([e.key for e, _ in broken])
+        return {
+            "checked": len(entries),
+            "broken": [(e.filename, problem) for e, problem in broken],
+            "deleted": len(broken) if delete else 0,
+        }
+
+    def import_file(self, key: str, src: str) -> bool:
+        """Add an exported file under its original key (no-op if present).
+
+        Raises ValueError for a key that is not a SHA-256 hex digest.
+        """
+        if not valid_key(key):
+            raise ValueError(f"invalid cache key: {key!r}")
+        entry = self._index.lookup(key)
+        if entry and (self._dir / entry.filename).exists():
+            return False
+        suffix = pathlib.Path(src).suffix if pathlib.Path(src).suffix in _SUFFIXES else ".wav"
+        dest = self._dir / f"{key}{suffix}"
+        self._write_atomic(src, dest)
+        self._index.insert(key, dest.name, dest.stat().st_size)
+        if entry is None:
+            self._count += 1
+        return True
 
     def clear(self):
         """Remove all cached files."""
-        for path in self._dir.glob("*.wav"):
-            try:
-                path.unlink()
-            except OSError:
-                pass
+        with self._locked():
+            for entry in self._index.all():
+                try:
+                    (self._dir / entry.filename).unlink(missing_ok=True)
+                except OSError:
+                    pass
+            self._index.clear()
+        self._count = 0
+        if self._hot:
+            self._hot.clear()
         logger.info("cache cleared")
 
+    def close(self):
+        """Finish pending background encodes and close the index."""
+        if self._encoder:
+            self._encoder.shutdown(wait=True, cancel_futures=True)
+            self._encoder = None
+        self._reap(force=True)
+        self._flush_touches()
+        self._index.close()
+
+    def stats(self) -> dict:
+        """Entry count, size on disk, hit ratio, age histogram and hit latency.
+
+        ``hit_ratio`` counts this process only; ``lifetime_hit_ratio`` uses
+        the hit counts stored in the index (every entry was one miss).
+        """
+        self._flush_touches()
+        entries = self._index.all()
+        now = time.time()
+        ages: dict[str, int] = {label: 0 for label, _ in _AGE_BUCKETS}
+        ages["older"] = 0
+        for e in entries:
+            age = now - e.last_access
+            label = next((lb for lb, limit in _AGE_BUCKETS if age < limit), "older")
+            ages[label] += 1
+        stored_hits = sum(e.hits for e in entries)
+        by_codec: dict[str, int] = collections.Counter(
+            pathlib.PurePath(e.filename).suffix[1:] for e in entries
+        )
+        lookups = self._hits + self._misses
+        hits = sorted(self._hit_ms)
+        return {
+            "path": str(self._dir),
+            "entries": len(entries),
+            "bytes": sum(e.size for e in entries),
+            "codec": self._codec,
+            "by_codec": dict(by_codec),
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_ratio": round(self._hits / lookups, 3) if lookups else 0.0,
+            "lifetime_hits": stored_hits,
+            "lifetime_hit_ratio": (
+                round(stored_hits / (stored_hits + len(entries)), 3) if entries else 0.0
+            ),
+            "age_histogram": ages,
+            "hit_ms_avg": round(sum(hits) / len(hits), 2) if hits else 0.0,
+            "hit_ms_p95": round(hits[int(len(hits) * 0.95) - 1], 2) if len(hits) >= 20 else 0.0,
+            "hit_budget_ms": self._hit_budget_ms,
+            "hot": self._hot.stats() if self._hot else None,
+        }
+
     @property
     def size(self) -> int:
         """Number of cached entries."""
-        return len(list(self._dir.glob("*.wav")))
+        return self._count
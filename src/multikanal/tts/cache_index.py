@@ -0,0 +1,204 @@
+"""Persistent SQLite index for the audio cache.
+
+Records key, file name, size, last access and hit count per entry, so
+lookups and inserts never touch the directory listing and LRU order does
+not depend on filesystem atime (unreliable on noatime/relatime mounts).
+"""
+
+from __future__ import annotations
+
+import logging
+import pathlib
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Iterable
+
+logger = logging.getLogger("multikanal.tts.cache_index")
+
+INDEX_FILE = "index.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    filename TEXT NOT NULL,
+    size INTEGER NOT NULL DEFAULT 0,
+    created REAL NOT NULL,
+    last_access REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS entries_lru ON entries (last_access);
+"""
+
+
+@dataclass(frozen=True)
+class IndexEntry:
+    key: str
+    filename: str
+    size: int
+    created: float
+    last_access: float
+    hits: int
+
+
+class CacheIndex:
+    """Thread-safe key → entry table backed by one SQLite file."""
+
+    def __init__(self, cache_dir: pathlib.Path):
+        self._dir = cache_dir
+        self._path = cache_dir / INDEX_FILE
+        self._lock = threading.Lock()
+        self._conn = self._open()
+
+    def _open(self) -> sqlite3.Connection:
+        try:
+            conn = self._connect()
+            conn.execute("SELECT COUNT(*) FROM entries").fetchone()
+            return conn
+        except sqlite3.DatabaseError as e:
+            # Corrupt or unreadable index: start over, rescan() repopulates it
+            logger.warning("cache index unusable (%s), rebuilding", e)
+            for suffix in ("", "-wal", "-shm"):
+                pathlib.Path(f"{self._path}{suffix}").unlink(missing_ok=True)
+            return self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        # Other processes may share the index: wait for their write locks
+        conn = sqlite3.connect(
+            str(self._path), check_same_thread=False, isolation_level=None, timeout=10
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(_SCHEMA)
+        return conn
+
+    def lookup(self, key: str) -> IndexEntry | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT key, filename, size, created, last_access, hits"
+                " FROM entries WHERE key = ?",
+                (key,),
+            ).fetchone()
+        return IndexEntry(*row) if row else None
+
+    def touch(self, key: str) -> None:
+        """Record a hit: bump last access and hit count."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE entries SET last_access = ?, hits = hits + 1 WHERE key = ?",
+                (time.time(), key),
+            )
+
+    def touch_many(self, counts: dict[str, int]) -> None:
+        """Record batched hits (key -> count) in one transaction."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN")
+            self._conn.executemany(
+                "UPDATE entries SET last_access = ?, hits = hits + ? WHERE key = ?",
+                ((now, n, k) for k, n in counts.items()),
+            )
+            self._conn.execute("COMMIT")
+
+    def insert(self, key: str, filename: str, size: int) -> None:
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries"
+                " (key, filename, size, created, last_access, hits)"
+                " VALUES (?, ?, ?, ?, ?, 0)",
+                (key, filename, size, now, now),
+            )
+
+    def update_file(self, key: str, filename: str, size: int) -> None:
+        with self._lock:
+            self._conn.execute(
+                "UPDATE entries SET filename = ?, size = ? WHERE key = ?",
+                (filename, size, key),
+            )
+
+    def remove(self, keys: Iterable[str]) -> None:
+        with self._lock:
+            self._conn.executemany(
+                "DELETE FROM entries WHERE key = ?", ((k,) for k in keys)
+            )
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def oldest(self, limit: int) -> list[IndexEntry]:
+        """Least recently used entries, oldest first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key, filename, size, created, last_access, hits"
+                " FROM entries ORDER BY last_access LIMIT ?",
+                (limit,),
+            ).fetchall()
+        return [IndexEntry(*r) for r in rows]
+
+    def all(self) -> list[IndexEntry]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key, filename, size, created, last_access, hits FROM entries"
+            ).fetchall()
+        return [IndexEntry(*r) for r in rows]
+
+    def totals(self) -> tuple[int, int, int]:
+        """(entries, bytes, hits) over the whole index."""
+        with self._lock:
+            n, size, hits = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(hits), 0)"
+                " FROM entries"
+            ).fetchone()
+        return n, size, hits
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+
+    def rescan(self, suffixes: tuple[str, ...]) -> tuple[int, int]:
+        """Reconcile index and directory after a crash or external change.
+
+        Adds files missing from the index (mtime as last access) and drops
+        rows whose file is gone. Returns (added, dropped).
+        """
+        on_disk: dict[str, pathlib.Path] = {}
+        for path in self._dir.iterdir():
+            if path.suffix in suffixes and path.is_file():
+                # A crash mid-encode can leave both: keep the compressed file
+                if path.suffix == ".wav" and path.stem in on_disk:
+                    continue
+                on_disk[path.stem] = path
+        indexed = {e.key: e for e in self.all()}
+
+        dropped = [
+            k for k, e in indexed.items()
+            if k not in on_disk or on_disk[k].name != e.filename
+        ]
+        added = [p for k, p in on_disk.items() if k not in indexed or k in dropped]
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            self._conn.executemany(
+                "DELETE FROM entries WHERE key = ?", ((k,) for k in dropped)
+            )
+            for path in added:
+                st = path.stat()
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO entries"
+                    " (key, filename, size, created, last_access, hits)"
+                    " VALUES (?, ?, ?, ?, ?, 0)",
+                    (path.stem, path.name, st.st_size, st.st_mtime, st.st_mtime),
+                )
+            self._conn.execute("COMMIT")
+        dropped_only = len(set(dropped) - {p.stem for p in added})
+        if added or dropped_only:
+            logger.info(
+                "cache index rescan: %d added, %d dropped", len(added), dropped_only
+            )
+        return len(added), dropped_only
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,122 @@
+"""In-RAM hot tier: decoded PCM for the most frequently played clips.
+
+Titles, prefixes and template narrations are hit over and over. Once an
+entry's hit count reaches ``promote_after`` its decoded PCM is kept in
+memory, so stitching and streaming playback need no disk I/O at all.
+The tier is bounded by bytes; when full, the resident clip with the
+fewest hits is demoted, and a candidate is only admitted if it has more
+hits than everything it would displace.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from dataclasses import dataclass
+
+from .pcm import PcmClip
+
+logger = logging.getLogger("multikanal.tts.hot")
+
+
+@dataclass
+class _Resident:
+    clip: PcmClip
+    hits: int
+
+
+class HotTier:
+    """Byte-bounded, hit-count-driven PCM store keyed by cache key."""
+
+    def __init__(
+        self,
+        budget_bytes: int = 16 * 1024 * 1024,
+        promote_after: int = 2,
+        max_clip_fraction: float = 0.125,
+    ):
+        self.budget_bytes = budget_bytes
+        self.promote_after = max(1, promote_after)
+        # One long narration must not flush every title and prefix
+        self._max_clip = int(budget_bytes * max_clip_fraction)
+        self._lock = threading.Lock()
+        self._clips: dict[str, _Resident] = {}
+        self._used = 0
+        self.hits = 0
+        self.promotions = 0
+        self.demotions = 0
+
+    @classmethod
+    def from_config(cls, cache_cfg: dict) -> "HotTier | None":
+        budget_mb = cache_cfg.get("hot_budget_mb", 16)
+        if not budget_mb:
+            return None
+        return cls(
+            budget_bytes=int(budget_mb * 1024 * 1024),
+            promote_after=cache_cfg.get("hot_promote_after", 2),
+        )
+
+    def get(self, key: str) -> PcmClip | None:
+        with self._lock:
+            res = self._clips.get(key)
+            if res is None:
+                return None
+            res.hits += 1
+            self.hits += 1
+            return res.clip
+
+    def offer(self, key: str, clip: PcmClip, hits: int) -> bool:
+        """Admit a decoded clip if its hit count earns a place. Returns True if resident."""
+        size = len(clip.frames)
+        if hits < self.promote_after or not size or size > self._max_clip:
+            return False
+        with self._lock:
+            if key in self._clips:
+                return True
+            victims: list[str] = []
+            free = self.budget_bytes - self._used
+            if free < size:
+                for vkey, res in sorted(self._clips.items(), key=lambda kv: kv[1].hits):
+                    if res.hits >= hits:
+                        # Everything left is hotter than the candidate
+                        return False
+                    victims.append(vkey)
+                    free += len(res.clip.frames)
+                    if free >= size:
+                        break
+                else:
+                    return False
+            for vkey in victims:
+                self._used -= len(self._clips.pop(vkey).clip.frames)
+                self.demotions += 1
+            self._clips[key] = _Resident(clip, hits)
+            self._used += size
+            self.promotions += 1
+        logger.debug("promoted %s to hot tier (%d bytes, %d hits)", key[:12], size, hits)
+        return True
+
+    def discard(self, keys) -> None:
+        with self._lock:
+            for key in keys:
+                res = self._clips.pop(key, None)
+                if res is not None:
+                    self._used -= len(res.clip.frames)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._clips.clear()
+            self._used = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            seconds = sum(r.clip.duration for r in self._clips.values())
+            return {
+                "budget_bytes": self.budget_bytes,
+                "used_bytes": self._used,
+                "residency": round(self._used / self.budget_bytes, 3) if self.budget_bytes else 0.0,
+                "entries": len(self._clips),
+                "seconds": round(seconds, 1),
+                "hits": self.hits,
+                "promotions": self.promotions,
+                "demotions": self.demotions,
+                "promote_after": self.promote_after,
+            }
@@ -0,0 +1,163 @@
+"""Raw PCM helpers: decode audio files, stitch clips, write WAV."""
+
+from __future__ import annotations
+
+import functools
+import logging
+import os
+import shutil
+import subprocess
+import wave
+from dataclasses import dataclass
+
+logger = logging.getLogger("multikanal.tts.pcm")
+
+# Edge TTS delivers 24 kHz mono; everything is normalised to this by default
+DEFAULT_RATE = 24000
+DEFAULT_CHANNELS = 1
+SAMPLE_WIDTH = 2  # s16le
+
+
+@dataclass(frozen=True)
+class PcmClip:
+    """Signed 16-bit little-endian PCM with its stream parameters."""
+
+    frames: bytes
+    rate: int = DEFAULT_RATE
+    channels: int = DEFAULT_CHANNELS
+
+    @property
+    def duration(self) -> float:
+        """Length in seconds."""
+        bytes_per_sec = self.rate * self.channels * SAMPLE_WIDTH
+        return len(self.frames) / bytes_per_sec if bytes_per_sec else 0.0
+
+    def matches(self, other: "PcmClip") -> bool:
+        return self.rate == other.rate and self.channels == other.channels
+
+
+@functools.lru_cache(maxsize=1)
+def ffmpeg_path() -> str:
+    """Locate ffmpeg once per process ("" if not installed)."""
+    return shutil.which("ffmpeg") or ""
+
+
+def _read_wav(path: str) -> PcmClip | None:
+    try:
+        with wave.open(path, "rb") as w:
+            if w.getsampwidth() != SAMPLE_WIDTH or w.getcomptype() != "NONE":
+                return None
+            return PcmClip(
+                frames=w.readframes(w.getnframes()),
+                rate=w.getframerate(),
+                channels=w.getnchannels(),
+            )
+    except (wave.Error, EOFError, OSError):
+        return None
+
+
+def load(
+    path: str, rate: int = DEFAULT_RATE, channels: int = DEFAULT_CHANNELS
+) -> PcmClip | None:
+    """Decode an audio file to PCM at the given rate/channels.
+
+    Plain 16-bit WAVs with matching parameters are read directly; anything
+    else (Edge MP3 output, other rates, compressed cache files) goes
+    through ffmpeg. Returns None if the file cannot be decoded.
+    """
+    clip = _read_wav(path)
+    if clip and clip.rate == rate and clip.channels == channels:
+        return clip
+
+    ffmpeg = ffmpeg_path()
+    if not ffmpeg:
+        logger.debug("ffmpeg not installed, cannot decode %s", path)
+        return None
+    cmd = [
+        ffmpeg, "-v", "quiet", "-nostdin", "-i", path,
+        "-f", "s16le", "-acodec", "pcm_s16le",
+        "-ac", str(channels), "-ar", str(rate), "-",
+    ]
+    try:
+        proc = subprocess.run(cmd, capture_output=True, check=True, timeout=30)
+    except Exception as e:
+        logger.debug("ffmpeg decode failed for %s: %s", path, e)
+        return None
+    if not proc.stdout:
+        return None
+    return PcmClip(frames=proc.stdout, rate=rate, channels=channels)
+
+
+# Bytes per second of the compressed formats we produce (Edge MP3, cache Opus)
+_BYTE_RATES = {b"ID3": 6000, b"\xff\xf3": 6000, b"\xff\xfb": 6000, b"OggS": 4000}
+
+
+def probe_duration(path: str) -> float:
+    """Playback length in seconds without decoding.
+
+    Exact for WAV; compressed files are estimated from their size and the
+    bitrate this project encodes them with. 0.0 if unknown.
+    """
+    try:
+        with wave.open(path, "rb") as w:
+            return w.getnframes() / w.getframerate() if w.getframerate() else 0.0
+    except (wave.Error, EOFError, OSError):
+        pass
+    try:
+        with open(path, "rb") as f:
+            head = f.read(4)
+        size = os.path.getsize(path)
+    except OSError:
+        return 0.0
+    rate = next((r for magic, r in _BYTE_RATES.items() if head.startswith(magic)), 0)
+    return size / rate if rate else 0.0
+
+
+def stretch(clip: PcmClip, tempo: float) -> PcmClip | None:
+    """Pitch-preserving time-stretch via ffmpeg ``atempo`` (None if unavailable)."""
+    if abs(tempo - 1.0) < 0.01:
+        return clip
+    ffmpeg = ffmpeg_path()
+    if not ffmpeg:
+        return None
+    fmt = ["-f", "s16le", "-ar", str(clip.rate), "-ac", str(clip.channels)]
+    cmd = [
+        ffmpeg, "-v", "quiet", "-nostdin", *fmt, "-i", "pipe:0",
+        "-af", f"atempo={min(2.0, max(0.5, tempo)):.3f}", *fmt, "pipe:1",
+    ]
+    try:
+        proc = subprocess.run(cmd, input=clip.frames, capture_output=True, check=True, timeout=30)
+    except Exception as e:
+        logger.debug("atempo failed: %s", e)
+        return None
+    return PcmClip(frames=proc.stdout, rate=clip.rate, channels=clip.channels)
+
+
+def silence(ms: int, like: PcmClip) -> bytes:
+    """Zero samples of the given length in the clip's format."""
+    n = int(like.rate * ms / 1000) * like.channels * SAMPLE_WIDTH
+    return b"\x00" * n
+
+
+def concat(clips: list[PcmClip], gap_ms: int = 0) -> PcmClip:
+    """Join clips back-to-back with optional silence between them."""
+    if not clips:
+        return PcmClip(frames=b"")
+    first = clips[0]
+    for clip in clips[1:]:
+        if not clip.matches(first):
+            raise ValueError("cannot concatenate clips with different formats")
+    gap = silence(gap_ms, first) if gap_ms > 0 else b""
+    return PcmClip(
+        frames=gap.join(c.frames for c in clips),
+        rate=first.rate,
+        channels=first.channels,
+    )
+
+
+def write_wav(clip: PcmClip, path: str) -> None:
+    with wave.open(path, "wb") as w:
+        w.setnchannels(clip.channels)
+        w.setsampwidth(SAMPLE_WIDTH)
+        w.setframerate(clip.rate)
+        w.writeframes(clip.frames)
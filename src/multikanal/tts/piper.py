@@ -4,9 +4,11 @@ import asyncio
 import logging
 import shutil
 import subprocess
-import tempfile
 from pathlib import Path
 
+from .spool import AudioSpool
+from .voices import VoiceRegistry, VoiceSpec, edge_rate_for_speed
+
 logger = logging.getLogger("multikanal.tts.piper")
 
 
@@ -35,17 +37,49 @@ class PiperTTS:
         default_voice: str = "de",
         speed: float = 1.0,
         voice_settings: dict | None = None,
+        agent_voices: dict | None = None,
+        voice_pools: dict | None = None,
+        spool: AudioSpool | None = None,
     ):
+        self.spool = spool or AudioSpool()
         self._command = command or shutil.which("piper") or ""
-        self._voices = voices or {}
         self.default_voice = default_voice
         self._speed = speed
-        # Edge-TTS rate string: speed 1.2 → "+20%", speed 0.8 → "-20%"
-        pct = int((speed - 1.0) * 100)
-        self._edge_rate = f"{pct:+d}%" if pct != 0 else "+0%"
-        self._voice_settings = voice_settings or {}
+        self._edge_rate = edge_rate_for_speed(speed)
         self._spd_say = "/usr/bin/spd-say"
         self._edge_available = self._check_edge()
+        self.registry = VoiceRegistry.from_config(
+            {
+                "voices": voices or {},
+                "default_voice": default_voice,
+                "speed": speed,
+                "voice_settings": voice_settings or {},
+                "agent_voices": agent_voices or {},
+                "voice_pools": voice_pools or {},
+            },
+            self.EDGE_VOICES,
+        )
+
+    @classmethod
+    def from_config(cls, tts_cfg: dict, spool: AudioSpool | None = None) -> "PiperTTS":
+        return cls(
+            command=tts_cfg.get("command", ""),
+            voices=tts_cfg.get("voices", {}),
+            default_voice=tts_cfg.get("default_voice", "de"),
+            speed=tts_cfg.get("speed", 1.0),
+            voice_settings=tts_cfg.get("voice_settings", {}),
+            agent_voices=tts_cfg.get("agent_voices", {}),
+            voice_pools=tts_cfg.get("voice_pools", {}),
+            spool=spool,
+        )
+
+    def reload_voices(self, tts_cfg: dict) -> None:
+        """Rebuild the voice registry and speed from a fresh ``tts`` config section."""
+        # Swap in one assignment: readers see either the old or the new table
+        self.registry = VoiceRegistry.from_config(tts_cfg, self.EDGE_VOICES)
+        self.default_voice = tts_cfg.get("default_voice", self.default_voice)
+        self._speed = float(tts_cfg.get("speed", 1.0))
+        self._edge_rate = edge_rate_for_speed(self._speed)
 
     def _check_edge(self) -> bool:
         try:
@@ -57,75 +91,62 @@ class PiperTTS:
 
     def resolve_voice(self, key: str) -> str:
         """Resolve a voice key to Edge TTS name or Piper model path."""
-        if not key:
-            return self.EDGE_VOICES.get(
-                self.default_voice, "de-DE-FlorianMultilingualNeural"
-            )
-
-        # Already an Edge TTS voice name
-        if "Neural" in key:
-            return key
-
-        # Check EDGE_VOICES first (agent names)
-        if key in self.EDGE_VOICES:
-            return self.EDGE_VOICES[key]
-
-        # Check if it's a valid Piper model path
-        if key and Path(key).exists() and Path(key).stat().st_size > 10000:
-            return str(Path(key))
-
-        # Fallback to Edge
-        return self.EDGE_VOICES.get(
-            self.default_voice, "de-DE-FlorianMultilingualNeural"
-        )
+        return self.registry.lookup(key).voice
 
     def check_available(self) -> bool:
         return self._edge_available or Path(self._spd_say).exists()
 
     def synthesize(self, text: str, voice: str) -> str | None:
+        """Synthesize to a spool file owned by the caller (release when done)."""
+        return self.synthesize_backend(text, voice)[0]
+
+    def primary_backend(self, spec: VoiceSpec) -> str:
+        """Engine that speaks ``spec`` while nothing is failing."""
+        if self._edge_available:
+            return "edge"
+        if self._command and spec.backend == "piper" and spec.voice.endswith(".onnx"):
+            return "piper"
+        return "spd-say"
+
+    def synthesize_backend(self, text: str, voice: str) -> tuple[str | None, str]:
+        """Like ``synthesize``, plus the engine that produced the audio.
+
+        An engine other than ``primary_backend`` means a fallback kicked in;
+        such audio must not be cached under the voice's ``cache_id``.
+        """
         if not text.strip():
-            return None
+            return None, ""
 
-        outfile = tempfile.NamedTemporaryFile(
-            suffix=".wav", delete=False, prefix="multikanal_"
-        )
-        outpath = Path(outfile.name)
-        outfile.close()
+        outpath = Path(self.spool.new_path())
 
-        voice_name = self.resolve_voice(voice)
+        spec = self.registry.lookup(voice)
+        voice_name = spec.voice
 
         # 1) Edge TTS FIRST (best quality, always works)
         if self._edge_available:
-            if self._synthesize_edge(text, voice_name, str(outpath)):
-                return str(outpath)
+            if self._synthesize_edge(text, spec, str(outpath)):
+                return str(outpath), "edge"
 
-        # 2) Piper only if valid model exists
-        if self._command and voice_name.endswith(".onnx") and Path(voice_name).exists():
+        # 2) Piper only if valid model exists (validated when the registry was built)
+        if self._command and spec.backend == "piper" and voice_name.endswith(".onnx"):
             if self._synthesize_piper(text, voice_name, outpath):
-                return str(outpath)
+                return str(outpath), "piper"
 
         # 3) spd-say last resort
         if self._synthesize_spd_say(text, voice_name, str(outpath)):
-            return str(outpath)
+            return str(outpath), "spd-say"
 
-        outpath.unlink(missing_ok=True)
-        return None
+        self.spool.release(str(outpath))
+        return None, ""
 
-    def _synthesize_edge(self, text: str, voice: str, outpath: str) -> bool:
+    def _synthesize_edge(self, text: str, spec: VoiceSpec, outpath: str) -> bool:
         if not self._edge_available:
             return False
 
         try:
             import edge_tts
 
-            # Per-voice rate/pitch override
-            rate = self._edge_rate
-            pitch = "+0Hz"
-            for key, settings in self._voice_settings.items():
-                if isinstance(settings, dict) and self.resolve_voice(key) == voice:
-                    rate = settings.get("rate", rate)
-                    pitch = settings.get("pitch", pitch)
-                    break
+            voice, rate, pitch = spec.voice, spec.rate, spec.pitch
 
             async def _save():
                 communicate = edge_tts.Communicate(text, voice, rate=rate, pitch=pitch)
@@ -148,8 +169,6 @@ class PiperTTS:
     def _synthesize_piper(self, text: str, voice: str, outpath: Path) -> bool:
         if not self._command:
             return False
-        if not voice.endswith(".onnx") or not Path(voice).exists():
-            return False
 
         try:
             cmd = [self._command, "--model", voice, "--output_file", str(outpath)]
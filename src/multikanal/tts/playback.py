@@ -1,52 +1,75 @@
-"""Audio playback with multi-tool fallback and sink/volume support."""
+"""Audio playback with multi-tool fallback and sink/volume support.
+
+Clips go to a persistent ``PcmStream`` when one is available (gapless, no
+per-clip process spawn); otherwise each file is handed to a player tool.
+ffplay applies a tempo itself; for paplay and aplay the file is
+time-stretched with ffmpeg first, and without ffmpeg they play at 1.0x.
+"""
 
 import logging
 import os
-import shutil
 import subprocess
+import tempfile
+
+from . import pcm
+from .stream import PcmStream, which
 
 logger = logging.getLogger("multikanal.tts.playback")
 
 # Playback tools in preference order
 _PLAYBACK_TOOLS = ["paplay", "ffplay", "aplay"]
+# Tools that take a tempo argument (others get a pre-stretched file)
+_TEMPO_TOOLS = {"ffplay"}
 
 
 class AudioPlayer:
-    """Fallback playback: paplay -> ffplay -> aplay, with optional sink/volume."""
+    """Stream playback, falling back to paplay -> ffplay -> aplay per file."""
 
-    def __init__(self, tool: str = ""):
+    def __init__(self, tool: str = "", stream: PcmStream | None = None):
         self._preferred = tool
+        self._stream = stream
         self._process: subprocess.Popen | None = None
+        # Set by stop(): the current file must not be retried with another tool
+        self._interrupted = False
+        self._envs: dict[str, dict] = {}
+
+    @classmethod
+    def from_config(cls, playback_cfg: dict) -> "AudioPlayer":
+        return cls(
+            tool=playback_cfg.get("tool", ""),
+            stream=PcmStream.from_config(playback_cfg),
+        )
 
     def stop(self):
         """Stop currently playing audio."""
-        if self._process:
+        self._interrupted = True
+        if self._stream:
+            self._stream.stop()
+        process, self._process = self._process, None
+        if process:
             try:
-                self._process.terminate()
-                self._process = None
+                process.terminate()
             except Exception:
                 pass
 
-    def _candidates(self, wav_path: str, sink: str, volume: float):
-        env_base = os.environ.copy()
-        if sink:
-            env_base["PULSE_SINK"] = sink
+    def _env(self, sink: str) -> dict:
+        env = self._envs.get(sink)
+        if env is None:
+            env = os.environ.copy()
+            if sink:
+                env["PULSE_SINK"] = sink
+            self._envs[sink] = env
+        return env
+
+    def _candidates(self, wav_path: str, sink: str, volume: float, tempo: float = 1.0):
+        env_base = self._env(sink)
 
         vol = max(0.1, min(volume, 2.0))
         paplay_vol = int(min(65536, max(3277, vol * 65536)))  # ~5%..200%
         ffplay_vol = int(min(100, max(5, vol * 100)))
 
-        tools = []
-        if self._preferred:
-            tools.append(self._preferred)
-        tools += _PLAYBACK_TOOLS
-
-        seen = set()
-        for tool in tools:
-            if tool in seen:
-                continue
-            seen.add(tool)
-            if shutil.which(tool):
+        for tool in self._tools():
+            if which(tool):
                 if tool == "paplay":
                     cmd = ["paplay"]
                     if paplay_vol and paplay_vol != 65536:
@@ -61,30 +84,108 @@ class AudioPlayer:
                         "quiet",
                         "-volume",
                         str(ffplay_vol),
-                        wav_path,
                     ]
+                    if tempo != 1.0:
+                        cmd += ["-af", f"atempo={tempo:.3f}"]
+                    cmd += [wav_path]
                 else:  # aplay
                     cmd = ["aplay", wav_path]
                 yield cmd, env_base
 
-    def play(self, wav_path: str, sink: str = "", volume: float = 1.0) -> bool:
-        for cmd, env in self._candidates(wav_path, sink, volume):
-            tool = cmd[0]
-            try:
-                self._process = subprocess.Popen(
-                    cmd, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
-                )
-                self._process.wait()
-                if self._process.returncode == 0:
-                    logger.info(
-                        "played audio with %s (sink=%s, vol=%.2f)",
-                        tool,
-                        sink or "default",
-                        volume,
+    def _tools(self) -> list[str]:
+        tools = [self._preferred] if self._preferred else []
+        return list(dict.fromkeys(tools + _PLAYBACK_TOOLS))
+
+    def effective_tempo(self, tempo: float) -> float:
+        """The tempo ``play`` will actually achieve for a requested one."""
+        if tempo == 1.0 or pcm.ffmpeg_path():
+            return tempo
+        # Without ffmpeg neither the stream nor paplay/aplay can stretch
+        if self._stream:
+            return 1.0
+        tool = next((t for t in self._tools() if which(t)), "")
+        return tempo if tool in _TEMPO_TOOLS else 1.0
+
+    def _stretched(self, wav_path: str, tempo: float) -> str | None:
+        """Temporary WAV of ``wav_path`` at ``tempo`` (None if ffmpeg can't)."""
+        clip = pcm.load(wav_path)
+        stretched = pcm.stretch(clip, tempo) if clip is not None else None
+        if stretched is None or stretched is clip:
+            return None
+        tmp = tempfile.NamedTemporaryFile(suffix=".wav", prefix="mk_tempo_", delete=False)
+        tmp.close()
+        pcm.write_wav(stretched, tmp.name)
+        return tmp.name
+
+    @property
+    def stream_format(self) -> tuple[int, int] | None:
+        """(rate, channels) a clip needs for ``play_clip``; None without a stream."""
+        return (self._stream.rate, self._stream.channels) if self._stream else None
+
+    def play_clip(
+        self, clip: pcm.PcmClip, sink: str = "", volume: float = 1.0, tempo: float = 1.0
+    ) -> bool:
+        """Write decoded PCM to the stream; returns once it has nearly played."""
+        if not self._stream:
+            return False
+        if tempo != 1.0:
+            clip = pcm.stretch(clip, tempo) or clip
+        if not self._stream.write(clip, sink, volume):
+            return False
+        self._stream.wait()
+        logger.info(
+            "streamed audio via %s (sink=%s, vol=%.2f, tempo=%.2f)",
+            self._stream.tool,
+            sink or "default",
+            volume,
+            tempo,
+        )
+        return True
+
+    def play(
+        self, wav_path: str, sink: str = "", volume: float = 1.0, tempo: float = 1.0
+    ) -> bool:
+        """Play a file to completion; ``tempo`` > 1 speeds it up (pitch kept).
+
+        Returns False if no tool could play it or ``stop`` interrupted it.
+        """
+        self._interrupted = False
+        if self._stream:
+            clip = pcm.load(wav_path, rate=self._stream.rate, channels=self._stream.channels)
+            if clip is not None and self.play_clip(clip, sink, volume, tempo):
+                return True
+        stretched = None  # temporary WAV for tools without a tempo option
+        try:
+            for cmd, env in self._candidates(wav_path, sink, volume, tempo):
+                tool = cmd[0]
+                if self._interrupted:
+                    return False
+                if tempo != 1.0 and tool not in _TEMPO_TOOLS:
+                    stretched = stretched or self._stretched(wav_path, tempo)
+                    if stretched:
+                        cmd = cmd[:-1] + [stretched]
+                try:
+                    process = subprocess.Popen(
+                        cmd, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
                     )
-                    return True
-            except Exception as exc:  # pragma: no cover
-                logger.debug("playback failed with %s: %s", tool, exc)
-                continue
-        logger.warning("no playback tool succeeded")
-        return False
+                    self._process = process
+                    process.wait()
+                    if self._interrupted:
+                        logger.debug("playback with %s interrupted", tool)
+                        return False
+                    if process.returncode == 0:
+                        logger.info(
+                            "played audio with %s (sink=%s, vol=%.2f)",
+                            tool,
+                            sink or "default",
+                            volume,
+                        )
+                        return True
+                except Exception as exc:  # pragma: no cover
+                    logger.debug("playback failed with %s: %s", tool, exc)
+                    continue
+            logger.warning("no playback tool succeeded")
+            return False
+        finally:
+            if stretched:
+                os.unlink(stretched)
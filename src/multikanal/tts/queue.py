@@ -0,0 +1,277 @@
+"""Playback queue with backlog accounting and an adaptive tempo policy.
+
+Clips carry their duration, so the queue always knows how many seconds
+of audio are pending. ``TempoPolicy`` turns that backlog into a playback
+rate: 1.0x when idle, ramping up to ``max_rate`` as the backlog grows,
+so a burst from several agents drains instead of overflowing the queue.
+
+Backlog can also be shed explicitly: skip the current clip, flush queued
+clips by session or source, pause/resume, or keep only the latest clip
+per session.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Callable
+
+from .pcm import PcmClip
+
+logger = logging.getLogger("multikanal.tts.queue")
+
+
+@dataclass
+class QueuedClip:
+    """One utterance waiting for (or in) playback.
+
+    ``pcm`` holds the decoded audio when it was assembled or served from
+    memory; it is streamed directly and ``path`` (if any) is the fallback.
+    """
+
+    path: str
+    audio_cfg: dict
+    duration: float = 0.0
+    source: str = ""
+    session_id: str = ""
+    enqueued: float = field(default_factory=time.monotonic)
+    done: asyncio.Event = field(default_factory=asyncio.Event)
+    # played | skipped | flushed | replaced | dropped | failed
+    outcome: str = ""
+    pcm: PcmClip | None = None
+
+
+class TempoPolicy:
+    """Maps pending audio seconds to a playback rate.
+
+    Below ``start_seconds`` of backlog clips play at 1.0x; the rate rises
+    linearly to ``max_rate`` at ``full_seconds`` and stays there. Rates
+    are rounded to ``step`` so small backlog changes do not jitter.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        max_rate: float = 1.4,
+        start_seconds: float = 8.0,
+        full_seconds: float = 30.0,
+        step: float = 0.05,
+    ):
+        self.enabled = enabled
+        self.max_rate = max(1.0, min(max_rate, 2.0))
+        self.start_seconds = start_seconds
+        self.full_seconds = max(full_seconds, start_seconds + 0.1)
+        self.step = step
+
+    @classmethod
+    def from_config(cls, tempo_cfg: dict) -> "TempoPolicy":
+        return cls(
+            enabled=tempo_cfg.get("enabled", True),
+            max_rate=tempo_cfg.get("max_rate", 1.4),
+            start_seconds=tempo_cfg.get("start_seconds", 8.0),
+            full_seconds=tempo_cfg.get("full_seconds", 30.0),
+        )
+
+    def rate_for(self, pending_seconds: float) -> float:
+        if not self.enabled or pending_seconds <= self.start_seconds:
+            return 1.0
+        span = self.full_seconds - self.start_seconds
+        frac = min(1.0, (pending_seconds - self.start_seconds) / span)
+        rate = 1.0 + frac * (self.max_rate - 1.0)
+        return round(round(rate / self.step) * self.step, 2)
+
+    def describe(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "max_rate": self.max_rate,
+            "start_seconds": self.start_seconds,
+            "full_seconds": self.full_seconds,
+        }
+
+
+class PlaybackQueue:
+    """Bounded FIFO of ``QueuedClip`` with pending-seconds and drain stats.
+
+    A backlog episode starts when a clip is queued while another is
+    playing and ends when the queue runs empty; its wall time and audio
+    length are recorded so drain time with and without the tempo policy
+    can be compared (``drain_speedup`` = audio seconds / wall seconds).
+
+    ``on_discard`` is called for every queued clip removed without being
+    played (flushed or replaced), so the owner can release its file.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 5,
+        latest_per_session: bool = False,
+        on_discard: Callable[[QueuedClip], None] | None = None,
+    ):
+        self.maxsize = maxsize
+        self.latest_per_session = latest_per_session
+        self._on_discard = on_discard
+        self._items: collections.deque[QueuedClip] = collections.deque()
+        self._ready = asyncio.Event()
+        self._resumed = asyncio.Event()
+        self._resumed.set()
+        # Why the current clip was cut short: "skip" or "pause"
+        self._interrupt = ""
+        self.current: QueuedClip | None = None
+        self._current_rate = 1.0
+        self._current_started = 0.0
+        self.dropped = 0
+        self.flushed = 0
+        self.skipped = 0
+        self.played = 0
+        self.seconds_saved = 0.0
+        self._episode_start = 0.0
+        self._episode_audio = 0.0
+        self.last_drain: dict = {}
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def put(self, clip: QueuedClip) -> bool:
+        """Enqueue a clip; False (and counted as dropped) when full.
+
+        With ``latest_per_session``, pending clips of the same session are
+        replaced by the new one.
+        """
+        if self.latest_per_session and clip.session_id:
+            stale = [c for c in self._items if c.session_id == clip.session_id]
+            for old in stale:
+                self._items.remove(old)
+                self._discard(old, "replaced")
+            self.flushed += len(stale)
+        if len(self._items) >= self.maxsize:
+            self.dropped += 1
+            clip.outcome = "dropped"
+            clip.done.set()
+            return False
+        if self.current is not None and not self._episode_start:
+            self._episode_start = self._current_started
+            self._episode_audio = self.current.duration
+        if self._episode_start:
+            self._episode_audio += clip.duration
+        self._items.append(clip)
+        self._ready.set()
+        return True
+
+    async def get(self) -> QueuedClip:
+        while True:
+            await self._resumed.wait()
+            if self._items:
+                return self._items.popleft()
+            self._ready.clear()
+            await self._ready.wait()
+
+    def _discard(self, clip: QueuedClip, outcome: str) -> None:
+        clip.outcome = outcome
+        if self._on_discard:
+            self._on_discard(clip)
+        clip.done.set()
+
+    def flush(self, session_id: str = "", source: str = "") -> int:
+        """Drop queued clips of a session and/or source (all if neither given)."""
+        keep: collections.deque[QueuedClip] = collections.deque()
+        removed = 0
+        for clip in self._items:
+            if (not session_id or clip.session_id == session_id) and (
+                not source or clip.source == source
+            ):
+                self._discard(clip, "flushed")
+                removed += 1
+            else:
+                keep.append(clip)
+        self._items = keep
+        self.flushed += removed
+        if removed:
+            logger.info("flushed %d queued clips", removed)
+        return removed
+
+    def interrupt(self, reason: str) -> bool:
+        """Flag the current clip as cut short; the caller stops the player."""
+        if self.current is None:
+            return False
+        self._interrupt = reason
+        return True
+
+    def take_interrupt(self) -> str:
+        reason, self._interrupt = self._interrupt, ""
+        return reason
+
+    def requeue(self, clip: QueuedClip) -> None:
+        """Put an interrupted clip back at the head (replayed from its start)."""
+        if self.current is clip:
+            self.current = None
+        self._items.appendleft(clip)
+        self._ready.set()
+
+    def pause(self) -> None:
+        self._resumed.clear()
+
+    def resume(self) -> None:
+        self._resumed.set()
+
+    @property
+    def paused(self) -> bool:
+        return not self._resumed.is_set()
+
+    def start(self, clip: QueuedClip, rate: float) -> None:
+        """Mark a clip as playing at the given rate."""
+        self.current = clip
+        self._current_rate = rate
+        self._current_started = time.monotonic()
+
+    def finish(self, clip: QueuedClip) -> None:
+        """Mark a clip as done (played, skipped or failed) and wake its waiter."""
+        if not clip.outcome:
+            clip.outcome = "played"
+        if clip.outcome == "skipped":
+            self.skipped += 1
+        if self.current is clip:
+            if clip.duration and self._current_rate > 1.0:
+                self.seconds_saved += clip.duration - clip.duration / self._current_rate
+            self.current = None
+            self.played += 1
+        clip.done.set()
+        if not self._items and self._episode_start:
+            wall = time.monotonic() - self._episode_start
+            self.last_drain = {
+                "wall_seconds": round(wall, 1),
+                "audio_seconds": round(self._episode_audio, 1),
+                "drain_speedup": round(self._episode_audio / wall, 2) if wall else 1.0,
+            }
+            logger.info(
+                "queue drained: %.1fs audio in %.1fs", self._episode_audio, wall
+            )
+            self._episode_start = 0.0
+            self._episode_audio = 0.0
+
+    def pending_seconds(self) -> float:
+        """Queued audio plus what is left of the current clip (at 1.0x)."""
+        pending = sum(c.duration for c in self._items)
+        if self.current is not None:
+            elapsed = (time.monotonic() - self._current_started) * self._current_rate
+            pending += max(0.0, self.current.duration - elapsed)
+        return pending
+
+    def stats(self) -> dict:
+        return {
+            "queued": len(self._items),
+            "maxsize": self.maxsize,
+            "playing": self.current is not None,
+            "paused": self.paused,
+            "latest_per_session": self.latest_per_session,
+            "pending_seconds": round(self.pending_seconds(), 1),
+            "current_rate": self._current_rate if self.current is not None else 1.0,
+            "played": self.played,
+            "dropped": self.dropped,
+            "flushed": self.flushed,
+            "skipped": self.skipped,
+            "seconds_saved": round(self.seconds_saved, 1),
+            "last_drain": self.last_drain,
+        }
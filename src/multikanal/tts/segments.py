@@ -0,0 +1,158 @@
+"""Segment-level synthesis: cache constant parts separately, stitch as PCM.
+
+A narration is spoken as ``"<title>: <prefix><narration>"``. Title and
+prefix repeat constantly, so each part is synthesized and cached on its
+own and the final utterance is assembled from decoded PCM.
+
+Audio from a fallback engine (spd-say/Piper while Edge is down) is never
+cached under the voice's key, or later hits would keep replaying it
+after Edge recovers.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Iterable, NamedTuple
+
+from . import pcm
+from .cache import AudioCache
+from .piper import PiperTTS
+
+logger = logging.getLogger("multikanal.tts.segments")
+
+
+def split_utterance(narration: str, prefix: str = "", title: str = "") -> list[str]:
+    """Return the spoken segments in order, dropping empty parts."""
+    segments = []
+    if title.strip():
+        segments.append(f"{title.strip()}:")
+    if prefix.strip():
+        segments.append(prefix.strip())
+    if narration.strip():
+        segments.append(narration.strip())
+    return segments
+
+
+class Synthesized(NamedTuple):
+    """Audio for an utterance."""
+
+    # Cache entry or caller-owned spool file (None on failure)
+    path: str | None
+    # A fallback engine produced part of it: do not cache the result
+    degraded: bool = False
+    # Decoded audio when the utterance was stitched in memory
+    clip: pcm.PcmClip | None = None
+
+
+class SegmentedSynthesizer:
+    """Synthesizes each segment through the audio cache and joins them."""
+
+    def __init__(
+        self,
+        tts: PiperTTS,
+        cache: AudioCache,
+        gap_ms: int = 120,
+        sample_rate: int = pcm.DEFAULT_RATE,
+    ):
+        self._tts = tts
+        self._cache = cache
+        self._gap_ms = gap_ms
+        self._rate = sample_rate
+
+    def segment(self, text: str, voice_key: str) -> str | None:
+        """Audio for one segment, synthesizing on miss.
+
+        A cache path, or a spool file owned by the caller if a fallback
+        engine produced it; pass it to ``spool.release`` when done.
+        """
+        return self._segment(text, voice_key)[0]
+
+    def _segment(self, text: str, voice_key: str) -> tuple[str | None, bool]:
+        """(path, produced by a fallback engine) for one segment."""
+        cache_id = self._tts.registry.lookup(voice_key).cache_id
+        cached = self._cache.get(text, cache_id)
+        if cached:
+            return cached, False
+        return self._fill(text, voice_key, cache_id)
+
+    def _fill(self, text: str, voice_key: str, cache_id: str) -> tuple[str | None, bool]:
+        """Synthesize a missing segment into the cache.
+
+        Fallback-engine audio is returned uncached as a caller-owned spool
+        file, with the second value True.
+        """
+        spec = self._tts.registry.lookup(voice_key)
+        wav_path, backend = self._tts.synthesize_backend(text, voice_key)
+        if not wav_path:
+            return None, False
+        if backend != self._tts.primary_backend(spec):
+            logger.info("segment synthesized by fallback %s, not caching it", backend)
+            return wav_path, True
+        cached = self._cache.put(text, cache_id, wav_path)
+        self._tts.spool.release(wav_path)
+        return cached, False
+
+    def synthesize(self, segments: list[str], voice_key: str) -> Synthesized:
+        """Produce one playable file for all segments.
+
+        The path is either a cache entry or a spool file owned by the
+        caller; pass it to ``spool.release`` when done (no-op for cache
+        paths). Stitched utterances also carry their decoded ``clip``, so
+        playback can stream it without reading the file back.
+
+        The path is None if any segment fails or cannot be decoded; the
+        caller then falls back to synthesizing the whole utterance in one go.
+        """
+        if not segments:
+            return Synthesized(None)
+        if len(segments) == 1:
+            return Synthesized(*self._segment(segments[0], voice_key))
+
+        cache_id = self._tts.registry.lookup(voice_key).cache_id
+        clips = []
+        degraded = False
+        for text in segments:
+            # Hot segments (titles, prefixes) come straight from RAM
+            clip = self._cache.get_clip(text, cache_id, rate=self._rate)
+            if clip is None:
+                if self._cache.contains(text, cache_id):
+                    return Synthesized(None)  # cached but undecodable (no ffmpeg)
+                path, fallback = self._fill(text, voice_key, cache_id)
+                clip = pcm.load(path, rate=self._rate) if path else None
+                if path and fallback:
+                    self._tts.spool.release(path)
+                degraded = degraded or fallback
+                if clip is None:
+                    return Synthesized(None)
+                if not fallback:
+                    self._cache.compress(path)
+            clips.append(clip)
+
+        stitched = pcm.concat(clips, self._gap_ms)
+        out = self._tts.spool.new_path()
+        # Still written: the audio tier caches the whole utterance from it
+        pcm.write_wav(stitched, out)
+        logger.debug("stitched %d segments -> %s", len(clips), out)
+        return Synthesized(out, degraded, stitched)
+
+    def warm(self, pairs: Iterable[tuple[str, str]]) -> int:
+        """Pre-synthesize (text, voice_key) segments. Returns how many were new."""
+        created = 0
+        for text, voice_key in pairs:
+            text = text.strip()
+            if not text:
+                continue
+            cache_id = self._tts.registry.lookup(voice_key).cache_id
+            # Probe without hit/miss accounting or decode-on-hit spool files
+            if self._cache.contains(text, cache_id):
+                continue
+            path, fallback = self._fill(text, voice_key, cache_id)
+            if fallback:
+                # Not cached: nothing warmed
+                self._tts.spool.release(path)
+            elif path:
+                self._cache.compress(path)
+                created += 1
+        if created:
+            logger.info("warmed %d audio segments", created)
+        return created
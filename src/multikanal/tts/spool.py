@@ -0,0 +1,126 @@
+"""Managed spool directory for transient audio files.
+
+Every synthesized or stitched file lives here until the last holder
+(pipeline, audio queue, player) releases it. Reference counts replace
+the old ``NamedTemporaryFile(delete=False)`` files that were never
+removed from /tmp.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import pathlib
+import tempfile
+import threading
+import time
+import uuid
+
+logger = logging.getLogger("multikanal.tts.spool")
+
+# Files the pre-spool code leaked into the system temp dir
+_LEGACY_GLOB = "multikanal_*.wav"
+
+
+def default_spool_dir() -> str:
+    """tmpfs (/dev/shm) when available, else the system temp dir."""
+    base = tempfile.gettempdir()
+    if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK):
+        base = "/dev/shm"
+    return os.path.join(base, f"multikanal-{os.getuid()}")
+
+
+class AudioSpool:
+    """Reference-counted temporary audio files in one directory."""
+
+    def __init__(self, directory: str = "", stale_seconds: float = 600):
+        self._dir = pathlib.Path(os.path.expanduser(directory or default_spool_dir()))
+        self._dir.mkdir(parents=True, exist_ok=True)
+        self._stale_seconds = stale_seconds
+        self._refs: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._created = 0
+        self._deleted = 0
+
+    @property
+    def directory(self) -> pathlib.Path:
+        return self._dir
+
+    def new_path(self, suffix: str = ".wav", prefix: str = "mk_") -> str:
+        """Reserve a new spool file name, owned by the caller (refcount 1)."""
+        path = str(self._dir / f"{prefix}{uuid.uuid4().hex[:16]}{suffix}")
+        with self._lock:
+            self._refs[path] = 1
+            self._created += 1
+        return path
+
+    def owns(self, path: str) -> bool:
+        with self._lock:
+            return path in self._refs
+
+    def acquire(self, path: str) -> bool:
+        """Add a holder. Returns False for files the spool does not manage."""
+        with self._lock:
+            if path not in self._refs:
+                return False
+            self._refs[path] += 1
+            return True
+
+    def release(self, path: str | None) -> None:
+        """Drop a holder; the file is deleted when nobody holds it any more."""
+        if not path:
+            return
+        with self._lock:
+            count = self._refs.get(path)
+            if count is None:
+                return
+            if count > 1:
+                self._refs[path] = count - 1
+                return
+            del self._refs[path]
+            self._deleted += 1
+        pathlib.Path(path).unlink(missing_ok=True)
+
+    def sweep(self) -> int:
+        """Delete unreferenced files older than ``stale_seconds``.
+
+        Also removes ``/tmp/multikanal_*.wav`` leftovers from older versions.
+        """
+        cutoff = time.time() - self._stale_seconds
+        with self._lock:
+            live = set(self._refs)
+        candidates = list(self._dir.iterdir())
+        candidates += list(pathlib.Path(tempfile.gettempdir()).glob(_LEGACY_GLOB))
+        removed = 0
+        for path in candidates:
+            if str(path) in live:
+                continue
+            try:
+                if path.is_file() and path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    removed += 1
+            except OSError:
+                pass
+        if removed:
+            logger.info("spool sweep removed %d stale files", removed)
+        return removed
+
+    def stats(self) -> dict:
+        with self._lock:
+            live = dict(self._refs)
+            created, deleted = self._created, self._deleted
+        files = nbytes = 0
+        for path in self._dir.iterdir():
+            try:
+                nbytes += path.stat().st_size
+                files += 1
+            except OSError:
+                pass
+        return {
+            "path": str(self._dir),
+            "files": files,
+            "bytes": nbytes,
+            "referenced": len(live),
+            "created": created,
+            "deleted": deleted,
+        }
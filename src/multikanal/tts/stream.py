@@ -0,0 +1,225 @@
+"""Persistent PCM output stream: one long-lived player fed raw frames.
+
+Spawning a player per clip costs a process start and an audio-device open
+each time, and leaves audible gaps/clicks between clips. ``PcmStream``
+keeps a single ``pacat`` (PulseAudio/PipeWire), ``ffmpeg`` or ``aplay``
+process running and writes s16le frames to its stdin back-to-back.
+Volume is applied to the samples before writing.
+"""
+
+from __future__ import annotations
+
+import array
+import functools
+import logging
+import os
+import shutil
+import subprocess
+import sys
+import threading
+import time
+
+from .pcm import DEFAULT_CHANNELS, DEFAULT_RATE, PcmClip
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+logger = logging.getLogger("multikanal.tts.stream")
+
+# Stream tools in preference order
+STREAM_TOOLS = ["pacat", "ffmpeg", "aplay"]
+
+
+@functools.lru_cache(maxsize=None)
+def which(tool: str) -> str:
+    """shutil.which, resolved once per process ("" if missing)."""
+    return shutil.which(tool) or ""
+
+
+def stream_command(
+    tool: str, rate: int, channels: int, sink: str = "", latency_ms: int = 100
+) -> list[str] | None:
+    """Command line reading raw s16le PCM from stdin, or None if unsupported."""
+    path = which(tool)
+    if not path:
+        return None
+    if tool == "pacat":
+        cmd = [
+            path, "--playback", "--raw", "--format=s16le",
+            f"--rate={rate}", f"--channels={channels}",
+            f"--latency-msec={latency_ms}", "--client-name=multikanal",
+        ]
+        if sink:
+            cmd.append(f"--device={sink}")
+        return cmd
+    if tool == "ffmpeg":
+        return [
+            path, "-v", "quiet", "-nostdin", "-f", "s16le", "-ar", str(rate),
+            "-ac", str(channels), "-i", "pipe:0", "-f", "pulse",
+            "-name", "multikanal", sink or "default",
+        ]
+    if tool == "aplay":
+        return [path, "-q", "-t", "raw", "-f", "S16_LE", "-r", str(rate), "-c", str(channels)]
+    return None
+
+
+def apply_volume(frames: bytes, volume: float) -> bytes:
+    """Scale s16le samples, clipping at full scale."""
+    if abs(volume - 1.0) < 1e-3 or not frames:
+        return frames
+    if np is not None:
+        samples = np.frombuffer(frames, dtype="<i2").astype(np.float32) * volume
+        return np.clip(samples, -32768, 32767).astype("<i2").tobytes()
+    samples = array.array("h", frames[: len(frames) // 2 * 2])
+    if sys.byteorder == "big":
+        samples.byteswap()
+    scaled = array.array(
+        "h", (max(-32768, min(32767, int(s * volume))) for s in samples)
+    )
+    if sys.byteorder == "big":
+        scaled.byteswap()
+    return scaled.tobytes()
+
+
+class PcmStream:
+    """A long-lived output process that clips are written into.
+
+    ``write`` returns once the frames are handed to the player (the pipe
+    applies back-pressure); ``wait`` blocks until the written audio has
+    almost finished, leaving ``lead_ms`` so the next clip follows without
+    a gap. ``stop`` kills the process, discarding anything still buffered.
+    """
+
+    def __init__(
+        self,
+        tool: str = "",
+        rate: int = DEFAULT_RATE,
+        channels: int = DEFAULT_CHANNELS,
+        latency_ms: int = 100,
+        lead_ms: int = 150,
+    ):
+        self.rate = rate
+        self.channels = channels
+        self._latency_ms = latency_ms
+        self._lead = lead_ms / 1000
+        tools = [tool] if tool in STREAM_TOOLS else []
+        self._tools = tools + [t for t in STREAM_TOOLS if t not in tools]
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._process: subprocess.Popen | None = None
+        self._sink = ""
+        self._tool = ""
+        self._ends_at = 0.0
+
+    @classmethod
+    def from_config(cls, playback_cfg: dict) -> "PcmStream | None":
+        if not playback_cfg.get("stream", True):
+            return None
+        stream = cls(
+            tool=playback_cfg.get("stream_tool", ""),
+            rate=playback_cfg.get("stream_rate", DEFAULT_RATE),
+            latency_ms=playback_cfg.get("stream_latency_ms", 100),
+            lead_ms=playback_cfg.get("stream_lead_ms", 150),
+        )
+        return stream if stream.available else None
+
+    @property
+    def available(self) -> bool:
+        return any(which(t) for t in self._tools)
+
+    @property
+    def tool(self) -> str:
+        return self._tool
+
+    def _ensure(self, sink: str) -> subprocess.Popen | None:
+        proc = self._process
+        if proc and proc.poll() is None and sink == self._sink:
+            return proc
+        self._close()
+        for tool in self._tools:
+            cmd = stream_command(tool, self.rate, self.channels, sink, self._latency_ms)
+            if not cmd:
+                continue
+            env = None
+            if sink and tool != "pacat":
+                env = {**os.environ, "PULSE_SINK": sink}
+            try:
+                proc = subprocess.Popen(
+                    cmd,
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    env=env,
+                )
+            except OSError as e:
+                logger.debug("cannot start %s: %s", tool, e)
+                continue
+            # A player that cannot open the device exits right away
+            time.sleep(0.05)
+            if proc.poll() is not None:
+                logger.debug("%s exited on start (code %s)", tool, proc.returncode)
+                continue
+            self._process, self._sink, self._tool = proc, sink, tool
+            self._ends_at = 0.0
+            logger.info(
+                "audio stream open: %s (%d Hz, sink=%s)", tool, self.rate, sink or "default"
+            )
+            return proc
+        return None
+
+    def write(self, clip: PcmClip, sink: str = "", volume: float = 1.0) -> bool:
+        """Queue a clip for playback right after whatever is already buffered."""
+        if clip.rate != self.rate or clip.channels != self.channels:
+            logger.debug("clip format %d/%d does not match stream", clip.rate, clip.channels)
+            return False
+        frames = apply_volume(clip.frames, volume)
+        with self._lock:
+            self._stopped.clear()
+            proc = self._ensure(sink)
+            if proc is None:
+                return False
+            now = time.monotonic()
+            self._ends_at = max(now, self._ends_at) + clip.duration
+            try:
+                proc.stdin.write(frames)
+                proc.stdin.flush()
+            except (BrokenPipeError, OSError, ValueError) as e:
+                logger.debug("audio stream write failed: %s", e)
+                self._close()
+                # Killed by stop(): the clip was cut on purpose, not failed
+                return self._stopped.is_set()
+        return True
+
+    def wait(self) -> bool:
+        """Block until buffered audio is about to run out. False if stopped."""
+        remaining = self._ends_at - self._lead - time.monotonic()
+        if remaining > 0:
+            return not self._stopped.wait(remaining)
+        return not self._stopped.is_set()
+
+    def pending_seconds(self) -> float:
+        """Audio written but not yet played (estimate)."""
+        return max(0.0, self._ends_at - time.monotonic())
+
+    def stop(self) -> None:
+        """Cut playback now: drop buffered audio and close the player."""
+        self._stopped.set()
+        proc = self._process
+        if proc is not None:
+            # Unblocks a writer stuck on a full pipe before taking the lock
+            proc.kill()
+        with self._lock:
+            self._close()
+
+    def _close(self) -> None:
+        proc, self._process = self._process, None
+        self._ends_at = 0.0
+        if proc is None:
+            return
+        try:
+            proc.kill()
+            proc.wait(timeout=1)
+        except Exception:  # noqa: BLE001
+            pass
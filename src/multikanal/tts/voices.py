@@ -0,0 +1,200 @@
+"""Precompiled voice registry: voice key → backend, model, rate, pitch.
+
+Built once at startup (and again on config reload) so that the hot path
+never touches the filesystem or scans ``voice_settings`` per narration.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping
+
+logger = logging.getLogger("multikanal.tts.voices")
+
+FALLBACK_EDGE_VOICE = "de-DE-FlorianMultilingualNeural"
+
+# Piper models below this size are treated as broken downloads
+_MIN_PIPER_MODEL_BYTES = 10000
+
+
+@dataclass(frozen=True)
+class VoiceSpec:
+    """Fully resolved voice: what to call and with which parameters."""
+
+    backend: str  # "edge" | "piper"
+    voice: str  # Edge voice name or Piper model path
+    rate: str = "+0%"
+    pitch: str = "+0Hz"
+
+    @property
+    def cache_id(self) -> str:
+        """Stable identifier for cache keys (voice + prosody)."""
+        return f"{self.voice}|{self.rate}|{self.pitch}"
+
+
+def edge_rate_for_speed(speed: float) -> str:
+    """Edge-TTS rate string: speed 1.2 → "+20%", speed 0.8 → "-20%"."""
+    pct = int(round((speed - 1.0) * 100))
+    return f"{pct:+d}%" if pct != 0 else "+0%"
+
+
+class VoiceRegistry:
+    """Immutable lookup table built from the ``tts`` config section."""
+
+    def __init__(
+        self,
+        specs: Mapping[str, VoiceSpec],
+        default: VoiceSpec,
+        default_key: str,
+        agent_voices: Mapping[str, str],
+        voice_pools: Mapping[str, tuple[str, ...]],
+        default_rate: str,
+        voice_overrides: Mapping[str, tuple[str, str]],
+    ):
+        self._specs = MappingProxyType(dict(specs))
+        self.default = default
+        self.default_key = default_key
+        self._agent_voices = MappingProxyType(dict(agent_voices))
+        self._voice_pools = MappingProxyType(dict(voice_pools))
+        self._default_rate = default_rate
+        self._overrides = MappingProxyType(dict(voice_overrides))
+
+    @classmethod
+    def from_config(
+        cls,
+        tts_cfg: dict,
+        edge_voices: Mapping[str, str],
+    ) -> "VoiceRegistry":
+        voices = dict(tts_cfg.get("voices") or {})
+        agent_voices = dict(tts_cfg.get("agent_voices") or {})
+        voice_pools = {
+            k: tuple(v) for k, v in (tts_cfg.get("voice_pools") or {}).items() if v
+        }
+        voice_settings = tts_cfg.get("voice_settings") or {}
+        default_key = tts_cfg.get("default_voice", "de")
+        default_rate = edge_rate_for_speed(float(tts_cfg.get("speed", 1.0)))
+
+        invalid: set[str] = set()
+        piper_ok: dict[str, bool] = {}
+
+        def _piper_model(candidate: str) -> str | None:
+            if candidate in piper_ok:
+                return candidate if piper_ok[candidate] else None
+            looks_like_path = "/" in candidate or candidate.endswith(".onnx")
+            try:
+                p = Path(candidate).expanduser()
+                ok = p.is_file() and p.stat().st_size > _MIN_PIPER_MODEL_BYTES
+            except OSError:
+                ok = False
+            piper_ok[candidate] = ok
+            if not ok and looks_like_path:
+                invalid.add(candidate)
+            return candidate if ok else None
+
+        default_voice = edge_voices.get(default_key) or (
+            default_key if "Neural" in default_key else FALLBACK_EDGE_VOICE
+        )
+
+        def _resolve(key: str) -> tuple[str, str]:
+            """Edge name → built-in agent name → Piper model → default.
+
+            ``tts.voices`` entries are precompiled as keys but not followed
+            as mappings, as before the registry existed.
+            """
+            if not key:
+                return "edge", default_voice
+            if "Neural" in key:
+                return "edge", key
+            if key in edge_voices:
+                return "edge", edge_voices[key]
+            model = _piper_model(key)
+            if model:
+                return "piper", model
+            return "edge", default_voice
+
+        resolved: dict[str, tuple[str, str]] = {}
+        keys: list[str] = [default_key, ""]
+        keys += list(edge_voices)
+        keys += list(voices) + [v for v in voices.values() if isinstance(v, str)]
+        keys += list(agent_voices) + [v for v in agent_voices.values() if isinstance(v, str)]
+        keys += list(voice_settings)
+        for pool_key, members in voice_pools.items():
+            keys.append(pool_key)
+            keys += list(members)
+        for key in keys:
+            if key not in resolved:
+                resolved[key] = _resolve(key)
+
+        # Per-voice rate/pitch: first voice_settings entry resolving to a voice wins
+        overrides: dict[str, tuple[str, str]] = {}
+        for key, settings in voice_settings.items():
+            if not isinstance(settings, dict):
+                continue
+            name = resolved.setdefault(key, _resolve(key))[1]
+            if name not in overrides:
+                overrides[name] = (
+                    str(settings.get("rate", default_rate)),
+                    str(settings.get("pitch", "+0Hz")),
+                )
+
+        def _spec(backend: str, name: str) -> VoiceSpec:
+            rate, pitch = overrides.get(name, (default_rate, "+0Hz"))
+            return VoiceSpec(backend=backend, voice=name, rate=rate, pitch=pitch)
+
+        specs = {key: _spec(*target) for key, target in resolved.items()}
+
+        for path in sorted(invalid):
+            logger.warning("piper model not usable (missing or too small): %s", path)
+        logger.info(
+            "voice registry: %d keys, %d distinct voices",
+            len(specs),
+            len({s.voice for s in specs.values()}),
+        )
+
+        return cls(
+            specs=specs,
+            default=_spec("edge", default_voice),
+            default_key=default_key,
+            agent_voices=agent_voices,
+            voice_pools=voice_pools,
+            default_rate=default_rate,
+            voice_overrides=overrides,
+        )
+
+    def lookup(self, key: str) -> VoiceSpec:
+        """Resolve a voice key, agent key, pool member or raw voice name."""
+        spec = self._specs.get(key)
+        if spec is not None:
+            return spec
+        if "Neural" in key:
+            # Unlisted Edge voice: no filesystem access needed
+            rate, pitch = self._overrides.get(key, (self._default_rate, "+0Hz"))
+            return VoiceSpec(backend="edge", voice=key, rate=rate, pitch=pitch)
+        return self.default
+
+    def voice_key_for(self, source: str, session_id: str = "", language: str = "") -> str:
+        """Pick the voice key for a request (session pool → agent mapping → language)."""
+        pool = self._voice_pools.get(source)
+        if pool and session_id:
+            return pool[hash(session_id) % len(pool)]
+        return self._agent_voices.get(source) or language or self.default_key
+
+    def agent_sources(self) -> list[str]:
+        """Sources with an explicit agent → voice mapping."""
+        return list(self._agent_voices)
+
+    def voices_in_use(self) -> list[VoiceSpec]:
+        """Distinct resolved voices reachable from agent mappings and pools."""
+        seen: dict[str, VoiceSpec] = {self.default.cache_id: self.default}
+        for key in list(self._agent_voices.values()) + [
+            m for pool in self._voice_pools.values() for m in pool
+        ]:
+            spec = self.lookup(key)
+            seen.setdefault(spec.cache_id, spec)
+        return list(seen.values())
+
+    def __len__(self) -> int:
+        return len(self._specs)
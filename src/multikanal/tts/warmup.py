@@ -0,0 +1,149 @@
+"""Background cache warmer for fixed phrases (templates, common short replies).
+
+Runs at low priority with a CPU duty-cycle budget so it never competes
+with live narrations for the TTS backend.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+from .segments import SegmentedSynthesizer
+from .voices import VoiceRegistry
+
+logger = logging.getLogger("multikanal.tts.warmup")
+
+
+def warmup_phrases(
+    warm_cfg: dict, phrases_file: str = "", templates: dict[str, list[str]] | None = None
+) -> list[str]:
+    """Template narrations + configured phrases + optional phrases file.
+
+    ``templates`` are the live template provider's (built-ins merged with
+    its ``templates_file``); None means the built-ins.
+    """
+    phrases: list[str] = []
+    if warm_cfg.get("include_templates", True):
+        if templates is None:
+            from ..narration.template import TemplateNarrator
+
+            templates = TemplateNarrator().templates
+        # TemplateNarrator always speaks the first variant
+        phrases += [variants[0] for variants in templates.values() if variants]
+    phrases += [p for p in warm_cfg.get("phrases") or [] if isinstance(p, str)]
+    if phrases_file:
+        lines = Path(phrases_file).expanduser().read_text(encoding="utf-8").splitlines()
+        phrases += [ln.strip() for ln in lines if ln.strip() and not ln.startswith("#")]
+    # Dedupe, keep order
+    return list(dict.fromkeys(p.strip() for p in phrases if p.strip()))
+
+
+def warmup_voices(registry: VoiceRegistry, warm_cfg: dict) -> list[str]:
+    """Voice keys to warm: explicit list, or every voice used by an agent."""
+    explicit = warm_cfg.get("voices")
+    if explicit:
+        return list(explicit)
+    specs = registry.voices_in_use() if warm_cfg.get("include_pools", False) else [
+        registry.lookup(registry.voice_key_for(source))
+        for source in registry.agent_sources()
+    ] + [registry.default]
+    return list(dict.fromkeys(spec.voice for spec in specs))
+
+
+class CacheWarmer:
+    """Pre-synthesizes phrases for a set of voices into the segment cache."""
+
+    def __init__(
+        self,
+        segments: SegmentedSynthesizer,
+        cpu_budget: float = 0.25,
+        nice: int = 10,
+    ):
+        self._segments = segments
+        # Fraction of wall time the warmer may be busy (0 < budget <= 1),
+        # shared by all of its workers
+        self._budget = min(1.0, max(0.01, cpu_budget))
+        self._nice = nice
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def _lower_priority(self) -> None:
+        if not self._nice:
+            return
+        try:
+            # Linux niceness is per thread: this only affects the warmer
+            os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), self._nice)
+        except (AttributeError, OSError) as e:
+            logger.debug("could not lower warmer priority: %s", e)
+
+    def _warm_one(self, phrase: str, voice: str, budget: float) -> bool:
+        if self._stop.is_set():
+            return False
+        t0 = time.monotonic()
+        if not self._segments.warm([(phrase, voice)]):
+            return False
+        # Duty cycle: sleep so busy time stays within this worker's budget
+        busy = time.monotonic() - t0
+        self._stop.wait(busy * (1.0 / budget - 1.0))
+        return True
+
+    def run(
+        self, phrases: list[str], voices: list[str], progress=None, workers: int = 1
+    ) -> dict:
+        """Warm synchronously (optionally with parallel workers).
+
+        Returns counts and elapsed time. ``progress(done, total)`` is called
+        after every phrase/voice pair.
+        """
+        self._lower_priority()
+        t_start = time.monotonic()
+        pairs = [(phrase, voice) for voice in voices for phrase in phrases]
+        created = 0
+        if workers <= 1:
+            for done, (phrase, voice) in enumerate(pairs, 1):
+                if self._stop.is_set():
+                    break
+                created += self._warm_one(phrase, voice, self._budget)
+                if progress:
+                    progress(done, len(pairs))
+        else:
+            # N workers each at budget/N keep the total within the budget
+            budget = self._budget / workers
+            with ThreadPoolExecutor(
+                max_workers=workers,
+                thread_name_prefix="cache-warmer",
+                initializer=self._lower_priority,
+            ) as pool:
+                futures = [pool.submit(self._warm_one, p, v, budget) for p, v in pairs]
+                for done, fut in enumerate(as_completed(futures), 1):
+                    created += bool(fut.result())
+                    if progress:
+                        progress(done, len(pairs))
+        elapsed = round(time.monotonic() - t_start, 1)
+        skipped = len(pairs) - created
+        logger.info(
+            "cache warm-up: %d new, %d already cached/failed, %d voices, %.1fs",
+            created, skipped, len(voices), elapsed,
+        )
+        return {"created": created, "skipped": skipped, "voices": len(voices), "seconds": elapsed}
+
+    def start(self, phrases: list[str], voices: list[str]) -> None:
+        """Warm in a daemon thread."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self.run, args=(phrases, voices), name="cache-warmer", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=2)
+            self._thread = None
@@ -0,0 +1,101 @@
+"""AudioCache: content-named entries, compression and held paths."""
+
+import wave
+
+import pytest
+
+from multikanal.tts import cache as cache_mod
+from multikanal.tts.cache import AudioCache
+
+MP3 = b"ID3\x04" + b"\x00" * 64
+
+
+def _wav(path, frames=160):
+    with wave.open(str(path), "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(16000)
+        w.writeframes(b"\x00\x01" * frames)
+    return str(path)
+
+
+@pytest.fixture
+def opus_cache(tmp_path, monkeypatch):
+    """Cache with codec opus whose encoder only records what it was given."""
+    monkeypatch.setattr(cache_mod.pcm, "ffmpeg_path", lambda: "ffmpeg")
+    cache = AudioCache(str(tmp_path / "cache"), codec="opus")
+    encoded = []
+    monkeypatch.setattr(cache, "_encode", lambda src: encoded.append(src.name))
+    cache.encoded = encoded
+    yield cache
+    cache.close()
+
+
+def _drain(cache):
+    if cache._encoder:
+        cache._encoder.shutdown(wait=True)
+        cache._encoder = None
+
+
+def test_entries_are_named_after_their_content(tmp_path):
+    cache = AudioCache(str(tmp_path / "cache"))
+    src = tmp_path / "edge.wav"
+    src.write_bytes(MP3)
+    assert cache.put("hallo", "v", str(src)).endswith(".mp3")
+    assert cache.put("welt", "v", _wav(tmp_path / "a.wav")).endswith(".wav")
+    cache.close()
+
+
+def test_compress_reencodes_pcm_wav(opus_cache, tmp_path):
+    path = opus_cache.put("hallo", "v", _wav(tmp_path / "a.wav"))
+    opus_cache.compress(path)
+    _drain(opus_cache)
+    assert opus_cache.encoded == [path.rsplit("/", 1)[1]]
+
+
+def test_compress_skips_mp3_content(opus_cache, tmp_path):
+    src = tmp_path / "edge.wav"
+    src.write_bytes(MP3)
+    path = opus_cache.put("hallo", "v", str(src))
+    # Older versions stored Edge MP3 under .wav
+    legacy = opus_cache._dir / ("0" * 64 + ".wav")
+    legacy.write_bytes(MP3)
+    opus_cache.compress(path)
+    opus_cache.compress(str(legacy))
+    _drain(opus_cache)
+    assert opus_cache.encoded == []
+
+
+def test_compress_waits_for_the_last_release(opus_cache, tmp_path):
+    path = opus_cache.put("hallo", "v", _wav(tmp_path / "a.wav"))
+    assert opus_cache.acquire(path)
+    opus_cache.compress(path)
+    _drain(opus_cache)
+    assert opus_cache.encoded == []
+    opus_cache.release(path)
+    _drain(opus_cache)
+    assert len(opus_cache.encoded) == 1
+
+
+def test_eviction_skips_held_entries(tmp_path):
+    cache = AudioCache(str(tmp_path / "cache"), max_entries=3)
+    paths = [cache.put(f"t{i}", "v", _wav(tmp_path / f"{i}.wav")) for i in range(3)]
+    assert cache.acquire(paths[0])  # oldest, but queued for playback
+    cache.put("t3", "v", _wav(tmp_path / "3.wav"))
+    assert cache.contains("t0", "v")
+    assert not cache.contains("t1", "v")
+    cache.release(paths[0])
+    cache.close()
+
+
+def test_prune_defers_held_entries_until_release(tmp_path):
+    cache = AudioCache(str(tmp_path / "cache"))
+    held = cache.put("held", "v", _wav(tmp_path / "a.wav"))
+    cache.put("free", "v", _wav(tmp_path / "b.wav"))
+    cache.acquire(held)
+    result = cache.prune(max_bytes=0)
+    assert (result["removed"], result["deferred"]) == (1, 1)
+    assert cache.contains("held", "v") and not cache.contains("free", "v")
+    cache.release(held)
+    assert not cache.contains("held", "v")
+    cache.close()
@@ -0,0 +1,130 @@
+"""Batched narration: reply parsing and which waiting jobs share a batch."""
+
+import asyncio
+import json
+
+import pytest
+
+from multikanal.narration.batch import BatchJob, NarrationBatcher, batch_prompt, parse_batch
+
+
+@pytest.mark.parametrize(
+    "reply, expected",
+    [
+        ('["Eins.", "Zwei."]', ["Eins.", "Zwei."]),
+        ('Hier die Liste:\n["Eins.", " Zwei. "]\nFertig.', ["Eins.", "Zwei."]),
+        ('```json\n["a", "b"]\n```', ["a", "b"]),
+        # Wrapped in an object: the array inside still counts
+        ('{"items": ["a", "b"]}', ["a", "b"]),
+    ],
+)
+def test_parse_batch_extracts_the_array(reply, expected):
+    assert parse_batch(reply, 2) == expected
+
+
+@pytest.mark.parametrize(
+    "reply",
+    [
+        "",
+        None,
+        "keine Liste",
+        '["nur eins"]',
+        '["a", "b", "c"]',
+        '["a", ""]',
+        '["a", 2]',
+        '["a", "b"',
+    ],
+)
+def test_parse_batch_rejects_malformed_replies(reply):
+    assert parse_batch(reply, 2) is None
+
+
+def test_batch_prompt_numbers_every_item():
+    prompt = batch_prompt(["erste Ausgabe", "zweite Ausgabe"], max_words=40)
+    assert "### 1\nerste Ausgabe" in prompt
+    assert "### 2\nzweite Ausgabe" in prompt
+    assert "genau 2 Strings" in prompt
+
+
+class StubProvider:
+    name = "stub"
+
+    def __init__(self):
+        self.batches = []
+
+    async def agenerate_batch(self, texts, system_prompt=""):
+        self.batches.append(list(texts))
+        return parse_batch(json.dumps([f"N:{t}" for t in texts]), len(texts))
+
+
+class StubGenerator:
+    complexity = None
+
+    def __init__(self):
+        self.provider = StubProvider()
+        self.single = []
+        self.last_result = {}
+
+    def route(self, text, session_id="", source=""):
+        return None
+
+    def batch_provider(self, source="", route=None):
+        return self.provider
+
+    def record(self, provider, latency_ms, ok):
+        pass
+
+    async def agenerate(self, text, *args, **kwargs):
+        self.single.append(text)
+        return f"single:{text}"
+
+
+def _narrate_first(batcher, jobs):
+    return asyncio.run(batcher.narrate(jobs[0]))
+
+
+def test_waiting_jobs_are_narrated_in_one_call():
+    generator = StubGenerator()
+    batcher = NarrationBatcher(generator, min_batch=3, max_items=5)
+    jobs = [batcher.register(BatchJob(f"t{i}", "p", cache_key=f"k{i}")) for i in range(4)]
+
+    assert _narrate_first(batcher, jobs) == "N:t0"
+    assert generator.provider.batches == [["t0", "t1", "t2", "t3"]]
+    assert [j.result for j in jobs[1:]] == [(f"N:t{i}", "stub") for i in range(1, 4)]
+
+
+def test_incompatible_jobs_are_not_batched():
+    generator = StubGenerator()
+    batcher = NarrationBatcher(generator, min_batch=2)
+    jobs = [
+        batcher.register(BatchJob("t0", "p", language="de")),
+        batcher.register(BatchJob("t1", "p", language="en")),
+        batcher.register(BatchJob("t2", "anderer prompt", language="de")),
+    ]
+
+    assert _narrate_first(batcher, jobs) == "single:t0"
+    assert generator.provider.batches == []
+
+
+def test_cached_and_repeated_peers_stay_out_of_a_batch():
+    generator = StubGenerator()
+    batcher = NarrationBatcher(
+        generator, min_batch=2, cached=lambda job: job.cache_key == "hit"
+    )
+    jobs = [
+        batcher.register(BatchJob(text, "p", cache_key=key))
+        for text, key in [("t0", "a"), ("t1", "hit"), ("t2", "a"), ("t3", "b"), ("t4", "b")]
+    ]
+
+    _narrate_first(batcher, jobs)
+    assert generator.provider.batches == [["t0", "t3"]]
+    assert jobs[1].result is None and jobs[2].result is None and jobs[4].result is None
+
+
+def test_too_few_uncached_peers_fall_back_to_a_single_call():
+    generator = StubGenerator()
+    batcher = NarrationBatcher(generator, min_batch=3, cached=lambda job: job.text != "t0")
+    jobs = [batcher.register(BatchJob(f"t{i}", "p")) for i in range(4)]
+
+    assert _narrate_first(batcher, jobs) == "single:t0"
+    assert generator.provider.batches == []
@@ -0,0 +1,90 @@
+"""Canonical cache keys: volatile tokens masked, meaningful ones kept."""
+
+import pytest
+
+from multikanal.narration.canonical import (
+    DEFAULT_RULES,
+    CanonicalKeyer,
+    Canonicalizer,
+)
+
+
+@pytest.fixture
+def canon():
+    return Canonicalizer.from_spec(DEFAULT_RULES)
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("started 2024-05-01T12:30:05.123Z", "started <ts>"),
+        ("at 12:30:05", "at <time>"),
+        ("run 123e4567-e89b-12d3-a456-426614174000 done", "run <uuid> done"),
+        ("HEAD is now at 3f2a9c1 fix", "HEAD is now at <hex> fix"),
+        ("12 passed in 0.42s", "12 passed in <dur>"),
+        ("Build took 1500 ms", "Build took <dur>"),
+        ("worker pid=48213 exited", "worker pid <pid> exited"),
+        ("wrote /tmp/pytest-of-me/pytest-12/out.txt", "wrote <tmp>"),
+        ("saved tmpa1b2c3d4.json", "saved <tmp>"),
+    ],
+)
+def test_volatile_tokens_are_masked(canon, text, expected):
+    assert canon.canonical(text) == expected
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("Listening on http://127.0.0.1:8000", "Listening on http://127.0.0.1:<port>"),
+        ("server at localhost:3000 ready", "server at localhost:<port> ready"),
+        ("GET https://example.com:8443/api", "GET https://example.com:<port>/api"),
+        ("bound to [::1]:5432", "bound to [::1]:<port>"),
+        ("ssh git@github.com:22 refused", "ssh git@github.com:<port> refused"),
+    ],
+)
+def test_ports_after_a_host_are_masked(canon, text, expected):
+    assert canon.canonical(text) == expected
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "src/app.py:1234: AssertionError",
+        "main.rs:10452:7: error[E0308]",
+        "File \"x.py\", line 1234",
+    ],
+)
+def test_line_numbers_are_not_mistaken_for_ports(canon, text):
+    assert canon.canonical(text) == text
+
+
+def test_different_line_numbers_keep_different_keys(canon):
+    assert canon.canonical("app.py:1234: error") != canon.canonical("app.py:1240: error")
+
+
+def test_counts_are_kept_by_default(canon):
+    assert canon.canonical("3 failed, 5 passed") == "3 failed, 5 passed"
+
+
+def test_number_rule_buckets_by_digit_count():
+    canon = Canonicalizer.from_spec(["number"])
+    assert canon.canonical("0 errors, 1 warning, 7 failed, 42 passed") == (
+        "0 errors, 1 warning, <num1> failed, <num2> passed"
+    )
+
+
+def test_custom_rules_and_unknown_names():
+    canon = Canonicalizer.from_spec(
+        ["nonexistent"],
+        [{"name": "job", "pattern": r"job #\d+", "replace": "job <id>"}, {"pattern": "("}],
+    )
+    assert [r.name for r in canon.rules] == ["job"]
+    assert canon.canonical("job #81 queued") == "job <id> queued"
+
+
+def test_per_source_rules():
+    keyer = CanonicalKeyer.from_config(
+        {"sources": {"raw": {"rules": ["uuid"]}}}
+    )
+    assert keyer.canonical("took 3s", "raw") == "took 3s"
+    assert keyer.canonical("took 3s", "claude") == "took <dur>"
@@ -0,0 +1,110 @@
+"""ComplexityRouter: feature scoring and tier selection."""
+
+import pytest
+
+from multikanal.narration.complexity import ComplexityRouter, Route
+
+ALL = ("template", "extractive", "ollama", "minimax")
+
+
+class KeyMatcher:
+    """Stands in for the template provider: matches when ``key`` occurs."""
+
+    def __init__(self, key: str):
+        self.key = key
+
+    def match(self, text: str):
+        return self.key if self.key in text else None
+
+
+def test_disabled_router_does_not_route():
+    assert ComplexityRouter(enabled=False).route("git status", available=ALL) is None
+
+
+def test_no_eligible_tier_gives_empty_route():
+    route = ComplexityRouter().route("git status", available=("claude",))
+    assert isinstance(route, Route)
+    assert route.tier == ""
+
+
+def test_template_match_routes_to_template_tier():
+    router = ComplexityRouter(matcher=KeyMatcher("git status"))
+    route = router.route("git status", available=ALL)
+    assert route.tier == "template"
+    assert route.features["template"] == 1.0
+
+
+def test_template_tier_needs_a_matching_template():
+    router = ComplexityRouter(matcher=KeyMatcher("git status"))
+    # Repeated short input scores low, but no template covers it
+    for _ in range(3):
+        route = router.route("ok ok ok", session_id="s", available=ALL)
+    assert route.score <= 0.2
+    assert route.tier == "extractive"
+
+
+def test_long_error_heavy_input_goes_to_the_most_capable_tier():
+    router = ComplexityRouter()
+    text = " ".join(
+        f"Traceback error failed exception step{i} kaputt{i} fehler" for i in range(40)
+    )
+    route = router.route(text, available=ALL)
+    assert route.features["length"] == 1.0
+    assert route.features["errors"] == 1.0
+    assert route.tier == "minimax"
+
+
+def test_score_above_every_threshold_falls_to_the_last_eligible_tier():
+    router = ComplexityRouter(tiers=[{"name": "extractive", "max_score": 0.1}])
+    route = router.route("Traceback: build failed with a fatal error", available=ALL)
+    assert route.score > 0.1
+    assert route.tier == "extractive"
+
+
+def test_unavailable_tiers_are_skipped():
+    router = ComplexityRouter()
+    route = router.route("Traceback: build failed with a fatal error", available=("minimax",))
+    assert route.tier == "minimax"
+
+
+def test_repeated_input_loses_novelty_within_a_session():
+    router = ComplexityRouter()
+    text = "compiling crate serde tokio hyper finished building"
+    first = router.route(text, session_id="a", available=ALL)
+    second = router.route(text, session_id="a", available=ALL)
+    other = router.route(text, session_id="b", available=ALL)
+    assert first.features["novelty"] == 1.0
+    assert second.features["novelty"] == 0.0
+    assert other.features["novelty"] == 1.0
+    assert second.score < first.score
+
+
+def test_session_history_is_bounded():
+    router = ComplexityRouter(history_inputs=1)
+    router.route("alpha beta gamma", session_id="s", available=ALL)
+    router.route("delta epsilon zeta", session_id="s", available=ALL)
+    route = router.route("alpha beta gamma", session_id="s", available=ALL)
+    assert route.features["novelty"] == 1.0
+
+
+@pytest.mark.parametrize(
+    "features, expected",
+    [
+        ({"length": 0.0, "errors": 0.0, "novelty": 0.0, "template": 1.0}, 0.0),
+        ({"length": 1.0, "errors": 1.0, "novelty": 1.0, "template": 0.0}, 1.0),
+        ({"length": 1.0, "errors": 0.0, "novelty": 0.0, "template": 0.0}, 0.35),
+    ],
+)
+def test_score_is_clamped_weighted_sum(features, expected):
+    assert ComplexityRouter().score(features) == expected
+
+
+def test_record_and_snapshot():
+    router = ComplexityRouter(matcher=KeyMatcher("git status"))
+    route = router.route("git status", available=ALL)
+    router.record(route, 5, "template")
+    router.record(Route("unknown", 0.0), 5, "template")
+    tiers = router.snapshot()["tiers"]
+    assert tiers["template"]["routed"] == 1
+    assert tiers["template"]["served_by_tier"] == 1
+    assert tiers["template"]["share"] == 1.0
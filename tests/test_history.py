@@ -0,0 +1,116 @@
+"""HistoryStore: LRU front, deadline-heap expiry and SQLite restore."""
+
+from dataclasses import dataclass, field
+
+import pytest
+
+from multikanal.narration import history
+from multikanal.narration.history import HistoryStore
+
+
+@dataclass
+class Session:
+    turns: list[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        return {"turns": self.turns}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Session":
+        return cls(list(data["turns"]))
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(history, "time", fake)
+    return fake
+
+
+def test_evicts_least_recently_used(clock):
+    store = HistoryStore(Session.from_dict, max_resident=2)
+    store.put("a", Session(["a"]))
+    store.put("b", Session(["b"]))
+    assert store.get("a") is not None  # "b" is now least recently used
+    store.put("c", Session(["c"]))
+    assert len(store) == 2
+    assert store.get("b") is None
+    assert store.get("a").turns == ["a"]
+    assert store.evictions == 1
+
+
+def test_purge_expires_sessions_past_their_deadline(clock):
+    store = HistoryStore(Session.from_dict, ttl_seconds=60)
+    store.put("old", Session())
+    clock.now += 30
+    store.put("new", Session())
+    clock.now += 40
+    assert store.purge() == 1
+    assert store.get("old") is None
+    assert store.get("new") is not None
+    assert store.expired == 1
+
+
+def test_touch_extends_the_deadline(clock):
+    store = HistoryStore(Session.from_dict, ttl_seconds=60)
+    store.put("s", Session())
+    clock.now += 50
+    store.touch("s")
+    clock.now += 50
+    assert store.purge() == 0
+    clock.now += 20
+    assert store.purge() == 1
+
+
+def test_evicted_session_is_restored_from_sqlite(clock, tmp_path):
+    store = HistoryStore(Session.from_dict, db_path=str(tmp_path / "h.sqlite"), max_resident=1)
+    store.put("a", Session(["eins", "zwei"]))
+    store.put("b", Session(["drei"]))
+    assert "a" not in dict(store.items())
+    restored = store.get("a")
+    assert restored == Session(["eins", "zwei"])
+    assert store.restores == 1
+    store.close()
+
+
+def test_restart_keeps_history(clock, tmp_path):
+    db = str(tmp_path / "h.sqlite")
+    store = HistoryStore(Session.from_dict, db_path=db)
+    store.put("s", Session(["vorher"]))
+    store.close()
+
+    reopened = HistoryStore(Session.from_dict, db_path=db)
+    assert reopened.get("s") == Session(["vorher"])
+    reopened.close()
+
+
+def test_expired_sessions_are_not_restored(clock, tmp_path):
+    db = str(tmp_path / "h.sqlite")
+    store = HistoryStore(Session.from_dict, db_path=db, ttl_seconds=60)
+    store.put("s", Session(["alt"]))
+    store.close()
+
+    clock.now += 61
+    reopened = HistoryStore(Session.from_dict, db_path=db, ttl_seconds=60)
+    assert reopened.get("s") is None
+    reopened.close()
+
+
+def test_unreadable_row_is_dropped(clock, tmp_path):
+    def decode(data: dict) -> Session:
+        raise TypeError("bad shape")
+
+    store = HistoryStore(decode, db_path=str(tmp_path / "h.sqlite"), max_resident=1)
+    store.put("a", Session(["x"]))
+    store.put("b", Session(["y"]))
+    assert store.get("a") is None
+    assert store.stats()["stored_sessions"] == 1
+    store.close()
@@ -0,0 +1,61 @@
+"""AudioPlayer: tempo for players without an atempo option."""
+
+import os
+
+import pytest
+
+from multikanal.tts import playback
+from multikanal.tts.pcm import PcmClip
+from multikanal.tts.playback import AudioPlayer
+
+
+class _Process:
+    returncode = 0
+
+    def wait(self):
+        pass
+
+
+@pytest.fixture
+def paplay_only(monkeypatch):
+    """Only paplay is installed; Popen records the command lines it gets."""
+    monkeypatch.setattr(playback, "which", lambda tool: tool == "paplay")
+    calls = []
+
+    def popen(cmd, **kwargs):
+        calls.append((cmd, os.path.exists(cmd[-1])))
+        return _Process()
+
+    monkeypatch.setattr(playback.subprocess, "Popen", popen)
+    return calls
+
+
+def test_paplay_plays_stretched_copy(paplay_only, monkeypatch, tmp_path):
+    clip = PcmClip(frames=b"\x00\x01" * 160, rate=24000, channels=1)
+    monkeypatch.setattr(playback.pcm, "ffmpeg_path", lambda: "ffmpeg")
+    monkeypatch.setattr(playback.pcm, "load", lambda path: clip)
+    monkeypatch.setattr(
+        playback.pcm, "stretch", lambda c, tempo: PcmClip(c.frames[::2], c.rate, c.channels)
+    )
+    player = AudioPlayer()
+    assert player.effective_tempo(1.5) == 1.5
+    assert player.play(str(tmp_path / "a.wav"), tempo=1.5)
+    (cmd, existed), = paplay_only
+    assert cmd[-1] != str(tmp_path / "a.wav") and existed
+    assert not os.path.exists(cmd[-1])
+
+
+def test_paplay_without_ffmpeg_reports_normal_rate(paplay_only, monkeypatch, tmp_path):
+    monkeypatch.setattr(playback.pcm, "ffmpeg_path", lambda: None)
+    monkeypatch.setattr(playback.pcm, "load", lambda path: None)
+    player = AudioPlayer()
+    assert player.effective_tempo(1.5) == 1.0
+    assert player.effective_tempo(1.0) == 1.0
+    assert player.play(str(tmp_path / "a.wav"), tempo=1.5)
+    assert paplay_only[0][0][-1] == str(tmp_path / "a.wav")
+
+
+def test_ffplay_keeps_tempo_without_ffmpeg(monkeypatch):
+    monkeypatch.setattr(playback, "which", lambda tool: tool == "ffplay")
+    monkeypatch.setattr(playback.pcm, "ffmpeg_path", lambda: None)
+    assert AudioPlayer().effective_tempo(1.5) == 1.5
@@ -0,0 +1,68 @@
+"""Semantic cache: context partitioning, threshold and the matrix cap."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from multikanal.narration.semantic import HashingEmbedder, SemanticCache  # noqa: E402
+
+
+@pytest.fixture
+def cache():
+    return SemanticCache(HashingEmbedder(dim=64), threshold=0.9, capacity=8)
+
+
+def test_identical_input_hits_within_its_context(cache):
+    vec = cache.embed("FAILED tests/test_api.py::test_login - AssertionError")
+    cache.add(vec, "ctx", "Der Login-Test schlägt fehl.")
+    assert cache.lookup(vec, "ctx")[0] == "Der Login-Test schlägt fehl."
+    assert cache.lookup(vec, "other") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_dissimilar_input_misses(cache):
+    cache.add(cache.embed("cargo build finished"), "ctx", "Build fertig.")
+    assert cache.lookup(cache.embed("npm install failed with EACCES"), "ctx") is None
+
+
+def test_probe_does_not_count(cache):
+    vec = cache.embed("git push rejected")
+    cache.add(vec, "ctx", "Push abgelehnt.")
+    assert cache.lookup(vec, "ctx", count=False) is not None
+    assert (cache.hits, cache.misses) == (0, 0)
+
+
+def test_ring_buffer_overwrites_oldest(cache):
+    texts = [f"schritt {i} alpha beta" for i in range(10)]
+    for i, text in enumerate(texts):
+        cache.add(cache.embed(text), "ctx", f"n{i}")
+    assert cache.stats()["entries"] == 8
+    assert cache.lookup(cache.embed(texts[-1]), "ctx")[0] == "n9"
+
+
+def test_eviction_keeps_other_contexts_intact():
+    cache = SemanticCache(HashingEmbedder(dim=64), threshold=0.9, capacity=3)
+    vecs = [cache.embed(f"ausgabe {w} fertig") for w in ("eins", "zwei", "drei", "vier")]
+    cache.add(vecs[0], "a", "n0")
+    cache.add(vecs[1], "b", "n1")
+    cache.add(vecs[2], "a", "n2")
+    cache.add(vecs[3], "b", "n3")  # drops n0, the oldest overall
+    assert cache.lookup(vecs[0], "a") is None
+    assert cache.lookup(vecs[2], "a")[0] == "n2"
+    assert cache.lookup(vecs[1], "b")[0] == "n1"
+    assert cache.lookup(vecs[3], "b")[0] == "n3"
+
+
+def test_large_context_finds_near_duplicates():
+    dim, rows = 64, 6000
+    rng = np.random.default_rng(1)
+    matrix = rng.standard_normal((rows, dim)).astype(np.float32)
+    matrix /= np.linalg.norm(matrix, axis=1, keepdims=True)
+    cache = SemanticCache(HashingEmbedder(dim=dim), threshold=0.9, capacity=rows)
+    for i, vec in enumerate(matrix):
+        cache.add(vec, "ctx", f"n{i}")
+    for i in (0, 2999, rows - 1):
+        noise = rng.standard_normal(dim).astype(np.float32)
+        query = matrix[i] + 0.2 * noise / np.linalg.norm(noise)
+        query /= np.linalg.norm(query)
+        assert cache.lookup(query, "ctx")[0] == f"n{i}"
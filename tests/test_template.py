@@ -0,0 +1,73 @@
+"""Template key matching: one compiled scan, most specific key wins."""
+
+import pytest
+
+from multikanal.narration.template import TemplateNarrator, compile_keys
+
+
+@pytest.fixture
+def narrator():
+    n = TemplateNarrator()
+    yield n
+    n.close()
+
+
+@pytest.mark.parametrize(
+    "text, key",
+    [
+        ("$ git commit -m 'fix parser'", "git commit"),
+        ("git status\nOn branch main", "git status"),
+        ("$ git log --oneline", "git"),
+        ("docker-compose up -d", "docker-compose"),
+        ("docker run --rm alpine", "docker"),
+        # The more specific key wins wherever it appears
+        ("git fetch && git commit -am wip", "git commit"),
+    ],
+)
+def test_most_specific_key_wins(narrator, text, key):
+    assert narrator.match(text) == key
+
+
+def test_keys_match_whole_words_only(narrator):
+    assert narrator.match("legit output without commands") is None
+    assert narrator.match("GIT COMMIT done") == "git commit"
+
+
+def test_key_spaces_match_any_whitespace():
+    pattern = compile_keys(["git commit"])
+    assert pattern.search("git   commit")
+    assert pattern.search("git\tcommits")
+    assert not pattern.search("gitcommit")
+
+
+def test_generate_uses_the_matched_template(narrator):
+    assert narrator.generate("docker-compose up") == narrator.templates["docker-compose"][0]
+
+
+def test_generate_without_match_or_fallback_is_empty():
+    n = TemplateNarrator(fallback=False)
+    assert n.generate("nothing to see here") == ""
+
+
+def test_templates_file_is_merged_over_builtins(tmp_path):
+    path = tmp_path / "templates.yaml"
+    path.write_text(
+        "templates:\n"
+        "  git commit: Eigener Commit-Text.\n"
+        "  make test:\n"
+        "    - Die Tests laufen.\n",
+        encoding="utf-8",
+    )
+    n = TemplateNarrator(templates_file=str(path))
+    try:
+        assert n.generate("git commit -m x") == "Eigener Commit-Text."
+        assert n.match("make   test") == "make test"
+        assert n.match("docker ps") == "docker"
+    finally:
+        n.close()
+
+
+def test_invalid_templates_file_keeps_previous_set(narrator):
+    before = dict(narrator.templates)
+    narrator._load_templates("templates: [unclosed")
+    assert narrator.templates == before
@@ -0,0 +1,59 @@
+"""VoiceRegistry resolution matches the pre-registry PiperTTS.resolve_voice."""
+
+from pathlib import Path
+
+import pytest
+import yaml
+
+from multikanal.tts.piper import PiperTTS
+from multikanal.tts.voices import VoiceRegistry, edge_rate_for_speed
+
+CONFIG = Path(__file__).resolve().parent.parent / "config" / "default.yaml"
+
+
+@pytest.fixture(scope="module")
+def registry():
+    tts_cfg = yaml.safe_load(CONFIG.read_text(encoding="utf-8"))["tts"]
+    return VoiceRegistry.from_config(tts_cfg, PiperTTS.EDGE_VOICES)
+
+
+@pytest.mark.parametrize(
+    "key, voice",
+    [
+        ("", "de-DE-FlorianMultilingualNeural"),
+        ("de", "de-DE-FlorianMultilingualNeural"),
+        ("en", "en-US-AriaNeural"),
+        ("en_male", "en-US-GuyNeural"),
+        ("codex", "de-DE-SeraphinaMultilingualNeural"),
+        ("opencode_sse", "de-DE-FlorianMultilingualNeural"),
+        ("gemini", "de-DE-KillianNeural"),
+        # tts.voices entries are not followed: unknown agent keys use the default
+        ("de_alt1", "de-DE-FlorianMultilingualNeural"),
+        ("en_alt", "de-DE-FlorianMultilingualNeural"),
+        ("de-DE-KatjaNeural", "de-DE-KatjaNeural"),
+        ("no-such-voice", "de-DE-FlorianMultilingualNeural"),
+    ],
+)
+def test_key_to_voice(registry, key, voice):
+    spec = registry.lookup(key)
+    assert (spec.backend, spec.voice) == ("edge", voice)
+
+
+def test_missing_piper_model_falls_back_to_default(registry):
+    assert registry.lookup("/nonexistent/model.onnx").voice == "de-DE-FlorianMultilingualNeural"
+
+
+def test_piper_model_path_resolves_to_piper(tmp_path):
+    model = tmp_path / "de.onnx"
+    model.write_bytes(b"\0" * 20000)
+    registry = VoiceRegistry.from_config({"agent_voices": {"x": str(model)}}, PiperTTS.EDGE_VOICES)
+    assert registry.lookup(str(model)).backend == "piper"
+
+
+def test_voice_settings_override_rate_and_pitch():
+    registry = VoiceRegistry.from_config(
+        {"speed": 1.1, "voice_settings": {"gemini": {"rate": "-10%", "pitch": "+2Hz"}}},
+        PiperTTS.EDGE_VOICES,
+    )
+    assert registry.lookup("gemini").cache_id == "de-DE-KillianNeural|-10%|+2Hz"
+    assert registry.lookup("codex").rate == edge_rate_for_speed(1.1) == "+10%"
@@ -67,6 +67,30 @@ DEFAULT_PITCH = "+0Hz"
 app = FastAPI(title="Edge TTS OpenAI-Compatible Server", version="1.0.0")
 
 
+def open_shared_cache():
+    """The MultiKanal audio cache, if the package is importable (else None).
+
+    Same directory and keys (text + voice|rate|pitch) as the daemon and
+    ai-speak, so a phrase synthesized by any of them is reused here.
+    """
+    try:
+        from multikanal.config import load_config
+        from multikanal.tts.cache import AudioCache
+    except ImportError:
+        logger.info("multikanal not installed, running without audio cache")
+        return None
+    # Hits are read as stored (and turned into MP3 below), never decoded to WAV
+    cache_cfg = {**load_config().get("cache", {}), "decode_on_hit": False}
+    try:
+        return AudioCache.from_config(cache_cfg, rescan=False)
+    except Exception as exc:
+        logger.warning("audio cache unavailable: %s", exc)
+        return None
+
+
+_cache = None
+
+
 class SpeechRequest(BaseModel):
     model: str = "tts-1"
     input: str
@@ -90,6 +114,38 @@ def speed_to_rate(speed: float) -> str:
     return f"{sign}{pct}%"
 
 
+# Leading bytes of MP3 data (ID3 tag or MPEG audio frame sync), as in tts/cache.py
+_MP3_MAGIC = (b"ID3", b"\xff\xf3", b"\xff\xfb", b"\xff\xf2")
+
+
+def cache_get(text: str, voice: str, rate: str, pitch: str) -> bytes | None:
+    if _cache is None:
+        return None
+    path = _cache.get(text, f"{voice}|{rate}|{pitch}")
+    if not path:
+        return None
+    try:
+        data = Path(path).read_bytes()
+    except OSError:
+        return None
+    # Entries the daemon wrote or compressed may be WAV, Opus or FLAC
+    if not data.startswith(_MP3_MAGIC):
+        return to_mp3(data)
+    return data
+
+
+def cache_put(text: str, voice: str, rate: str, pitch: str, mp3_bytes: bytes) -> None:
+    if _cache is None:
+        return
+    with tempfile.NamedTemporaryFile(suffix=".mp3") as tmp:
+        tmp.write(mp3_bytes)
+        tmp.flush()
+        try:
+            _cache.put(text, f"{voice}|{rate}|{pitch}", tmp.name)
+        except OSError as exc:
+            logger.warning("cache write failed: %s", exc)
+
+
 async def synthesize(text: str, voice: str, rate: str, pitch: str) -> bytes:
     """Synthesize text to MP3 bytes using edge-tts."""
     communicate = edge_tts.Communicate(text, voice, rate=rate, pitch=pitch)
@@ -141,6 +197,25 @@ def convert_format(mp3_bytes: bytes, target_format: str) -> tuple[bytes, str]:
         return mp3_bytes, "audio/mpeg"
 
 
+def to_mp3(audio: bytes) -> bytes | None:
+    """Transcode any ffmpeg-readable audio to MP3 (None if that fails)."""
+    cmd = [
+        "ffmpeg", "-y", "-hide_banner", "-loglevel", "error",
+        "-i", "pipe:0",
+        "-f", "mp3", "-ar", "24000", "-ac", "1", "-b:a", "48k",
+        "pipe:1",
+    ]
+    try:
+        result = subprocess.run(cmd, input=audio, capture_output=True, timeout=15)
+    except Exception as exc:
+        logger.warning("ffmpeg error: %s", exc)
+        return None
+    if result.returncode != 0 or not result.stdout:
+        logger.warning("ffmpeg mp3 transcode failed: %s", result.stderr.decode())
+        return None
+    return result.stdout
+
+
 @app.post("/v1/audio/speech")
 async def speech(req: SpeechRequest):
     """OpenAI-compatible TTS endpoint."""
@@ -155,11 +230,14 @@ async def speech(req: SpeechRequest):
         req.voice, voice, req.response_format, req.speed, len(req.input),
     )
 
-    try:
-        mp3_bytes = await synthesize(req.input, voice, rate, DEFAULT_PITCH)
-    except Exception as exc:
-        logger.error("Edge TTS synthesis failed: %s", exc)
-        raise HTTPException(status_code=500, detail=f"Edge TTS error: {exc}")
+    mp3_bytes = await asyncio.to_thread(cache_get, req.input, voice, rate, DEFAULT_PITCH)
+    if mp3_bytes is None:
+        try:
+            mp3_bytes = await synthesize(req.input, voice, rate, DEFAULT_PITCH)
+        except Exception as exc:
+            logger.error("Edge TTS synthesis failed: %s", exc)
+            raise HTTPException(status_code=500, detail=f"Edge TTS error: {exc}")
+        await asyncio.to_thread(cache_put, req.input, voice, rate, DEFAULT_PITCH, mp3_bytes)
 
     data, content_type = convert_format(mp3_bytes, req.response_format)
 
@@ -205,6 +283,9 @@ def main():
     parser.add_argument("--host", default="127.0.0.1")
     parser.add_argument("--port", type=int, default=5050)
     parser.add_argument("--log-level", default="info")
+    parser.add_argument(
+        "--no-cache", action="store_true", help="Do not use the shared MultiKanal audio cache"
+    )
     args = parser.parse_args()
 
     logging.basicConfig(
@@ -212,6 +293,10 @@ def main():
         format="%(asctime)s %(name)s %(levelname)s %(message)s",
     )
 
+    global _cache
+    if not args.no_cache:
+        _cache = open_shared_cache()
+
     uvicorn.run(app, host=args.host, port=args.port, log_level=args.log_level)
 
 